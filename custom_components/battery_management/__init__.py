@@ -7,7 +7,6 @@ from homeassistant.const import Platform
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "battery_management"
 PLATFORMS = [Platform.SENSOR, Platform.SWITCH]
 
 
@@ -15,24 +14,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up GROWATT Battery Discharge Guard from a config entry."""
     _LOGGER.info("Setting up GROWATT Battery Discharge Guard integration")
 
-    # Store the config entry data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
-
     # Forward the setup to the sensor and switch platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Entities cache their configuration, so reload them when options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry after its options were updated."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading GROWATT Battery Discharge Guard integration")
 
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -5,26 +5,166 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from homeassistant.const import CONF_NAME
+
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_LOW_BATTERY_THRESHOLD,
+    DEFAULT_PV_MAX_POWER,
+    DEFAULT_BATTERY_CAPACITY,
+    DEFAULT_MIN_DISCHARGE_PERCENTAGE,
+    DEFAULT_PANEL_TILT_ANGLE,
+    DEFAULT_PANEL_ORIENTATION,
+    DEFAULT_AVG_DAYTIME_LOAD,
+    DEFAULT_AVG_NIGHTTIME_LOAD,
+    CONF_UPDATE_INTERVAL,
+    CONF_LOW_BATTERY_THRESHOLD,
+    CONF_GROWATT_USERNAME,
+    CONF_GROWATT_PASSWORD,
+    CONF_PV_MAX_POWER,
+    CONF_BATTERY_CAPACITY,
+    CONF_MIN_DISCHARGE_PERCENTAGE,
+    CONF_PANEL_TILT_ANGLE,
+    CONF_PANEL_ORIENTATION,
+    CONF_AVG_DAYTIME_LOAD,
+    CONF_AVG_NIGHTTIME_LOAD,
+    MIN_UPDATE_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Form fields with their types and defaults only. Home Assistant checks the
+# submitted data against the form schema before the step runs, so the range
+# checks live in VALIDATION_SCHEMA, where failures become per-field errors.
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required("name", default="GROWATT Battery Discharge Guard"): str,
-        vol.Required("growatt_username"): str,
-        vol.Required("growatt_password"): str,
-        vol.Optional("pv_max_power", default=10.0): vol.Coerce(float),
-        vol.Optional("battery_capacity", default=10.0): vol.Coerce(float),
-        vol.Optional("min_discharge_percentage", default=10): cv.positive_int,
-        vol.Optional("panel_tilt_angle", default=30.0): vol.Coerce(float),
-        vol.Optional("panel_orientation", default=180.0): vol.Coerce(float),
-        vol.Optional("avg_daytime_load", default=2.0): vol.Coerce(float),
-        vol.Optional("avg_nighttime_load", default=1.0): vol.Coerce(float),
-        vol.Optional("update_interval", default=30): cv.positive_int,
-        vol.Optional("low_battery_threshold", default=20): cv.positive_int,
+        vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
+        vol.Required(CONF_GROWATT_USERNAME): str,
+        vol.Required(CONF_GROWATT_PASSWORD): str,
+        vol.Optional(CONF_PV_MAX_POWER, default=DEFAULT_PV_MAX_POWER): vol.Coerce(
+            float, msg="power_invalid"
+        ),
+        vol.Optional(
+            CONF_BATTERY_CAPACITY, default=DEFAULT_BATTERY_CAPACITY
+        ): vol.Coerce(float, msg="capacity_invalid"),
+        vol.Optional(
+            CONF_MIN_DISCHARGE_PERCENTAGE, default=DEFAULT_MIN_DISCHARGE_PERCENTAGE
+        ): vol.Coerce(int, msg="discharge_invalid"),
+        vol.Optional(
+            CONF_PANEL_TILT_ANGLE, default=DEFAULT_PANEL_TILT_ANGLE
+        ): vol.Coerce(float, msg="tilt_angle_invalid"),
+        vol.Optional(
+            CONF_PANEL_ORIENTATION, default=DEFAULT_PANEL_ORIENTATION
+        ): vol.Coerce(float, msg="orientation_invalid"),
+        vol.Optional(
+            CONF_AVG_DAYTIME_LOAD, default=DEFAULT_AVG_DAYTIME_LOAD
+        ): vol.Coerce(float, msg="load_invalid"),
+        vol.Optional(
+            CONF_AVG_NIGHTTIME_LOAD, default=DEFAULT_AVG_NIGHTTIME_LOAD
+        ): vol.Coerce(float, msg="load_invalid"),
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.Coerce(
+            int, msg="update_interval_invalid"
+        ),
+        vol.Optional(
+            CONF_LOW_BATTERY_THRESHOLD, default=DEFAULT_LOW_BATTERY_THRESHOLD
+        ): vol.Coerce(int, msg="threshold_invalid"),
+    }
+)
+
+# Range checks run inside the steps; every message is a translation key
+# reported back to the form as the field's error
+VALIDATION_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_GROWATT_USERNAME): vol.All(
+            str, vol.Length(min=1, msg="username_required")
+        ),
+        vol.Optional(CONF_GROWATT_PASSWORD): vol.All(
+            str, vol.Length(min=1, msg="password_required")
+        ),
+        vol.Optional(CONF_PV_MAX_POWER): vol.All(
+            vol.Coerce(float, msg="power_invalid"),
+            vol.Range(min=0, min_included=False, msg="power_invalid"),
+        ),
+        vol.Optional(CONF_BATTERY_CAPACITY): vol.All(
+            vol.Coerce(float, msg="capacity_invalid"),
+            vol.Range(min=0, min_included=False, msg="capacity_invalid"),
+        ),
+        vol.Optional(CONF_MIN_DISCHARGE_PERCENTAGE): vol.All(
+            vol.Coerce(int, msg="discharge_invalid"),
+            vol.Range(min=0, msg="discharge_too_low"),
+            vol.Range(max=100, msg="discharge_too_high"),
+        ),
+        vol.Optional(CONF_PANEL_TILT_ANGLE): vol.All(
+            vol.Coerce(float, msg="tilt_angle_invalid"),
+            vol.Range(min=0, max=90, msg="tilt_angle_invalid"),
+        ),
+        vol.Optional(CONF_PANEL_ORIENTATION): vol.All(
+            vol.Coerce(float, msg="orientation_invalid"),
+            vol.Range(min=0, max=360, max_included=False, msg="orientation_invalid"),
+        ),
+        vol.Optional(CONF_AVG_DAYTIME_LOAD): vol.All(
+            vol.Coerce(float, msg="load_invalid"),
+            vol.Range(min=0, min_included=False, msg="load_invalid"),
+        ),
+        vol.Optional(CONF_AVG_NIGHTTIME_LOAD): vol.All(
+            vol.Coerce(float, msg="load_invalid"),
+            vol.Range(min=0, min_included=False, msg="load_invalid"),
+        ),
+        vol.Optional(CONF_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(int, msg="update_interval_invalid"),
+            vol.Range(min=MIN_UPDATE_INTERVAL, msg="update_interval_invalid"),
+        ),
+        vol.Optional(CONF_LOW_BATTERY_THRESHOLD): vol.All(
+            vol.Coerce(int, msg="threshold_invalid"),
+            vol.Range(min=0, msg="threshold_too_low"),
+            vol.Range(max=100, msg="threshold_too_high"),
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _validate_input(user_input: dict) -> tuple[dict, dict[str, str]]:
+    """Run the range checks; return the cleaned input and the form errors."""
+    try:
+        return VALIDATION_SCHEMA(user_input), {}
+    except vol.MultipleInvalid as err:
+        errors = {}
+        for error in err.errors:
+            field = str(error.path[0]) if error.path else "base"
+            errors.setdefault(field, error.msg)
+        return user_input, errors
+
+
+# Built once; current values are filled in per render as suggested values.
+# Like the user step, the form only carries types; _validate_input applies the
+# range checks before the options are saved and merged into the config.
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_GROWATT_USERNAME): str,
+        vol.Optional(CONF_GROWATT_PASSWORD): str,
+        vol.Optional(CONF_PV_MAX_POWER): vol.Coerce(float, msg="power_invalid"),
+        vol.Optional(CONF_BATTERY_CAPACITY): vol.Coerce(float, msg="capacity_invalid"),
+        vol.Optional(CONF_MIN_DISCHARGE_PERCENTAGE): vol.Coerce(
+            int, msg="discharge_invalid"
+        ),
+        vol.Optional(CONF_PANEL_TILT_ANGLE): vol.Coerce(
+            float, msg="tilt_angle_invalid"
+        ),
+        vol.Optional(CONF_PANEL_ORIENTATION): vol.Coerce(
+            float, msg="orientation_invalid"
+        ),
+        vol.Optional(CONF_AVG_DAYTIME_LOAD): vol.Coerce(float, msg="load_invalid"),
+        vol.Optional(CONF_AVG_NIGHTTIME_LOAD): vol.Coerce(float, msg="load_invalid"),
+        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.Coerce(
+            int, msg="update_interval_invalid"
+        ),
+        vol.Optional(
+            CONF_LOW_BATTERY_THRESHOLD, default=DEFAULT_LOW_BATTERY_THRESHOLD
+        ): vol.Coerce(int, msg="threshold_invalid"),
     }
 )
 
@@ -41,45 +181,20 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            # Validate the user input
-            if user_input["low_battery_threshold"] > 100:
-                errors["low_battery_threshold"] = "threshold_too_high"
-            elif user_input["min_discharge_percentage"] > 100:
-                errors["min_discharge_percentage"] = "discharge_too_high"
-            elif user_input["min_discharge_percentage"] < 0:
-                errors["min_discharge_percentage"] = "discharge_too_low"
-            elif user_input["pv_max_power"] <= 0:
-                errors["pv_max_power"] = "power_invalid"
-            elif user_input["battery_capacity"] <= 0:
-                errors["battery_capacity"] = "capacity_invalid"
-            elif (
-                user_input["panel_tilt_angle"] < 0
-                or user_input["panel_tilt_angle"] > 90
-            ):
-                errors["panel_tilt_angle"] = "tilt_angle_invalid"
-            elif (
-                user_input["panel_orientation"] < 0
-                or user_input["panel_orientation"] >= 360
-            ):
-                errors["panel_orientation"] = "orientation_invalid"
-            elif user_input["avg_daytime_load"] <= 0:
-                errors["avg_daytime_load"] = "load_invalid"
-            elif user_input["avg_nighttime_load"] <= 0:
-                errors["avg_nighttime_load"] = "load_invalid"
-            elif not user_input.get("growatt_username"):
-                errors["growatt_username"] = "username_required"
-            elif not user_input.get("growatt_password"):
-                errors["growatt_password"] = "password_required"
-            else:
+            user_input, errors = _validate_input(user_input)
+            if not errors:
                 # Create the config entry
                 return self.async_create_entry(
-                    title=user_input["name"],
+                    title=user_input[CONF_NAME],
                     data=user_input,
                 )
 
+        # Keep what was entered when the form is shown again with errors
         return self.async_show_form(
             step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA, user_input or {}
+            ),
             errors=errors,
         )
 
@@ -101,61 +216,49 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            user_input, errors = _validate_input(user_input)
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        data = self.config_entry.data
+        options = self.config_entry.options
+        current_values = {
+            CONF_GROWATT_USERNAME: data.get(CONF_GROWATT_USERNAME, ""),
+            CONF_GROWATT_PASSWORD: data.get(CONF_GROWATT_PASSWORD, ""),
+            CONF_PV_MAX_POWER: data.get(CONF_PV_MAX_POWER, DEFAULT_PV_MAX_POWER),
+            CONF_BATTERY_CAPACITY: data.get(
+                CONF_BATTERY_CAPACITY, DEFAULT_BATTERY_CAPACITY
+            ),
+            CONF_MIN_DISCHARGE_PERCENTAGE: data.get(
+                CONF_MIN_DISCHARGE_PERCENTAGE, DEFAULT_MIN_DISCHARGE_PERCENTAGE
+            ),
+            CONF_PANEL_TILT_ANGLE: data.get(
+                CONF_PANEL_TILT_ANGLE, DEFAULT_PANEL_TILT_ANGLE
+            ),
+            CONF_PANEL_ORIENTATION: data.get(
+                CONF_PANEL_ORIENTATION, DEFAULT_PANEL_ORIENTATION
+            ),
+            CONF_AVG_DAYTIME_LOAD: data.get(
+                CONF_AVG_DAYTIME_LOAD, DEFAULT_AVG_DAYTIME_LOAD
+            ),
+            CONF_AVG_NIGHTTIME_LOAD: data.get(
+                CONF_AVG_NIGHTTIME_LOAD, DEFAULT_AVG_NIGHTTIME_LOAD
+            ),
+            CONF_UPDATE_INTERVAL: options.get(
+                CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+            ),
+            CONF_LOW_BATTERY_THRESHOLD: options.get(
+                CONF_LOW_BATTERY_THRESHOLD, DEFAULT_LOW_BATTERY_THRESHOLD
+            ),
+        }
 
+        # After a failed submit, suggest what was entered instead
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        "growatt_username",
-                        default=self.config_entry.data.get("growatt_username", ""),
-                    ): str,
-                    vol.Optional(
-                        "growatt_password",
-                        default=self.config_entry.data.get("growatt_password", ""),
-                    ): str,
-                    vol.Optional(
-                        "pv_max_power",
-                        default=self.config_entry.data.get("pv_max_power", 10.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "battery_capacity",
-                        default=self.config_entry.data.get("battery_capacity", 10.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "min_discharge_percentage",
-                        default=self.config_entry.data.get(
-                            "min_discharge_percentage", 10
-                        ),
-                    ): cv.positive_int,
-                    vol.Optional(
-                        "panel_tilt_angle",
-                        default=self.config_entry.data.get("panel_tilt_angle", 30.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "panel_orientation",
-                        default=self.config_entry.data.get("panel_orientation", 180.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "avg_daytime_load",
-                        default=self.config_entry.data.get("avg_daytime_load", 2.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "avg_nighttime_load",
-                        default=self.config_entry.data.get("avg_nighttime_load", 1.0),
-                    ): vol.Coerce(float),
-                    vol.Optional(
-                        "update_interval",
-                        default=self.config_entry.options.get("update_interval", 30),
-                    ): cv.positive_int,
-                    vol.Optional(
-                        "low_battery_threshold",
-                        default=self.config_entry.options.get(
-                            "low_battery_threshold", 20
-                        ),
-                    ): cv.positive_int,
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, {**current_values, **(user_input or {})}
             ),
+            errors=errors,
         )
@@ -14,6 +14,9 @@ DEFAULT_PANEL_ORIENTATION = 180.0
 DEFAULT_AVG_DAYTIME_LOAD = 2.0
 DEFAULT_AVG_NIGHTTIME_LOAD = 1.0
 
+# Polling faster than this only floods Home Assistant and the GROWATT servers
+MIN_UPDATE_INTERVAL = 10
+
 # Configuration keys
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_LOW_BATTERY_THRESHOLD = "low_battery_threshold"
@@ -31,6 +34,13 @@ CONF_AVG_NIGHTTIME_LOAD = "avg_nighttime_load"
 ATTR_BATTERY_LEVEL = "battery_level"
 ATTR_IS_CHARGING = "is_charging"
 ATTR_LAST_UPDATED = "last_updated"
+ATTR_SUN_TIMES = "sun_times"
+ATTR_SUN_TIMES_TOMORROW = "sun_times_tomorrow"
+
+# Charging sensor states
+STATE_CHARGING = "charging"
+STATE_NOT_CHARGING = "not_charging"
+STATE_UNKNOWN = "unknown"
 
 # Units of measurement
 UNIT_KW = "kW"
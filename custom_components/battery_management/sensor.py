@@ -1,10 +1,86 @@
 """GROWATT Battery Discharge Guard sensor platform."""
 
+import asyncio
+import bisect
 import logging
 import math
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+import aiohttp
+import numpy as np
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    PERCENTAGE,
+    CONF_NAME,
+    EVENT_CORE_CONFIG_UPDATE,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+from .const import (
+    DOMAIN,
+    DEFAULT_NAME,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_LOW_BATTERY_THRESHOLD,
+    DEFAULT_PV_MAX_POWER,
+    DEFAULT_BATTERY_CAPACITY,
+    DEFAULT_MIN_DISCHARGE_PERCENTAGE,
+    DEFAULT_PANEL_TILT_ANGLE,
+    DEFAULT_PANEL_ORIENTATION,
+    DEFAULT_AVG_DAYTIME_LOAD,
+    DEFAULT_AVG_NIGHTTIME_LOAD,
+    MIN_UPDATE_INTERVAL,
+    CONF_UPDATE_INTERVAL,
+    CONF_LOW_BATTERY_THRESHOLD,
+    CONF_GROWATT_USERNAME,
+    CONF_GROWATT_PASSWORD,
+    CONF_PV_MAX_POWER,
+    CONF_BATTERY_CAPACITY,
+    CONF_MIN_DISCHARGE_PERCENTAGE,
+    CONF_PANEL_TILT_ANGLE,
+    CONF_PANEL_ORIENTATION,
+    CONF_AVG_DAYTIME_LOAD,
+    CONF_AVG_NIGHTTIME_LOAD,
+    ATTR_BATTERY_LEVEL,
+    ATTR_IS_CHARGING,
+    ATTR_SUN_TIMES,
+    ATTR_SUN_TIMES_TOMORROW,
+    STATE_CHARGING,
+    STATE_NOT_CHARGING,
+    STATE_UNKNOWN,
+    UNIT_KW,
+    UNIT_KWH,
+    UNIT_PERCENTAGE,
+    UNIT_DEGREES,
+)
+
+# Numba is optional; solar_core falls back to plain Python without it
+from .solar_core import (
+    _LN_TRANSMISSION,
+    USE_NUMBA,
+    njit,
+    ephemeris_position,
+    ephemeris_position_array,
+    julian_day_number,
+    panel_irradiance,
+)
+
 # Import astral library (compatible with Home Assistant's included version 2.2)
 try:
     # For astral >= 2.0
@@ -12,22 +88,52 @@ try:
     from astral.sun import sun
 
     ASTRAL_V2 = True
+    # Raised when the sun never rises or sets on a date (polar day/night)
+    SUN_ERRORS = (ValueError,)
 except ImportError:
     # Fallback for older astral versions
-    from astral import Astral, Location
+    from astral import Astral, AstralError, Location
 
     ASTRAL_V2 = False
+    SUN_ERRORS = (ValueError, AstralError)
 
-    ASTRAL_V2 = False
+_LOGGER = logging.getLogger(__name__)
 
+# Charging sensor state indexed by bool(is_charging)
+_CHARGING_STATES = (STATE_NOT_CHARGING, STATE_CHARGING)
 
-def get_sun_times(latitude: float, longitude: float, timezone: str, date) -> dict:
+
+def get_sun_times(
+    latitude: float, longitude: float, timezone: str, date, observer=None
+) -> dict:
     """Get sun times using appropriate astral version."""
+    if observer is None:
+        # Copy so callers can't alter the cached result
+        return dict(_cached_sun_times(latitude, longitude, timezone, date.toordinal()))
+    return _calculate_sun_times(latitude, longitude, timezone, date, observer)
+
+
+@lru_cache(maxsize=64)
+def _cached_sun_times(
+    latitude: float, longitude: float, timezone: str, date_ordinal: int
+) -> dict:
+    """Get sun times for a location and day, computed once per key."""
+    return _calculate_sun_times(
+        latitude, longitude, timezone, datetime.fromordinal(date_ordinal).date()
+    )
+
+
+def _calculate_sun_times(
+    latitude: float, longitude: float, timezone: str, date, observer=None
+) -> dict:
+    """Calculate sun times with the installed astral version."""
     try:
         if ASTRAL_V2:
             # Use astral 2.x API
-            location = LocationInfo("Home", "Home", timezone, latitude, longitude)
-            return sun(location.observer, date=date)
+            if observer is None:
+                location = LocationInfo("Home", "Home", timezone, latitude, longitude)
+                observer = location.observer
+            return sun(observer, date=date)
         else:
             # Use astral 1.x API (fallback)
             astral = Astral()
@@ -36,67 +142,72 @@ def get_sun_times(latitude: float, longitude: float, timezone: str, date) -> dic
             location.longitude = longitude
             location.timezone = timezone
             return astral.sun_utc(date, location.latitude, location.longitude)
-    except Exception as e:
+    except SUN_ERRORS as e:
         _LOGGER.error("Error calculating sun times: %s", e)
         return {}
 
 
-def calculate_solar_position(latitude: float, longitude: float, dt: datetime) -> dict:
-    """Calculate solar elevation and azimuth for a given time and location."""
-    try:
-        # Convert to Julian day
-        a = (14 - dt.month) // 12
-        y = dt.year - a
-        m = dt.month + 12 * a - 3
-        jd = (
-            dt.day
-            + (153 * m + 2) // 5
-            + 365 * y
-            + y // 4
-            - y // 100
-            + y // 400
-            + 1721119
-        )
+def _with_iso_times(sun_times: dict) -> dict:
+    """Return sun times with prebuilt ISO strings under ``<event>_iso`` keys.
 
-        # Add time of day
-        jd += (dt.hour - 12) / 24.0 + dt.minute / 1440.0 + dt.second / 86400.0
+    The strings are built once per day so state and attribute reads don't
+    reformat the same timestamps over and over.
+    """
+    return {
+        **sun_times,
+        **{f"{key}_iso": value.isoformat() for key, value in sun_times.items()},
+    }
 
-        # Calculate solar position
-        n = jd - 2451545.0
-        L = (280.460 + 0.9856474 * n) % 360
-        g = math.radians((357.528 + 0.9856003 * n) % 360)
-        lambda_sun = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
 
-        # Declination
-        delta = math.asin(math.sin(math.radians(23.439)) * math.sin(lambda_sun))
+# Peak and average power statistics reported with the interval lists
+_POWER_STATS = (
+    "peak_power_time_remaining",
+    "peak_power_kw_remaining",
+    "average_power_kw_remaining",
+    "peak_power_time_daily",
+    "peak_power_kw_daily",
+    "average_power_kw_daily",
+)
 
-        # Hour angle
-        lat_rad = math.radians(latitude)
-        lon_rad = math.radians(longitude)
+# Start of each 15-minute forecast interval, in seconds after local midnight
+_INTERVAL_STARTS = range(0, 24 * 3600, 900)
 
-        # Mean solar time
-        mst = dt.hour + dt.minute / 60.0 + dt.second / 3600.0
 
-        # Hour angle (corrected formula)
-        h = math.radians(15 * (mst - 12) - longitude)
+def _forecast_constants(
+    latitude: float, panel_tilt: float, panel_azimuth: float
+) -> tuple[float, float, float, float, float]:
+    """Return the trig terms that stay fixed for a whole forecast.
 
-        # Solar elevation
-        elevation = math.asin(
-            math.sin(lat_rad) * math.sin(delta)
-            + math.cos(lat_rad) * math.cos(delta) * math.cos(h)
-        )
+    The tuple is (sin_lat, cos_lat, sin_tilt, cos_tilt, panel_az_rad).
+    """
+    lat_rad = math.radians(latitude)
+    panel_tilt_rad = math.radians(panel_tilt)
+    return (
+        math.sin(lat_rad),
+        math.cos(lat_rad),
+        math.sin(panel_tilt_rad),
+        math.cos(panel_tilt_rad),
+        math.radians(panel_azimuth),
+    )
 
-        # Solar azimuth (corrected to give proper compass direction)
-        azimuth = math.atan2(
-            math.sin(h),
-            math.cos(h) * math.sin(lat_rad) - math.tan(delta) * math.cos(lat_rad),
-        )
 
-        # Convert azimuth to compass bearing (0° = North, 90° = East, 180° = South, 270° = West)
-        azimuth = (math.degrees(azimuth) + 180) % 360
+def _datetime_to_jd(dt: datetime) -> float:
+    """Return the Julian day for a local wall-clock time (seconds resolution)."""
+    time_of_day = (dt.hour - 12) / 24.0 + dt.minute / 1440.0 + dt.second / 86400.0
+    return julian_day_number(dt) + time_of_day
+
 
+def calculate_solar_position(latitude: float, longitude: float, dt: datetime) -> dict:
+    """Calculate solar elevation and azimuth for a given time and location."""
+    try:
+        elevation, azimuth = _cached_solar_position(
+            latitude,
+            longitude,
+            dt.toordinal(),
+            dt.hour * 3600 + dt.minute * 60 + dt.second,
+        )
         return {
-            "elevation": math.degrees(elevation),
+            "elevation": elevation,
             "azimuth": azimuth,
         }
     except Exception as e:
@@ -104,6 +215,22 @@ def calculate_solar_position(latitude: float, longitude: float, dt: datetime) ->
         return {"elevation": 0, "azimuth": 0}
 
 
+@lru_cache(maxsize=1024)
+def _cached_solar_position(
+    latitude: float, longitude: float, date_ordinal: int, second_of_day: int
+) -> tuple[float, float]:
+    """Get solar elevation and azimuth for a local time, computed once per key."""
+    moment = datetime.fromordinal(date_ordinal) + timedelta(seconds=second_of_day)
+    lat_rad = math.radians(latitude)
+    return ephemeris_position(
+        _datetime_to_jd(moment),
+        moment.hour + moment.minute / 60.0 + moment.second / 3600.0,
+        math.sin(lat_rad),
+        math.cos(lat_rad),
+        longitude,
+    )
+
+
 def calculate_panel_irradiance(
     solar_elevation: float,
     solar_azimuth: float,
@@ -112,56 +239,356 @@ def calculate_panel_irradiance(
 ) -> float:
     """Calculate irradiance on tilted panel surface."""
     try:
-        # Return 0 if sun is below horizon
-        if solar_elevation <= 0:
-            return 0
-
-        # Convert to radians
-        sun_el = math.radians(solar_elevation)
-        sun_az = math.radians(solar_azimuth)
         panel_tilt_rad = math.radians(panel_tilt)
-        panel_az_rad = math.radians(panel_azimuth)
+        irradiance = panel_irradiance(
+            solar_elevation,
+            solar_azimuth,
+            math.sin(panel_tilt_rad),
+            math.cos(panel_tilt_rad),
+            math.radians(panel_azimuth),
+        )
+
+        # Debug logging for troubleshooting
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"🔍 Enhanced irradiance calc: sun_el={solar_elevation:.1f}°, sun_az={solar_azimuth:.1f}°, "
+                f"panel_tilt={panel_tilt:.1f}°, panel_az={panel_azimuth:.1f}°, "
+                f"total={irradiance:.1f}"
+            )
+
+        return irradiance
+    except Exception as e:
+        _LOGGER.error("Error calculating panel irradiance: %s", e)
+        return 0
 
-        # Calculate angle of incidence between sun and panel normal
-        cos_incidence = math.sin(sun_el) * math.cos(panel_tilt_rad) + math.cos(
-            sun_el
-        ) * math.sin(panel_tilt_rad) * math.cos(sun_az - panel_az_rad)
 
-        # Ensure non-negative (sun behind panel gives 0)
-        cos_incidence = max(0, cos_incidence)
+def _warm_up_solar_cores() -> None:
+    """Compile the Numba solar cores ahead of the first forecast."""
+    sin_lat, cos_lat, sin_tilt, cos_tilt, panel_az_rad = _forecast_constants(
+        45.0, 30.0, 180.0
+    )
+    ephemeris_position(2460483.0, 12.0, sin_lat, cos_lat, 20.0)
+    panel_irradiance(45.0, 180.0, sin_tilt, cos_tilt, panel_az_rad)
+    _forecast_kernel(
+        2460483, 0, 96, sin_lat, cos_lat, 20.0, sin_tilt, cos_tilt, panel_az_rad, 10.0
+    )
+
+
+def _solar_position_array(
+    sin_lat: float, cos_lat: float, longitude: float, day, seconds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate solar elevation and azimuth for many times on a local day.
+
+    Vectorized form of calculate_solar_position; ``seconds`` counts local
+    wall-clock seconds from midnight of ``day`` and may run past 24 hours.
+    """
+    # Julian day number of the date, then add the time of day
+    jd = julian_day_number(day) + (seconds - 43200) / 86400.0
+    return ephemeris_position_array(
+        jd, np.mod(seconds, 86400) / 3600.0, sin_lat, cos_lat, longitude
+    )
+
+
+def _panel_irradiance_array(
+    solar_elevation: np.ndarray,
+    solar_azimuth: np.ndarray,
+    sin_tilt: float,
+    cos_tilt: float,
+    panel_az_rad: float,
+) -> np.ndarray:
+    """Calculate irradiance on the tilted panel; vectorized calculate_panel_irradiance."""
+    sun_el = np.radians(solar_elevation)
+    sun_az = np.radians(solar_azimuth)
+    sin_el = np.sin(sun_el)
+
+    # Angle of incidence between sun and panel normal; sun behind panel gives 0
+    cos_incidence = np.maximum(
+        0,
+        sin_el * cos_tilt + np.cos(sun_el) * sin_tilt * np.cos(sun_az - panel_az_rad),
+    )
+
+    # Atmospheric transmission, air mass capped at 10 for a low sun
+    with np.errstate(divide="ignore"):
+        air_mass = np.where(solar_elevation > 1, 1 / sin_el, 10)
+    air_mass = np.minimum(air_mass, 10)
+    transmission = np.exp(_LN_TRANSMISSION * np.power(air_mass, 0.62))
+
+    # Direct, diffuse and reflected components (same model as the scalar path)
+    dni = 1150 * transmission
+    ghi = dni * sin_el + 160.0
+    diffuse = 0.25 * ghi
+    reflected = 0.25 * (1 - cos_tilt) * ghi / 2
+
+    panel_irradiance = np.maximum(0, dni * cos_incidence + diffuse + reflected)
+
+    # Zero while the sun is below the horizon (multiply by a 0/1 mask)
+    return panel_irradiance * (solar_elevation > 0)
+
+
+@njit(cache=True, fastmath=True)
+def _forecast_kernel(
+    day_number: int,
+    start_second: int,
+    count: int,
+    sin_lat: float,
+    cos_lat: float,
+    longitude: float,
+    sin_tilt: float,
+    cos_tilt: float,
+    panel_az_rad: float,
+    pv_max_power: float,
+) -> tuple[np.ndarray, ...]:
+    """Run position, irradiance, power and energy for every step in one loop.
+
+    Compiled as a single native loop when Numba is installed; see
+    _forecast_intervals for the arguments and the returned arrays.
+    """
+    elevation = np.empty(count)
+    azimuth = np.empty(count)
+    irradiance = np.empty(count)
+    power_kw = np.empty(count)
+    energy = np.empty(count)
+    for i in range(count):
+        second = start_second + 900 * i
+        el, az = ephemeris_position(
+            day_number + (second - 43200) / 86400.0,
+            (second % 86400) / 3600.0,
+            sin_lat,
+            cos_lat,
+            longitude,
+        )
+        irr = panel_irradiance(el, az, sin_tilt, cos_tilt, panel_az_rad)
+        power = min(max(pv_max_power * (irr / 1000.0), 0.0), pv_max_power)
+        elevation[i] = el
+        azimuth[i] = az
+        irradiance[i] = irr
+        power_kw[i] = power
+        energy[i] = power * (15 / 60)
+    return elevation, azimuth, irradiance, power_kw, energy
 
-        # Atmospheric transmission (balanced for realistic daily totals)
-        air_mass = 1 / math.sin(sun_el) if solar_elevation > 1 else 10
-        air_mass = min(air_mass, 10)  # Cap at 10
-        # Balanced transmission model - optimistic for peak, realistic for daily total
-        transmission = 0.78 ** (air_mass**0.62)  # Slightly more conservative
 
-        # Enhanced Direct Normal Irradiance (W/m²) - calibrated to real observations
-        # Maintain peak values but reduce overestimation at low sun angles
-        dni = 1150 * transmission  # Reduced from 1200 to 1150
+def _forecast_intervals(
+    latitude: float,
+    longitude: float,
+    panel_tilt: float,
+    panel_orientation: float,
+    pv_max_power: float,
+    start: datetime,
+    count: int,
+) -> tuple[np.ndarray, ...]:
+    """Calculate position, irradiance, power and energy for 15-minute steps.
+
+    Returns arrays of solar elevation, solar azimuth, irradiance, power (kW)
+    and energy (kWh) for ``count`` intervals starting at ``start``.
+    """
+    start_second = start.hour * 3600 + start.minute * 60 + start.second
+    sin_lat, cos_lat, sin_tilt, cos_tilt, panel_az_rad = _forecast_constants(
+        latitude, panel_tilt, panel_orientation
+    )
+    if USE_NUMBA:
+        # One fused native loop beats chaining NumPy array operations
+        return _forecast_kernel(
+            julian_day_number(start),
+            start_second,
+            count,
+            sin_lat,
+            cos_lat,
+            longitude,
+            sin_tilt,
+            cos_tilt,
+            panel_az_rad,
+            pv_max_power,
+        )
 
-        # Enhanced irradiance calculation with diffuse and reflected components
-        # Empirical clear-sky global horizontal irradiance
-        ghi = dni * math.sin(sun_el) + 160.0  # Reduced base diffuse from 180 to 160
-        diffuse = 0.25 * ghi  # Reduced diffuse component from 30% to 25%
-        reflected = (
-            0.25 * (1 - math.cos(panel_tilt_rad)) * ghi / 2
-        )  # Reduced albedo from 0.3 to 0.25
+    seconds = start_second + 900 * np.arange(count)
+    elevation, azimuth = _solar_position_array(
+        sin_lat, cos_lat, longitude, start.date(), seconds
+    )
+    irradiance = _panel_irradiance_array(
+        elevation, azimuth, sin_tilt, cos_tilt, panel_az_rad
+    )
+
+    # Standard Test Conditions: 1000 W/m², power scales linearly with
+    # irradiance and is capped at the rated power. Irradiance is already 0
+    # with the sun below the horizon, so no separate mask is needed.
+    power_kw = np.clip(pv_max_power * (irradiance / 1000.0), 0, pv_max_power)
+    energy = power_kw * (15 / 60)  # 15 minutes = 1/4 hour
+
+    return elevation, azimuth, irradiance, power_kw, energy
+
+
+def _forecast_entries(
+    times: list[str],
+    solar_elevation: np.ndarray,
+    solar_azimuth: np.ndarray,
+    irradiance: np.ndarray,
+    power_kw: np.ndarray,
+    energy: np.ndarray,
+) -> list[dict]:
+    """Build the per-interval forecast attribute entries from ISO time strings."""
+    return [
+        {
+            "time": moment,
+            "solar_elevation": el,
+            "solar_azimuth": az,
+            "irradiance": irr,
+            "power_kw": power,
+            "energy_15min_kwh": kwh,
+        }
+        for moment, el, az, irr, power, kwh in zip(
+            times,
+            np.round(solar_elevation, 2).tolist(),
+            np.round(solar_azimuth, 2).tolist(),
+            np.round(irradiance, 2).tolist(),
+            np.round(power_kw, 3).tolist(),
+            np.round(energy, 4).tolist(),
+        )
+    ]
 
-        panel_irradiance = max(0, dni * cos_incidence + diffuse + reflected)
 
-        # Debug logging for troubleshooting
+def _log_intervals(label: str, times: list[str], *values: np.ndarray) -> None:
+    """Log the calculation of every interval when debug logging is enabled."""
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+    for i, (moment, el, az, irr, power, kwh) in enumerate(
+        zip(times, *(v.tolist() for v in values))
+    ):
         _LOGGER.debug(
-            f"🔍 Enhanced irradiance calc: sun_el={solar_elevation:.1f}°, sun_az={solar_azimuth:.1f}°, "
-            f"panel_tilt={panel_tilt:.1f}°, panel_az={panel_azimuth:.1f}°, "
-            f"cos_incidence={cos_incidence:.3f}, dni={dni:.1f}, ghi={ghi:.1f}, "
-            f"diffuse={diffuse:.1f}, reflected={reflected:.1f}, total={panel_irradiance:.1f}"
+            f"{label} {i+1}/{len(times)}: {moment[11:16]} - "
+            f"Elevation: {el:.1f}°, "
+            f"Azimuth: {az:.1f}°, "
+            f"Irradiance: {irr:.1f} W/m², "
+            f"Power: {power:.3f} kW, "
+            f"Energy: {kwh:.4f} kWh"
         )
 
-        return max(0, panel_irradiance)
-    except Exception as e:
-        _LOGGER.error("Error calculating panel irradiance: %s", e)
-        return 0
+
+def _power_summary(times: list[str], power_kw: np.ndarray) -> tuple[str, float, float]:
+    """Return the peak-power time, the peak power and the average power."""
+    peak = int(power_kw.argmax())
+    return times[peak], float(power_kw[peak]), round(float(power_kw.mean()), 3)
+
+
+@lru_cache(maxsize=8)
+def _day_forecast(
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    panel_tilt: float,
+    panel_orientation: float,
+    pv_max_power: float,
+    forecast_day,
+) -> tuple:
+    """Calculate the 96 forecast intervals of one day, starting at midnight.
+
+    Returns the ISO times, the wall-clock ``datetime64`` grid and the read-only
+    arrays of ``_forecast_intervals``.
+    """
+    # Start from midnight of the forecast day
+    forecast_day_start = datetime.combine(forecast_day, datetime.min.time())
+
+    # Make timezone-aware
+    current_time_full = forecast_day_start.replace(
+        tzinfo=dt_util.get_time_zone(timezone)
+    )
+
+    _LOGGER.debug(
+        f"📈 Calculating full day forecast from {current_time_full} for {forecast_day} (24h = 96 intervals @ 15min)"
+    )
+
+    # Evaluate all 96 intervals (24 hours * 4 intervals per hour @ 15min each)
+    # in one vectorized pass
+    values = _forecast_intervals(
+        latitude,
+        longitude,
+        panel_tilt,
+        panel_orientation,
+        pv_max_power,
+        current_time_full,
+        96,
+    )
+    # Wall-clock grid of the intervals; every ISO string shares midnight's
+    # UTC offset, so serialize the grid once and append the offset
+    grid = np.datetime64(forecast_day_start, "m") + np.arange(96) * np.timedelta64(
+        15, "m"
+    )
+    utc_offset = current_time_full.isoformat()[19:]
+    times_full = [
+        moment + utc_offset for moment in np.datetime_as_string(grid, unit="s").tolist()
+    ]
+    _log_intervals("⚡ Interval", times_full, *values)
+
+    # The cached arrays are shared between callers
+    for array in (grid, *values):
+        array.flags.writeable = False
+    return (tuple(times_full), grid, *values)
+
+
+@lru_cache(maxsize=8)
+def _full_day_result(
+    latitude: float,
+    longitude: float,
+    timezone: str,
+    panel_tilt: float,
+    panel_orientation: float,
+    pv_max_power: float,
+    forecast_day,
+    include_intervals: bool,
+) -> MappingProxyType:
+    """Build the full day total, intervals and daily summary, once per day.
+
+    Holds the ``total_daily_energy``, ``full_day_forecast`` and daily peak and
+    average entries of a forecast result; the mapping and its read-only
+    interval entries are shared between calls.
+    """
+    (
+        times_full,
+        _,
+        solar_elevation,
+        solar_azimuth,
+        irradiance,
+        power_kw,
+        energy_15min,
+    ) = _day_forecast(
+        latitude,
+        longitude,
+        timezone,
+        panel_tilt,
+        panel_orientation,
+        pv_max_power,
+        forecast_day,
+    )
+    full_day = {"total_daily_energy": round(float(energy_15min.sum()), 3)}
+
+    # Only daylight intervals produce energy
+    peak = int(power_kw.argmax())
+    peak_power = float(power_kw[peak])
+    peak_time = times_full[peak][11:16] if peak_power > 0 else "N/A"
+    _LOGGER.info(
+        f"📊 Full day forecast complete: {len(times_full)} total intervals, "
+        f"{int(np.count_nonzero(power_kw > 0))} with energy, peak "
+        f"{peak_power:.3f}kW at {peak_time}, "
+        f"total daily energy: {full_day['total_daily_energy']:.3f}kWh"
+    )
+
+    if include_intervals:
+        full_day["full_day_forecast"] = tuple(
+            ReadOnlyDict(entry)
+            for entry in _forecast_entries(
+                times_full,
+                solar_elevation,
+                solar_azimuth,
+                irradiance,
+                power_kw,
+                energy_15min,
+            )
+        )
+        (
+            full_day["peak_power_time_daily"],
+            full_day["peak_power_kw_daily"],
+            full_day["average_power_kw_daily"],
+        ) = _power_summary(times_full, np.round(power_kw, 3))
+    return MappingProxyType(full_day)
 
 
 def calculate_energy_forecast(
@@ -172,11 +599,18 @@ def calculate_energy_forecast(
     panel_orientation: float,
     pv_max_power: float,
     start_time: datetime = None,
+    include_intervals: bool = True,
 ) -> dict:
-    """Calculate energy production forecast in 15-minute intervals until sunset."""
+    """Calculate energy production forecast in 15-minute intervals until sunset.
+
+    With ``include_intervals`` False only the totals and sun times are
+    returned, skipping the per-interval ``forecast`` and
+    ``full_day_forecast`` lists.
+    """
     try:
+        zone = dt_util.get_time_zone(timezone)
         if start_time is None:
-            start_time = datetime.now()
+            start_time = dt_util.now(zone)
 
         _LOGGER.info(
             f"📊 Starting energy forecast calculation: "
@@ -187,25 +621,7 @@ def calculate_energy_forecast(
 
         # Ensure start_time is timezone-aware for proper comparison with sun times
         if start_time.tzinfo is None:
-            try:
-                import pytz
-
-                tz = pytz.timezone(timezone)
-                start_time = tz.localize(start_time)
-            except ImportError:
-                # Fallback if pytz is not available
-                from datetime import timezone as dt_timezone, timedelta as td
-
-                # Assume local time with standard offset for the timezone
-                # This is a rough approximation
-                if "Europe" in timezone:
-                    offset_hours = 1 if "UTC" not in timezone else 0
-                    if "Bucharest" in timezone or "Eastern" in timezone:
-                        offset_hours = 2
-                    tz_offset = dt_timezone(td(hours=offset_hours))
-                    start_time = start_time.replace(tzinfo=tz_offset)
-                else:
-                    start_time = start_time.replace(tzinfo=dt_timezone.utc)
+            start_time = start_time.replace(tzinfo=zone)
 
         today = start_time.date()
         sun_times = get_sun_times(latitude, longitude, timezone, today)
@@ -257,216 +673,98 @@ def calculate_energy_forecast(
             _LOGGER.info("☀️ Before sunset, using today's forecast")
             forecast_day = today
 
-        # Calculate full day forecast (24 hours in 5-minute intervals = 288 intervals)
-        full_day_forecast = []
-        total_daily_energy = 0
-
-        # Start from midnight of the forecast day
-        forecast_day_start = forecast_day
-        if hasattr(forecast_day_start, "date"):
-            # It's a datetime, get the date part
-            forecast_day_start = datetime.combine(
-                forecast_day_start.date(), datetime.min.time()
-            )
-        else:
-            # It's already a date, convert to datetime
-            forecast_day_start = datetime.combine(
-                forecast_day_start, datetime.min.time()
-            )
-
-        # Make timezone-aware
-        try:
-            import pytz
-
-            tz = pytz.timezone(timezone)
-            current_time_full = tz.localize(forecast_day_start)
-        except ImportError:
-            current_time_full = forecast_day_start.replace(tzinfo=dt_timezone.utc)
-
-        _LOGGER.debug(
-            f"📈 Calculating full day forecast from {current_time_full} for {forecast_day} (24h = 96 intervals @ 15min)"
+        # The full day table only depends on the location, the panels and the
+        # day, so it is computed once per day and shared by later calls; the
+        # remaining forecast is a slice of it
+        full_day = _full_day_result(
+            latitude,
+            longitude,
+            timezone,
+            panel_tilt,
+            panel_orientation,
+            pv_max_power,
+            forecast_day,
+            include_intervals,
         )
 
-        # Generate 96 intervals (24 hours * 4 intervals per hour @ 15min each)
-        interval_count = 0
-        energy_intervals = 0
-        peak_power = 0
-        peak_time = None
-
-        for interval in range(96):
-            # Get solar position
-            solar_pos = calculate_solar_position(latitude, longitude, current_time_full)
-
-            # Calculate panel irradiance
-            irradiance = calculate_panel_irradiance(
-                solar_pos["elevation"],
-                solar_pos["azimuth"],
-                panel_tilt,
-                panel_orientation,
-            )
-
-            # Calculate power output - pv_max_power is already the rated power
-            # Use simplified irradiance-to-power conversion
-            if solar_pos["elevation"] > 0 and irradiance > 0:
-                # Standard Test Conditions: 1000 W/m²
-                # Power scales linearly with irradiance
-                power_kw = pv_max_power * (irradiance / 1000.0)
-                power_kw = max(0, min(power_kw, pv_max_power))  # Cap at max power
-            else:
-                power_kw = 0.0
-
-            # Track peak power
-            if power_kw > peak_power:
-                peak_power = power_kw
-                peak_time = current_time_full
-
-            # Energy in 15 minutes (kWh)
-            energy_15min = power_kw * (15 / 60)  # 15 minutes = 1/4 hour
-
-            # Log detailed calculation for each interval
-            _LOGGER.debug(
-                f"⚡ Interval {interval+1}/96: {current_time_full.strftime('%H:%M')} - "
-                f"Elevation: {solar_pos['elevation']:.1f}°, "
-                f"Azimuth: {solar_pos['azimuth']:.1f}°, "
-                f"Irradiance: {irradiance:.1f} W/m², "
-                f"Power: {power_kw:.3f} kW, "
-                f"Energy: {energy_15min:.4f} kWh"
-            )
-
-            full_day_forecast.append(
-                {
-                    "time": current_time_full.isoformat(),
-                    "solar_elevation": round(solar_pos["elevation"], 2),
-                    "solar_azimuth": round(solar_pos["azimuth"], 2),
-                    "irradiance": round(irradiance, 2),
-                    "power_kw": round(power_kw, 3),
-                    "energy_15min_kwh": round(energy_15min, 4),
-                }
-            )
-
-            if power_kw > 0:  # Only add energy during daylight
-                total_daily_energy += energy_15min
-                energy_intervals += 1
-
-            interval_count += 1
-            current_time_full += timedelta(minutes=15)
-
-        _LOGGER.info(
-            f"📊 Full day forecast complete: {interval_count} total intervals, "
-            f"{energy_intervals} with energy, peak {peak_power:.3f}kW at "
-            f"{peak_time.strftime('%H:%M') if peak_time else 'N/A'}, "
-            f"total daily energy: {total_daily_energy:.3f}kWh"
-        )  # Determine if we need to calculate remaining forecast
-        original_sunset = (
-            get_sun_times(latitude, longitude, timezone, start_time.date()).get(
-                "sunset"
-            )
-            if get_sun_times(latitude, longitude, timezone, start_time.date())
-            else sunset_time
-        )
+        result = {
+            "total_energy": 0,
+            "total_daily_energy": full_day["total_daily_energy"],
+            "sunrise_time": sunrise_time.isoformat(),
+            "sunset_time": sunset_time.isoformat(),
+            "forecast_start": start_time.isoformat(),
+            "forecast_day": forecast_day.isoformat(),
+        }
 
-        # If we're past today's sunset, there's no remaining energy for today
-        if start_time >= original_sunset:
+        # Past today's sunset nothing remains for today, so the result is the
+        # cached day as is; sunset_time is still today's when tomorrow's sun
+        # times were unavailable
+        if start_time >= sun_times["sunset"]:
             _LOGGER.info(
-                f"🌇 Past original sunset ({original_sunset.isoformat()}), "
+                f"🌇 Past sunset ({sun_times['sunset'].isoformat()}), "
                 f"no remaining energy for today"
             )
-            return {
-                "total_energy": 0,
-                "forecast": [],
-                "full_day_forecast": full_day_forecast,
-                "total_daily_energy": round(total_daily_energy, 3),
-                "sunrise_time": sunrise_time.isoformat(),
-                "sunset_time": sunset_time.isoformat(),
-                "forecast_start": start_time.isoformat(),
-                "forecast_day": (
-                    forecast_day.isoformat()
-                    if "forecast_day" in locals()
-                    else today.isoformat()
-                ),
-            }
+            if include_intervals:
+                result["forecast"] = ()
+            result.update(full_day)
+            return result
 
         # Calculate remaining forecast (from now until sunset)
-        forecast = []
-        total_energy = 0
-        current_time = start_time
-        remaining_intervals = 0
-
         _LOGGER.info(
             f"⏰ Calculating remaining forecast from {start_time.isoformat()} "
             f"until {sunset_time.isoformat()} using 15-minute intervals"
         )
+        times_full, *_, power_kw, energy_15min = _day_forecast(
+            latitude,
+            longitude,
+            timezone,
+            panel_tilt,
+            panel_orientation,
+            pv_max_power,
+            forecast_day,
+        )
 
-        # Calculate in 15-minute intervals until sunset
-        while current_time < sunset_time:
-            # Get solar position
-            solar_pos = calculate_solar_position(latitude, longitude, current_time)
-
-            # Calculate panel irradiance
-            irradiance = calculate_panel_irradiance(
-                solar_pos["elevation"],
-                solar_pos["azimuth"],
-                panel_tilt,
-                panel_orientation,
-            )
-
-            # Calculate power output - pv_max_power is already the rated power
-            # Use simplified irradiance-to-power conversion
-            if solar_pos["elevation"] > 0 and irradiance > 0:
-                # Standard Test Conditions: 1000 W/m²
-                # Power scales linearly with irradiance
-                power_kw = pv_max_power * (irradiance / 1000.0)
-                power_kw = max(0, min(power_kw, pv_max_power))  # Cap at max power
-            else:
-                power_kw = 0.0
-
-            # Energy in 15 minutes (kWh)
-            energy_15min = power_kw * (15 / 60)  # 15 minutes = 1/4 hour
-
-            # Log detailed calculation for remaining intervals
-            _LOGGER.debug(
-                f"🔋 Remaining {remaining_intervals+1}: {current_time.strftime('%H:%M')} - "
-                f"Elevation: {solar_pos['elevation']:.1f}°, "
-                f"Azimuth: {solar_pos['azimuth']:.1f}°, "
-                f"Irradiance: {irradiance:.1f} W/m², "
-                f"Power: {power_kw:.3f} kW, "
-                f"Energy: {energy_15min:.4f} kWh"
-            )
-
-            forecast.append(
-                {
-                    "time": current_time.isoformat(),
-                    "solar_elevation": round(solar_pos["elevation"], 2),
-                    "solar_azimuth": round(solar_pos["azimuth"], 2),
-                    "irradiance": round(irradiance, 2),
-                    "power_kw": round(power_kw, 3),
-                    "energy_15min_kwh": round(energy_15min, 4),
-                }
+        # The remaining forecast is the part of today's grid between now and
+        # sunset, so reuse the full day intervals instead of recomputing them.
+        # The grid keeps midnight's UTC offset, so match on local wall-clock
+        # time (which the solar model uses) to stay correct on DST change days.
+        midnight = datetime.combine(forecast_day, datetime.min.time())
+        first, last = (
+            bisect.bisect_left(
+                _INTERVAL_STARTS,
+                (moment.astimezone(zone).replace(tzinfo=None) - midnight)
+                / timedelta(seconds=1),
             )
-
-            total_energy += energy_15min
-            remaining_intervals += 1
-            current_time += timedelta(minutes=15)
+            for moment in (start_time, sunset_time)
+        )
+        last = max(first, last)
+        total_energy = float(energy_15min[first:last].sum())
 
         _LOGGER.info(
-            f"🔋 Remaining forecast complete: {remaining_intervals} intervals, "
+            f"🔋 Remaining forecast complete: {last - first} intervals, "
             f"total remaining energy: {total_energy:.3f}kWh"
         )
 
-        return {
-            "total_energy": round(total_energy, 3),
-            "forecast": forecast,
-            "full_day_forecast": full_day_forecast,
-            "total_daily_energy": round(total_daily_energy, 3),
-            "sunrise_time": sunrise_time.isoformat(),
-            "sunset_time": sunset_time.isoformat(),
-            "forecast_start": start_time.isoformat(),
-            "forecast_day": (
-                forecast_day.isoformat()
-                if "forecast_day" in locals()
-                else today.isoformat()
-            ),
-        }
+        result["total_energy"] = round(total_energy, 3)
+        if include_intervals:
+            # The cached entries are read-only, so every result shares them
+            result["forecast"] = full_day["full_day_forecast"][first:last]
+            result["full_day_forecast"] = full_day["full_day_forecast"]
+            # Peak and average power of the rounded interval values, summarized
+            # here so the attributes need no extra pass over the lists
+            if last > first:
+                (
+                    result["peak_power_time_remaining"],
+                    result["peak_power_kw_remaining"],
+                    result["average_power_kw_remaining"],
+                ) = _power_summary(
+                    times_full[first:last], np.round(power_kw[first:last], 3)
+                )
+        # Daily summary, computed once per day
+        result.update(
+            (key, value) for key, value in full_day.items() if key not in result
+        )
+        return result
 
     except Exception as e:
         _LOGGER.error("❌ Error calculating energy forecast: %s", e, exc_info=True)
@@ -478,34 +776,6 @@ def calculate_energy_forecast(
         }
 
 
-from homeassistant.components.sensor import (
-    SensorDeviceClass,
-    SensorEntity,
-    SensorStateClass,
-)
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTime, CONF_NAME
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
-
-from .const import (
-    DOMAIN,
-    ATTR_BATTERY_LEVEL,
-    ATTR_IS_CHARGING,
-    UNIT_KW,
-    UNIT_KWH,
-    UNIT_PERCENTAGE,
-    UNIT_DEGREES,
-)
-
-_LOGGER = logging.getLogger(__name__)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -513,6 +783,10 @@ async def async_setup_entry(
 ) -> None:
     """Set up the GROWATT Battery Discharge Guard sensor platform."""
 
+    # Compile the Numba cores off the event loop before the first forecast
+    if USE_NUMBA:
+        await hass.async_add_executor_job(_warm_up_solar_cores)
+
     # Create coordinator for data updates
     coordinator = BatteryDataUpdateCoordinator(hass, config_entry)
     await coordinator.async_config_entry_first_refresh()
@@ -534,9 +808,17 @@ class BatteryDataUpdateCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
-        update_interval = timedelta(
-            seconds=config_entry.data.get("update_interval", 30)
-        )
+        # Options override the values entered during initial setup
+        config = {**config_entry.data, **config_entry.options}
+        seconds = int(config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+        if seconds < MIN_UPDATE_INTERVAL:
+            _LOGGER.warning(
+                "Update interval of %ss is too short, using %ss instead",
+                seconds,
+                MIN_UPDATE_INTERVAL,
+            )
+            seconds = MIN_UPDATE_INTERVAL
+        update_interval = timedelta(seconds=seconds)
 
         _LOGGER.info(
             f"🔄 Battery Data Coordinator: Initialized with {update_interval.total_seconds()}s update interval"
@@ -549,20 +831,132 @@ class BatteryDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
         self.config_entry = config_entry
-        self.growatt_username = config_entry.data.get("growatt_username")
-        self.growatt_password = config_entry.data.get("growatt_password")
-        self.pv_max_power = config_entry.data.get("pv_max_power", 10.0)
-        self.battery_capacity = config_entry.data.get("battery_capacity", 10.0)
-        self.min_discharge_percentage = config_entry.data.get(
-            "min_discharge_percentage", 10
+        self._original_update_interval = update_interval
+        self.device_name = config.get(CONF_NAME, DEFAULT_NAME)
+        self.growatt_username = config.get(CONF_GROWATT_USERNAME)
+        self.growatt_password = config.get(CONF_GROWATT_PASSWORD)
+        self.low_battery_threshold = config.get(
+            CONF_LOW_BATTERY_THRESHOLD, DEFAULT_LOW_BATTERY_THRESHOLD
+        )
+        self.pv_max_power = config.get(CONF_PV_MAX_POWER, DEFAULT_PV_MAX_POWER)
+        self.battery_capacity = config.get(
+            CONF_BATTERY_CAPACITY, DEFAULT_BATTERY_CAPACITY
+        )
+        self.min_discharge_percentage = config.get(
+            CONF_MIN_DISCHARGE_PERCENTAGE, DEFAULT_MIN_DISCHARGE_PERCENTAGE
+        )
+        self.panel_tilt_angle = config.get(
+            CONF_PANEL_TILT_ANGLE, DEFAULT_PANEL_TILT_ANGLE
+        )
+        self.panel_orientation = config.get(
+            CONF_PANEL_ORIENTATION, DEFAULT_PANEL_ORIENTATION
+        )
+        self.avg_daytime_load = config.get(
+            CONF_AVG_DAYTIME_LOAD, DEFAULT_AVG_DAYTIME_LOAD
+        )
+        self.avg_nighttime_load = config.get(
+            CONF_AVG_NIGHTTIME_LOAD, DEFAULT_AVG_NIGHTTIME_LOAD
+        )
+
+        # Last successful fetch, reused for quick refreshes and on errors
+        self._cache = None
+        self._cache_ts = 0.0
+        self._last_good = None
+
+        # Sun times for (today, tomorrow), recomputed when the date rolls over
+        self._sun_day = None
+        self._sun_times = ({}, {})
+        # Energy forecasts keyed by location, panel setup and quarter hour
+        self._forecast_cache = {}
+        self._async_update_location()
+        config_entry.async_on_unload(
+            hass.bus.async_listen(
+                EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+            )
         )
-        self.panel_tilt_angle = config_entry.data.get("panel_tilt_angle", 30.0)
-        self.panel_orientation = config_entry.data.get("panel_orientation", 180.0)
-        self.avg_daytime_load = config_entry.data.get("avg_daytime_load", 2.0)
-        self.avg_nighttime_load = config_entry.data.get("avg_nighttime_load", 1.0)
+
+    @callback
+    def _async_update_location(self) -> None:
+        """Build the astral observer for Home Assistant's configured location."""
+        self.latitude = self.hass.config.latitude
+        self.longitude = self.hass.config.longitude
+        self.timezone = self.hass.config.time_zone
+        self.zone = dt_util.get_time_zone(self.timezone)
+        self._observer = (
+            LocationInfo(
+                "Home", "Home", self.timezone, self.latitude, self.longitude
+            ).observer
+            if ASTRAL_V2
+            else None
+        )
+        self._sun_day = None
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Rebuild the observer when the home location changes."""
+        self._async_update_location()
+
+    def _compute_sun(self, day) -> dict:
+        """Get sun times for a day at the configured location."""
+        return _with_iso_times(
+            get_sun_times(
+                self.latitude, self.longitude, self.timezone, day, self._observer
+            )
+        )
+
+    def energy_forecast(
+        self,
+        latitude: float,
+        longitude: float,
+        timezone: str,
+        panel_tilt: float,
+        panel_orientation: float,
+        pv_max_power: float,
+        include_intervals: bool = True,
+    ) -> dict:
+        """Return the energy forecast, recalculated once per 15-minute interval.
+
+        A totals-only forecast is upgraded to the full one the first time the
+        interval lists are asked for.
+        """
+        now = dt_util.now(
+            self.zone if timezone == self.timezone else dt_util.get_time_zone(timezone)
+        )
+        bucket = now.replace(minute=now.minute // 15 * 15, second=0, microsecond=0)
+        key = (latitude, longitude, timezone, panel_tilt, panel_orientation)
+        key += (pv_max_power, bucket)
+
+        forecast = self._forecast_cache.get(key)
+        if forecast is None or (
+            include_intervals and "full_day_forecast" not in forecast
+        ):
+            forecast = calculate_energy_forecast(
+                latitude=latitude,
+                longitude=longitude,
+                timezone=timezone,
+                panel_tilt=panel_tilt,
+                panel_orientation=panel_orientation,
+                pv_max_power=pv_max_power,
+                start_time=now,
+                include_intervals=include_intervals,
+            )
+            # Forecasts for earlier intervals are never asked for again
+            self._forecast_cache = {
+                k: v for k, v in self._forecast_cache.items() if k[-1] >= bucket
+            }
+            self._forecast_cache[key] = forecast
+        return forecast
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch battery data."""
+        # Rapid refresh requests within half an interval reuse the last fetch
+        now = time.monotonic()
+        if (
+            self._cache is not None
+            and now - self._cache_ts < self.update_interval.total_seconds() / 2
+        ):
+            return self._cache
+
         try:
             # TODO: Implement actual GROWATT API communication using:
             # self.growatt_username and self.growatt_password
@@ -570,26 +964,63 @@ class BatteryDataUpdateCoordinator(DataUpdateCoordinator):
             # self.pv_max_power (kW), self.battery_capacity (kWh), self.min_discharge_percentage (%)
             # self.panel_tilt_angle (°), self.panel_orientation (°)
             # For now, we'll simulate battery data
-            _LOGGER.debug(
-                "🔋 Fetching battery data for GROWATT user: %s (PV: %skW, Battery: %skWh, Min discharge: %s%%, Panel tilt: %s°, Orientation: %s°)",
-                self.growatt_username,
-                self.pv_max_power,
-                self.battery_capacity,
-                self.min_discharge_percentage,
-                self.panel_tilt_angle,
-                self.panel_orientation,
-            )
-            return {
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "🔋 Fetching battery data for GROWATT user: %s (PV: %skW, Battery: %skWh, Min discharge: %s%%, Panel tilt: %s°, Orientation: %s°)",
+                    self.growatt_username,
+                    self.pv_max_power,
+                    self.battery_capacity,
+                    self.min_discharge_percentage,
+                    self.panel_tilt_angle,
+                    self.panel_orientation,
+                )
+
+            # Sun times change once a day; compute them here so every sun
+            # sensor shares the same result instead of recomputing on read
+            today = dt_util.now(self.zone).date()
+            if today != self._sun_day:
+                self._sun_times = (
+                    self._compute_sun(today),
+                    self._compute_sun(today + timedelta(days=1)),
+                )
+                self._sun_day = today
+
+            result = {
                 ATTR_BATTERY_LEVEL: 85,  # Simulated battery level
                 ATTR_IS_CHARGING: False,  # Simulated charging status
+                ATTR_SUN_TIMES: self._sun_times[0],
+                ATTR_SUN_TIMES_TOMORROW: self._sun_times[1],
             }
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with GROWATT server: {err}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.debug("GROWATT fetch failed", exc_info=True)
+            if self._last_good is not None:
+                _LOGGER.warning(
+                    "Error communicating with GROWATT server, "
+                    "using last known data: %s",
+                    err,
+                )
+                return self._last_good
+            raise UpdateFailed(
+                "Error communicating with GROWATT server: %s" % err
+            ) from err
+
+        # Hand back the previous object when nothing changed so listeners can
+        # skip work with an identity check
+        if result == self._last_good:
+            result = self._last_good
+
+        self._cache = self._last_good = result
+        self._cache_ts = now
+        return result
 
 
 class BatteryLevelSensor(CoordinatorEntity, SensorEntity):
     """Battery level sensor."""
 
+    # The Home Assistant base classes still provide a __dict__, but the values
+    # read on every state update live in slots
+    __slots__ = ("_config_entry", "_threshold", "_attrs")
+
     def __init__(
         self,
         coordinator: BatteryDataUpdateCoordinator,
@@ -598,60 +1029,67 @@ class BatteryLevelSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        self._attr_name = (
-            f"{config_entry.data.get('name', 'GROWATT Battery Discharge Guard')} Level"
-        )
+        self._attr_name = f"{coordinator.device_name} Level"
         self._attr_unique_id = f"{config_entry.entry_id}_battery_level"
         self._attr_device_class = SensorDeviceClass.BATTERY
         self._attr_native_unit_of_measurement = PERCENTAGE
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self) -> int:
-        """Return the battery level."""
-        return self.coordinator.data.get(ATTR_BATTERY_LEVEL)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "threshold": self._config_entry.data.get("low_battery_threshold", 20),
-            "is_low": self.native_value
-            < self._config_entry.data.get("low_battery_threshold", 20),
-            "pv_max_power": {
-                "value": self._config_entry.data.get("pv_max_power", 10.0),
-                "unit": UNIT_KW,
-            },
+        # Configuration doesn't change for the lifetime of the entity, so build
+        # the attributes once from the coordinator's values and only update
+        # is_low on coordinator ticks. They are exposed through a read-only
+        # view so consumers can't mutate the cached dict.
+        self._threshold = coordinator.low_battery_threshold
+        self._attrs = {
+            "threshold": self._threshold,
+            "is_low": False,
+            "pv_max_power": {"value": coordinator.pv_max_power, "unit": UNIT_KW},
             "battery_capacity": {
-                "value": self._config_entry.data.get("battery_capacity", 10.0),
+                "value": coordinator.battery_capacity,
                 "unit": UNIT_KWH,
             },
             "min_discharge_percentage": {
-                "value": self._config_entry.data.get("min_discharge_percentage", 10),
+                "value": coordinator.min_discharge_percentage,
                 "unit": UNIT_PERCENTAGE,
             },
             "panel_tilt_angle": {
-                "value": self._config_entry.data.get("panel_tilt_angle", 30.0),
+                "value": coordinator.panel_tilt_angle,
                 "unit": UNIT_DEGREES,
             },
             "panel_orientation": {
-                "value": self._config_entry.data.get("panel_orientation", 180.0),
+                "value": coordinator.panel_orientation,
                 "unit": UNIT_DEGREES,
             },
             "avg_daytime_load": {
-                "value": self._config_entry.data.get("avg_daytime_load", 2.0),
+                "value": coordinator.avg_daytime_load,
                 "unit": UNIT_KW,
             },
             "avg_nighttime_load": {
-                "value": self._config_entry.data.get("avg_nighttime_load", 1.0),
+                "value": coordinator.avg_nighttime_load,
                 "unit": UNIT_KW,
             },
         }
+        self._attr_extra_state_attributes = MappingProxyType(self._attrs)
+        self._update_state()
+
+    def _update_state(self) -> None:
+        """Store the battery level and low flag from the coordinator data."""
+        level = (self.coordinator.data or {}).get(ATTR_BATTERY_LEVEL)
+        self._attr_native_value = level
+        self._attrs["is_low"] = level is not None and level < self._threshold
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
 
 
 class BatteryChargingSensor(CoordinatorEntity, SensorEntity):
     """Battery charging status sensor."""
 
+    __slots__ = ("_config_entry",)
+
     def __init__(
         self,
         coordinator: BatteryDataUpdateCoordinator,
@@ -660,270 +1098,174 @@ class BatteryChargingSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        self._attr_name = f"{config_entry.data.get('name', 'GROWATT Battery Discharge Guard')} Charging"
+        self._attr_name = f"{coordinator.device_name} Charging"
         self._attr_unique_id = f"{config_entry.entry_id}_battery_charging"
         self._attr_device_class = SensorDeviceClass.ENUM
-        self._attr_options = ["charging", "not_charging", "unknown"]
+        self._attr_options = [STATE_CHARGING, STATE_NOT_CHARGING, STATE_UNKNOWN]
+        self._update_state()
+
+    def _update_state(self) -> None:
+        """Store the charging status from the coordinator data."""
+        is_charging = (self.coordinator.data or {}).get(ATTR_IS_CHARGING)
+        self._attr_native_value = (
+            STATE_UNKNOWN
+            if is_charging is None
+            else _CHARGING_STATES[bool(is_charging)]
+        )
 
-    @property
-    def native_value(self) -> str:
-        """Return the charging status."""
-        is_charging = self.coordinator.data.get(ATTR_IS_CHARGING)
-        if is_charging is None:
-            return "unknown"
-        return "charging" if is_charging else "not_charging"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
 
 
-class SunsetTimeSensor(SensorEntity):
+class SunsetTimeSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing the expected sunset time."""
 
     def __init__(
         self, coordinator: BatteryDataUpdateCoordinator, config_entry: ConfigEntry, hass
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.config_entry = config_entry
         self.hass = hass
-        self._attr_name = f"{config_entry.data[CONF_NAME]} Sunset Time"
+        self._attr_name = f"{coordinator.device_name} Sunset Time"
         self._attr_unique_id = f"{config_entry.entry_id}_sunset_time"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
         self._attr_icon = "mdi:weather-sunset"
+        self._attrs_sun = None
+        self._attrs_cache = {}
 
     @property
-    def state(self) -> str | None:
+    def native_value(self) -> datetime | None:
         """Return the sunset time."""
-        try:
-            # Get Home Assistant's configured location
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
-
-            # Calculate sunset for today
-            today = datetime.now().date()
-            s = get_sun_times(latitude, longitude, timezone, today)
-
-            if s and "sunset" in s:
-                return s["sunset"].isoformat()
-            return None
-        except Exception as e:
-            _LOGGER.error("Error calculating sunset time: %s", e)
-            return None
+        return self.coordinator.data[ATTR_SUN_TIMES].get("sunset")
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        try:
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
-
-            today = datetime.now().date()
-            s = get_sun_times(latitude, longitude, timezone, today)
-
-            if s:
-                attributes = {
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "timezone": timezone,
-                }
-
-                # Add sun times if available
-                for key in ["sunrise", "sunset", "dawn", "dusk"]:
-                    if key in s and s[key]:
-                        attributes[key] = s[key].isoformat()
-
-                return attributes
-
-            return {
-                "latitude": latitude,
-                "longitude": longitude,
-                "timezone": timezone,
-            }
-        except Exception as e:
-            _LOGGER.error("Error calculating sun times: %s", e)
-            return {}
+        s = self.coordinator.data[ATTR_SUN_TIMES]
+        # The sun times only change when the date rolls over, so rebuild the
+        # attributes only when the coordinator hands us a different day
+        if s is self._attrs_sun:
+            return self._attrs_cache
+
+        attributes = {
+            "latitude": self.hass.config.latitude,
+            "longitude": self.hass.config.longitude,
+            "timezone": self.hass.config.time_zone,
+        }
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+        # Add sun times if available
+        for key in ["sunrise", "sunset", "dawn", "dusk"]:
+            if s.get(key):
+                attributes[key] = s[f"{key}_iso"]
 
-    async def async_update(self) -> None:
-        """Update the entity."""
-        # This entity updates based on time/location, not coordinator data
-        pass
+        self._attrs_sun = s
+        self._attrs_cache = attributes
+        return attributes
 
 
-class SunsetCountdownSensor(SensorEntity):
+class SunsetCountdownSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing remaining time until sunset."""
 
     def __init__(
         self, coordinator: BatteryDataUpdateCoordinator, config_entry: ConfigEntry, hass
     ) -> None:
         """Initialize the sensor."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.config_entry = config_entry
         self.hass = hass
-        self._attr_name = f"{config_entry.data[CONF_NAME]} Time Until Sunset"
+        self._attr_name = f"{coordinator.device_name} Time Until Sunset"
         self._attr_unique_id = f"{config_entry.entry_id}_time_until_sunset"
         self._attr_device_class = SensorDeviceClass.DURATION
         self._attr_native_unit_of_measurement = "s"  # seconds
         self._attr_icon = "mdi:timer-sand"
+        self._cached_ts = None
+        self._cached = (None, {})
+
+    def _next_sunset(self, now: datetime) -> tuple[dict | None, bool]:
+        """Return the sun times holding the next sunset and whether it's night."""
+        s = self.coordinator.data[ATTR_SUN_TIMES]
+        if "sunset" not in s or "sunrise" not in s:
+            return None, False
+
+        if s["sunset"] > now:
+            # Before sunset today
+            return s, False
+
+        # After sunset - it's nighttime until tomorrow's sunrise
+        s_tomorrow = self.coordinator.data[ATTR_SUN_TIMES_TOMORROW]
+        if "sunrise" in s_tomorrow and now < s_tomorrow["sunrise"]:
+            return (s_tomorrow if "sunset" in s_tomorrow else s), True
+
+        return (s_tomorrow if "sunset" in s_tomorrow else None), False
+
+    def _compute(self) -> tuple[float | None, dict[str, Any]]:
+        """Return the state and attributes, computed at most once per second."""
+        now = dt_util.utcnow()
+        second = now.replace(microsecond=0)
+        if second == self._cached_ts:
+            return self._cached
+
+        attributes = {
+            "latitude": self.hass.config.latitude,
+            "longitude": self.hass.config.longitude,
+            "timezone": self.hass.config.time_zone,
+        }
 
-    @property
-    def state(self) -> float | None:
-        """Return the time until sunset in seconds."""
-        try:
-            # Get Home Assistant's configured location
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
-
-            # Calculate sunset for today
-            today = datetime.now().date()
-            s = get_sun_times(latitude, longitude, timezone, today)
-
-            if not s or "sunset" not in s or "sunrise" not in s:
-                return None
-
-            sunset_time = s["sunset"]
-            sunrise_time = s["sunrise"]
-
-            # Calculate time difference
-            now = datetime.now(sunset_time.tzinfo)
+        next_sun, is_nighttime = self._next_sunset(now)
+        if next_sun is None:
+            state = None
+        elif is_nighttime:
+            # It's nighttime (between sunset and sunrise) - return 0
+            state = 0.0
+            attributes = {
+                "next_sunset": next_sun["sunset_iso"],
+                "human_readable": "0h 0m (nighttime)",
+                "hours_remaining": 0,
+                "minutes_remaining": 0,
+                "is_nighttime": True,
+                **attributes,
+            }
+        else:
+            state = (next_sun["sunset"] - now).total_seconds()
+            hours, rest = divmod(int(state), 3600)
+            minutes = rest // 60
+            attributes = {
+                "next_sunset": next_sun["sunset_iso"],
+                "human_readable": f"{hours}h {minutes}m",
+                "hours_remaining": hours,
+                "minutes_remaining": minutes,
+                "is_nighttime": False,
+                **attributes,
+            }
 
-            if sunset_time > now:
-                # Before sunset today - return time until sunset
-                time_diff = sunset_time - now
-                return time_diff.total_seconds()
-            else:
-                # After sunset - check if we're before tomorrow's sunrise
-                tomorrow = today + timedelta(days=1)
-                s_tomorrow = get_sun_times(latitude, longitude, timezone, tomorrow)
-                if s_tomorrow and "sunrise" in s_tomorrow:
-                    sunrise_tomorrow = s_tomorrow["sunrise"]
-                    if now < sunrise_tomorrow:
-                        # It's nighttime (between sunset and sunrise) - return 0
-                        return 0.0
-
-                # After sunrise - calculate time until next sunset
-                if s_tomorrow and "sunset" in s_tomorrow:
-                    sunset_tomorrow = s_tomorrow["sunset"]
-                    time_diff = sunset_tomorrow - now
-                    return time_diff.total_seconds()
-                return None
+        self._cached_ts = second
+        self._cached = (state, attributes)
+        return self._cached
 
-        except Exception as e:
-            _LOGGER.error("Error calculating time until sunset: %s", e)
-            return None
+    @property
+    def native_value(self) -> float | None:
+        """Return the time until sunset in seconds."""
+        return self._compute()[0]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        try:
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
-
-            today = datetime.now().date()
-            s = get_sun_times(latitude, longitude, timezone, today)
-
-            if not s or "sunset" not in s or "sunrise" not in s:
-                return {
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "timezone": timezone,
-                }
-
-            sunset_time = s["sunset"]
-            sunrise_time = s["sunrise"]
-            now = datetime.now(sunset_time.tzinfo)
-
-            if sunset_time > now:
-                # Before sunset today - show time until sunset
-                time_diff = sunset_time - now
-                hours = int(time_diff.total_seconds() // 3600)
-                minutes = int((time_diff.total_seconds() % 3600) // 60)
-                human_readable = f"{hours}h {minutes}m"
-                next_sunset = sunset_time
-
-                return {
-                    "next_sunset": next_sunset.isoformat(),
-                    "human_readable": human_readable,
-                    "hours_remaining": hours,
-                    "minutes_remaining": minutes,
-                    "is_nighttime": False,
-                    "latitude": latitude,
-                    "longitude": longitude,
-                    "timezone": timezone,
-                }
-            else:
-                # After sunset - check if we're before tomorrow's sunrise
-                tomorrow = today + timedelta(days=1)
-                s_tomorrow = get_sun_times(latitude, longitude, timezone, tomorrow)
-
-                if s_tomorrow and "sunrise" in s_tomorrow:
-                    sunrise_tomorrow = s_tomorrow["sunrise"]
-                    if now < sunrise_tomorrow:
-                        # It's nighttime (between sunset and sunrise) - show 0
-                        return {
-                            "next_sunset": (
-                                s_tomorrow.get("sunset", sunset_time).isoformat()
-                                if s_tomorrow
-                                else sunset_time.isoformat()
-                            ),
-                            "human_readable": "0h 0m (nighttime)",
-                            "hours_remaining": 0,
-                            "minutes_remaining": 0,
-                            "is_nighttime": True,
-                            "latitude": latitude,
-                            "longitude": longitude,
-                            "timezone": timezone,
-                        }
-
-                # After sunrise - show time until next sunset
-                if s_tomorrow and "sunset" in s_tomorrow:
-                    next_sunset = s_tomorrow["sunset"]
-                    time_diff = next_sunset - now
-                    hours = int(time_diff.total_seconds() // 3600)
-                    minutes = int((time_diff.total_seconds() % 3600) // 60)
-                    human_readable = f"{hours}h {minutes}m"
-
-                    return {
-                        "next_sunset": next_sunset.isoformat(),
-                        "human_readable": human_readable,
-                        "hours_remaining": hours,
-                        "minutes_remaining": minutes,
-                        "is_nighttime": False,
-                        "latitude": latitude,
-                        "longitude": longitude,
-                        "timezone": timezone,
-                    }
-                else:
-                    return {
-                        "latitude": latitude,
-                        "longitude": longitude,
-                        "timezone": timezone,
-                    }
-
-        except Exception as e:
-            _LOGGER.error("Error calculating countdown attributes: %s", e)
-            return {}
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
-
-    async def async_update(self) -> None:
-        """Update the entity."""
-        # This entity updates based on time/location, not coordinator data
-        pass
+        return self._compute()[1]
 
 
 class SolarEnergyForecastSensor(SensorEntity):
     """Sensor showing forecasted solar energy production until sunset."""
 
+    # The interval lists are only read live by dashboards; keeping them out of
+    # the recorder avoids storing ~190 dicts on every state change
+    _unrecorded_attributes = frozenset(
+        {"forecast_15min_intervals", "full_day_forecast_15min_intervals"}
+    )
+
     def __init__(
         self, coordinator: BatteryDataUpdateCoordinator, config_entry: ConfigEntry, hass
     ) -> None:
@@ -931,28 +1273,44 @@ class SolarEnergyForecastSensor(SensorEntity):
         self.coordinator = coordinator
         self.config_entry = config_entry
         self.hass = hass
-        self._attr_name = f"{config_entry.data[CONF_NAME]} Solar Energy Forecast"
+        self._attr_name = f"{coordinator.device_name} Solar Energy Forecast"
         self._attr_unique_id = f"{config_entry.entry_id}_solar_energy_forecast"
         self._attr_device_class = SensorDeviceClass.ENERGY
         self._attr_native_unit_of_measurement = "kWh"
         self._attr_state_class = SensorStateClass.TOTAL
         self._attr_icon = "mdi:solar-power"
 
+        # Option changes reload the entry and recreate the sensor
+        self._panel_tilt = coordinator.panel_tilt_angle
+        self._panel_orientation = coordinator.panel_orientation
+        self._pv_max_power = coordinator.pv_max_power
+        self._avg_daytime_load = coordinator.avg_daytime_load
+        self._avg_nighttime_load = coordinator.avg_nighttime_load
+        self._attrs_forecast = None
+        self._attrs_cache = {}
+        # Attributes reported when the forecast cannot be calculated
+        self._error_attributes = {
+            "error": "Failed to calculate forecast",
+            "panel_tilt_angle": self._panel_tilt,
+            "panel_orientation": self._panel_orientation,
+            "pv_max_power_kw": self._pv_max_power,
+        }
+
     @property
     def state(self) -> float | None:
         """Return the forecasted energy production until sunset."""
         try:
-            # Get Home Assistant's configured location
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
+            # Home Assistant's configured location, kept current by the coordinator
+            latitude = self.coordinator.latitude
+            longitude = self.coordinator.longitude
+            timezone = self.coordinator.timezone
 
             # Get solar panel configuration
-            panel_tilt = self.config_entry.data.get("panel_tilt_angle", 30.0)
-            panel_orientation = self.config_entry.data.get("panel_orientation", 180.0)
-            pv_max_power = self.config_entry.data.get("pv_max_power", 10.0)
-            avg_daytime_load = self.config_entry.data.get("avg_daytime_load", 2.0)
-            avg_nighttime_load = self.config_entry.data.get("avg_nighttime_load", 1.0)
+            panel_tilt = self._panel_tilt
+            panel_orientation = self._panel_orientation
+            pv_max_power = self._pv_max_power
+            avg_daytime_load = self._avg_daytime_load
+            avg_nighttime_load = self._avg_nighttime_load
 
             _LOGGER.info(
                 "🌞 Solar Energy Forecast: Starting calculation - "
@@ -962,14 +1320,15 @@ class SolarEnergyForecastSensor(SensorEntity):
                 f"Loads: {avg_daytime_load}kW day/{avg_nighttime_load}kW night"
             )
 
-            # Calculate forecast
-            forecast_data = calculate_energy_forecast(
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone,
-                panel_tilt=panel_tilt,
-                panel_orientation=panel_orientation,
-                pv_max_power=pv_max_power,
+            # The state only needs the totals, not the per-interval lists
+            forecast_data = self.coordinator.energy_forecast(
+                latitude,
+                longitude,
+                timezone,
+                panel_tilt,
+                panel_orientation,
+                pv_max_power,
+                include_intervals=False,
             )
 
             total_energy = forecast_data.get("total_energy", 0)
@@ -986,128 +1345,91 @@ class SolarEnergyForecastSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes with detailed forecast."""
-        try:
-            # Get Home Assistant's configured location
-            latitude = self.hass.config.latitude
-            longitude = self.hass.config.longitude
-            timezone = self.hass.config.time_zone
+        # Home Assistant's configured location, kept current by the coordinator
+        latitude = self.coordinator.latitude
+        longitude = self.coordinator.longitude
+        timezone = self.coordinator.timezone
 
-            # Get solar panel configuration
-            panel_tilt = self.config_entry.data.get("panel_tilt_angle", 30.0)
-            panel_orientation = self.config_entry.data.get("panel_orientation", 180.0)
-            pv_max_power = self.config_entry.data.get("pv_max_power", 10.0)
-            avg_daytime_load = self.config_entry.data.get("avg_daytime_load", 2.0)
-            avg_nighttime_load = self.config_entry.data.get("avg_nighttime_load", 1.0)
+        # Get solar panel configuration
+        panel_tilt = self._panel_tilt
+        panel_orientation = self._panel_orientation
+        pv_max_power = self._pv_max_power
+        avg_daytime_load = self._avg_daytime_load
+        avg_nighttime_load = self._avg_nighttime_load
 
-            _LOGGER.debug("📋 Solar Energy Forecast: Calculating attributes")
+        _LOGGER.debug("📋 Solar Energy Forecast: Calculating attributes")
 
-            # Calculate forecast
-            forecast_data = calculate_energy_forecast(
-                latitude=latitude,
-                longitude=longitude,
-                timezone=timezone,
-                panel_tilt=panel_tilt,
-                panel_orientation=panel_orientation,
-                pv_max_power=pv_max_power,
+        # Calculate forecast (shared with the other property for this interval)
+        try:
+            forecast_data = self.coordinator.energy_forecast(
+                latitude,
+                longitude,
+                timezone,
+                panel_tilt,
+                panel_orientation,
+                pv_max_power,
             )
+        except Exception as e:
+            _LOGGER.error("Error calculating forecast attributes: %s", e)
+            return self._error_attributes
+
+        # The attributes only change along with the cached forecast
+        if forecast_data is self._attrs_forecast:
+            return self._attrs_cache
+
+        # Prepare attributes
+        attributes = {
+            "total_energy_kwh": forecast_data.get("total_energy", 0),
+            "forecast_intervals": len(forecast_data.get("forecast", [])),
+            "total_daily_energy_kwh": forecast_data.get("total_daily_energy", 0),
+            "full_day_intervals": len(forecast_data.get("full_day_forecast", [])),
+            "panel_tilt_angle": panel_tilt,
+            "panel_orientation": panel_orientation,
+            "pv_max_power_kw": pv_max_power,
+            "avg_daytime_load_kw": avg_daytime_load,
+            "avg_nighttime_load_kw": avg_nighttime_load,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone,
+        }
 
-            # Prepare attributes
-            attributes = {
-                "total_energy_kwh": forecast_data.get("total_energy", 0),
-                "forecast_intervals": len(forecast_data.get("forecast", [])),
-                "total_daily_energy_kwh": forecast_data.get("total_daily_energy", 0),
-                "full_day_intervals": len(forecast_data.get("full_day_forecast", [])),
-                "panel_tilt_angle": panel_tilt,
-                "panel_orientation": panel_orientation,
-                "pv_max_power_kw": pv_max_power,
-                "avg_daytime_load_kw": avg_daytime_load,
-                "avg_nighttime_load_kw": avg_nighttime_load,
-                "latitude": latitude,
-                "longitude": longitude,
-                "timezone": timezone,
-            }
+        _LOGGER.debug(
+            f"📈 Solar Energy Forecast: Attributes calculated - "
+            f"Remaining: {attributes['total_energy_kwh']:.3f}kWh ({attributes['forecast_intervals']} intervals), "
+            f"Daily: {attributes['total_daily_energy_kwh']:.3f}kWh ({attributes['full_day_intervals']} intervals)"
+        )
 
-            _LOGGER.debug(
-                f"📈 Solar Energy Forecast: Attributes calculated - "
-                f"Remaining: {attributes['total_energy_kwh']:.3f}kWh ({attributes['forecast_intervals']} intervals), "
-                f"Daily: {attributes['total_daily_energy_kwh']:.3f}kWh ({attributes['full_day_intervals']} intervals)"
-            )
+        # Add forecast data (remaining energy from now until sunset)
+        if "forecast" in forecast_data:
+            attributes["forecast_15min_intervals"] = forecast_data["forecast"]
 
-            # Add forecast data (remaining energy from now until sunset)
-            if "forecast" in forecast_data:
-                attributes["forecast_15min_intervals"] = forecast_data["forecast"]
-
-            # Add full day forecast data (24 hours in 15-minute intervals)
-            if "full_day_forecast" in forecast_data:
-                attributes["full_day_forecast_15min_intervals"] = forecast_data[
-                    "full_day_forecast"
-                ]
-
-            # Add time information
-            if "sunrise_time" in forecast_data:
-                attributes["sunrise_time"] = forecast_data["sunrise_time"]
-
-            if "sunset_time" in forecast_data:
-                attributes["sunset_time"] = forecast_data["sunset_time"]
-
-            if "forecast_start" in forecast_data:
-                attributes["forecast_start"] = forecast_data["forecast_start"]
-
-            if "forecast_day" in forecast_data:
-                attributes["forecast_day"] = forecast_data["forecast_day"]
-
-            # Add summary statistics for remaining forecast
-            forecast = forecast_data.get("forecast", [])
-            if forecast:
-                # Calculate peak power time from remaining forecast
-                max_power_entry = max(forecast, key=lambda x: x.get("power_kw", 0))
-                attributes["peak_power_time_remaining"] = max_power_entry.get("time")
-                attributes["peak_power_kw_remaining"] = max_power_entry.get(
-                    "power_kw", 0
-                )
+        # Add full day forecast data (24 hours in 15-minute intervals)
+        if "full_day_forecast" in forecast_data:
+            attributes["full_day_forecast_15min_intervals"] = forecast_data[
+                "full_day_forecast"
+            ]
 
-                # Calculate average power for remaining forecast
-                total_power = sum(entry.get("power_kw", 0) for entry in forecast)
-                attributes["average_power_kw_remaining"] = (
-                    round(total_power / len(forecast), 3) if forecast else 0
-                )
+        # Add time information
+        if "sunrise_time" in forecast_data:
+            attributes["sunrise_time"] = forecast_data["sunrise_time"]
 
-            # Add summary statistics for full day forecast
-            full_day_forecast = forecast_data.get("full_day_forecast", [])
-            if full_day_forecast:
-                # Calculate peak power time for full day
-                max_power_entry_day = max(
-                    full_day_forecast, key=lambda x: x.get("power_kw", 0)
-                )
-                attributes["peak_power_time_daily"] = max_power_entry_day.get("time")
-                attributes["peak_power_kw_daily"] = max_power_entry_day.get(
-                    "power_kw", 0
-                )
+        if "sunset_time" in forecast_data:
+            attributes["sunset_time"] = forecast_data["sunset_time"]
 
-                # Calculate average power for full day
-                total_power_day = sum(
-                    entry.get("power_kw", 0) for entry in full_day_forecast
-                )
-                attributes["average_power_kw_daily"] = (
-                    round(total_power_day / len(full_day_forecast), 3)
-                    if full_day_forecast
-                    else 0
-                )
+        if "forecast_start" in forecast_data:
+            attributes["forecast_start"] = forecast_data["forecast_start"]
 
-            return attributes
+        if "forecast_day" in forecast_data:
+            attributes["forecast_day"] = forecast_data["forecast_day"]
 
-        except Exception as e:
-            _LOGGER.error("Error calculating forecast attributes: %s", e)
-            return {
-                "error": "Failed to calculate forecast",
-                "panel_tilt_angle": self.config_entry.data.get(
-                    "panel_tilt_angle", 30.0
-                ),
-                "panel_orientation": self.config_entry.data.get(
-                    "panel_orientation", 180.0
-                ),
-                "pv_max_power_kw": self.config_entry.data.get("pv_max_power", 10.0),
-            }
+        # Add summary statistics for the remaining and full day forecast
+        for key in _POWER_STATS:
+            if key in forecast_data:
+                attributes[key] = forecast_data[key]
+
+        self._attrs_forecast = forecast_data
+        self._attrs_cache = attributes
+        return attributes
 
     @property
     def available(self) -> bool:
@@ -0,0 +1,167 @@
+"""Solar position and panel irradiance kernels shared by the forecasts."""
+
+import math
+
+import numpy as np
+
+# Numba is optional; without it the kernels run as plain Python
+try:
+    from numba import njit, prange
+
+    USE_NUMBA = True
+except ImportError:
+    USE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Return the function unchanged when Numba is not installed."""
+        return lambda func: func
+
+
+# Log of the clear-sky transmission base, so transmission is a single exp()
+_LN_TRANSMISSION = math.log(0.78)
+
+# Julian day of the J2000.0 epoch and the day-number offset of the
+# Gregorian-to-Julian conversion
+_J2000 = 2451545.0
+_JD_EPOCH = 1721119
+
+# Earth's axial tilt (obliquity of the ecliptic) and its sine
+_OBLIQUITY = math.radians(23.439)
+_SIN_OBLIQUITY = math.sin(_OBLIQUITY)
+
+# Hour angle advances 15° per hour
+_DEG_PER_HOUR = 15.0
+
+
+def julian_day_number(day) -> int:
+    """Return the Julian day number of a date (or the date part of a datetime)."""
+    a = (14 - day.month) // 12
+    y = day.year - a
+    m = day.month + 12 * a - 3
+    return (
+        day.day
+        + (153 * m + 2) // 5
+        + 365 * y
+        + y // 4
+        - y // 100
+        + y // 400
+        + _JD_EPOCH
+    )
+
+
+@njit(cache=True, fastmath=True)
+def ephemeris_position(
+    jd: float,
+    mst: float,
+    sin_lat: float,
+    cos_lat: float,
+    longitude: float,
+) -> tuple[float, float]:
+    """Calculate solar elevation and azimuth in degrees.
+
+    Low-precision ephemeris (mean longitude and anomaly with a two-term equation
+    of center), taking the Julian day and the mean solar time in hours.
+    """
+    # Calculate solar position
+    n = jd - _J2000
+    L = (280.460 + 0.9856474 * n) % 360
+    g = math.radians((357.528 + 0.9856003 * n) % 360)
+    lambda_sun = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
+
+    # Declination
+    delta = math.asin(_SIN_OBLIQUITY * math.sin(lambda_sun))
+
+    # Hour angle (corrected formula)
+    h = math.radians(_DEG_PER_HOUR * (mst - 12) - longitude)
+
+    # Each sine/cosine is needed by both elevation and azimuth
+    sin_d = math.sin(delta)
+    cos_d = math.cos(delta)
+    sin_h = math.sin(h)
+    cos_h = math.cos(h)
+
+    # Solar elevation
+    elevation = math.asin(sin_lat * sin_d + cos_lat * cos_d * cos_h)
+
+    # Solar azimuth (corrected to give proper compass direction)
+    azimuth = math.atan2(sin_h, cos_h * sin_lat - sin_d / cos_d * cos_lat)
+
+    # Convert azimuth to compass bearing (0° = North, 90° = East, 180° = South, 270° = West)
+    return math.degrees(elevation), (math.degrees(azimuth) + 180) % 360
+
+
+def ephemeris_position_array(
+    jd: np.ndarray,
+    mst: np.ndarray,
+    sin_lat: float,
+    cos_lat: float,
+    longitude: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized ephemeris_position over arrays of Julian days and solar times."""
+    # Calculate solar position
+    n = jd - _J2000
+    L = np.mod(280.460 + 0.9856474 * n, 360)
+    g = np.radians(np.mod(357.528 + 0.9856003 * n, 360))
+    lambda_sun = np.radians(L + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+
+    # Declination
+    delta = np.arcsin(_SIN_OBLIQUITY * np.sin(lambda_sun))
+
+    # Hour angle from mean solar time
+    h = np.radians(_DEG_PER_HOUR * (mst - 12) - longitude)
+
+    sin_d = np.sin(delta)
+    cos_d = np.cos(delta)
+    cos_h = np.cos(h)
+    elevation = np.arcsin(sin_lat * sin_d + cos_lat * cos_d * cos_h)
+    azimuth = np.arctan2(np.sin(h), cos_h * sin_lat - sin_d / cos_d * cos_lat)
+
+    # Convert azimuth to compass bearing (0° = North, 180° = South)
+    return np.degrees(elevation), np.mod(np.degrees(azimuth) + 180, 360)
+
+
+@njit(cache=True, fastmath=True)
+def panel_irradiance(
+    solar_elevation: float,
+    solar_azimuth: float,
+    sin_tilt: float,
+    cos_tilt: float,
+    panel_az_rad: float,
+) -> float:
+    """Calculate irradiance on a tilted panel surface from plain numbers."""
+    # Return 0 if sun is below horizon
+    if solar_elevation <= 0:
+        return 0.0
+
+    # Convert to radians
+    sun_el = math.radians(solar_elevation)
+    sun_az = math.radians(solar_azimuth)
+    sin_el = math.sin(sun_el)
+
+    # Calculate angle of incidence between sun and panel normal
+    cos_incidence = sin_el * cos_tilt + math.cos(sun_el) * sin_tilt * math.cos(
+        sun_az - panel_az_rad
+    )
+
+    # Ensure non-negative (sun behind panel gives 0), without a branch
+    cos_incidence = 0.5 * (cos_incidence + abs(cos_incidence))
+
+    # Atmospheric transmission (balanced for realistic daily totals)
+    air_mass = 1 / sin_el if solar_elevation > 1 else 10.0
+    air_mass = min(air_mass, 10.0)  # Cap at 10
+    # Balanced transmission model - optimistic for peak, realistic for daily total
+    # Slightly more conservative; 0.78 ** (air_mass**0.62) written as one exp
+    transmission = math.exp(_LN_TRANSMISSION * air_mass**0.62)
+
+    # Enhanced Direct Normal Irradiance (W/m²) - calibrated to real observations
+    # Maintain peak values but reduce overestimation at low sun angles
+    dni = 1150 * transmission  # Reduced from 1200 to 1150
+
+    # Enhanced irradiance calculation with diffuse and reflected components
+    # Empirical clear-sky global horizontal irradiance
+    ghi = dni * sin_el + 160.0  # Reduced base diffuse from 180 to 160
+    diffuse = 0.25 * ghi  # Reduced diffuse component from 30% to 25%
+    reflected = 0.25 * (1 - cos_tilt) * ghi / 2  # Reduced albedo from 0.3 to 0.25
+
+    return max(0.0, dni * cos_incidence + diffuse + reflected)
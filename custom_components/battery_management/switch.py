@@ -5,10 +5,11 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DEFAULT_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,22 +23,30 @@ async def async_setup_entry(
 
     # Create switch entities
     entities = [
-        BatteryManagementSwitch(config_entry),
+        BatterySwitch(config_entry, "enabled", "Enabled", "Battery management", True),
         BatteryOptimizationSwitch(config_entry),
     ]
 
     async_add_entities(entities)
 
 
-class BatteryManagementSwitch(SwitchEntity):
-    """Battery management main switch."""
+class BatterySwitch(SwitchEntity):
+    """Battery on/off switch."""
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        config_entry: ConfigEntry,
+        key: str,
+        suffix: str,
+        label: str,
+        default_state: bool,
+    ) -> None:
         """Initialize the switch."""
         self._config_entry = config_entry
-        self._attr_name = f"{config_entry.data.get('name', 'GROWATT Battery Discharge Guard')} Enabled"
-        self._attr_unique_id = f"{config_entry.entry_id}_enabled"
-        self._is_on = True
+        self._label = label
+        self._attr_name = f"{config_entry.data.get(CONF_NAME, DEFAULT_NAME)} {suffix}"
+        self._attr_unique_id = f"{config_entry.entry_id}_{key}"
+        self._is_on = default_state
 
     @property
     def is_on(self) -> bool:
@@ -47,42 +56,24 @@ class BatteryManagementSwitch(SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         self._is_on = True
-        _LOGGER.info("Battery management enabled")
+        _LOGGER.info("%s enabled", self._label)
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         self._is_on = False
-        _LOGGER.info("Battery management disabled")
+        _LOGGER.info("%s disabled", self._label)
         self.async_write_ha_state()
 
 
-class BatteryOptimizationSwitch(SwitchEntity):
+class BatteryOptimizationSwitch(BatterySwitch):
     """Battery optimization switch."""
 
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize the switch."""
-        self._config_entry = config_entry
-        self._attr_name = f"{config_entry.data.get('name', 'GROWATT Battery Discharge Guard')} Optimization"
-        self._attr_unique_id = f"{config_entry.entry_id}_optimization"
-        self._is_on = False
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        return self._is_on
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the switch on."""
-        self._is_on = True
-        _LOGGER.info("Battery optimization enabled")
-        self.async_write_ha_state()
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the switch off."""
-        self._is_on = False
-        _LOGGER.info("Battery optimization disabled")
-        self.async_write_ha_state()
+        super().__init__(
+            config_entry, "optimization", "Optimization", "Battery optimization", False
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
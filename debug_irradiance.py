@@ -4,14 +4,9 @@ Simple test to debug the irradiance calculation
 """
 
 import logging
-import sys
-from datetime import datetime
-from pathlib import Path
+from datetime import datetime, timedelta
 
-# Add the custom_components path to sys.path
-sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
-
-from battery_management.sensor import (
+from custom_components.battery_management.sensor import (
     calculate_panel_irradiance,
     calculate_solar_position,
 )
@@ -26,7 +21,7 @@ logging.basicConfig(
 )
 
 # Explicitly set the battery_management logger to DEBUG level
-logger = logging.getLogger("battery_management.sensor")
+logger = logging.getLogger("custom_components.battery_management.sensor")
 logger.setLevel(logging.DEBUG)
 
 
@@ -46,13 +41,8 @@ def test_irradiance():
     efficiency = 0.2
 
     # Test for multiple times to see the pattern
-    test_times = [
-        datetime.now().replace(hour=8, minute=0, second=0, microsecond=0),
-        datetime.now().replace(hour=10, minute=0, second=0, microsecond=0),
-        datetime.now().replace(hour=12, minute=0, second=0, microsecond=0),
-        datetime.now().replace(hour=14, minute=0, second=0, microsecond=0),
-        datetime.now().replace(hour=16, minute=0, second=0, microsecond=0),
-    ]
+    midnight = datetime.combine(datetime.now().date(), datetime.min.time())
+    test_times = [midnight + timedelta(hours=hour) for hour in (8, 10, 12, 14, 16)]
 
     print(f"Latitude: {latitude}, Longitude: {longitude}")
     print(
@@ -6,6 +6,8 @@ Simple debug test for solar calculations.
 from datetime import datetime, timedelta
 import math
 
+import numpy as np
+
 
 def test_simple_solar():
     """Test basic solar calculations for Romania at different times."""
@@ -25,97 +27,72 @@ def test_simple_solar():
         16,  # 4 PM
     ]
 
-    for hour in test_times:
-        test_dt = datetime.combine(tomorrow, datetime.min.time().replace(hour=hour))
-
-        # Simple solar position calculation
-        def calculate_solar_position_simple(lat, lon, dt):
-            # Day of year
-            day_of_year = dt.timetuple().tm_yday
-
-            # Solar declination
-            declination = 23.45 * math.sin(
-                math.radians(360 * (284 + day_of_year) / 365)
-            )
-
-            # Hour angle (simplified - assumes local solar time)
-            hour_angle = 15 * (dt.hour - 12)  # degrees from solar noon
-
-            # Convert to radians
-            lat_rad = math.radians(lat)
-            dec_rad = math.radians(declination)
-            hour_rad = math.radians(hour_angle)
-
-            # Solar elevation
-            elevation = math.asin(
-                math.sin(lat_rad) * math.sin(dec_rad)
-                + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(hour_rad)
-            )
-
-            # Solar azimuth (simplified)
-            azimuth = math.atan2(
-                math.sin(hour_rad),
-                math.cos(hour_rad) * math.sin(lat_rad)
-                - math.tan(dec_rad) * math.cos(lat_rad),
-            )
-
-            return {
-                "elevation": math.degrees(elevation),
-                "azimuth": (math.degrees(azimuth) + 180) % 360,
-            }
-
-        solar_pos = calculate_solar_position_simple(latitude, longitude, test_dt)
-
+    # Panel setup (30° tilt, south-facing) is the same for every test time
+    panel_tilt_rad = math.radians(30.0)
+    panel_azim_rad = math.radians(180.0)
+    sin_tilt = math.sin(panel_tilt_rad)
+    cos_tilt = math.cos(panel_tilt_rad)
+
+    # Power per W/m² of panel irradiance
+    pv_max_power = 10.0  # kW
+    panel_efficiency = 0.20
+    system_efficiency = 0.90
+    power_factor = pv_max_power * panel_efficiency * system_efficiency / 1000
+
+    # Solar declination only depends on the day, so compute it once
+    day_of_year = tomorrow.timetuple().tm_yday
+    declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
+    lat_rad = math.radians(latitude)
+    dec_rad = math.radians(declination)
+
+    # Simple solar position for all test times at once
+    # (hour angle assumes local solar time, in degrees from solar noon)
+    hours = np.array(test_times, dtype=float)
+    hour_rad = np.radians(15 * (hours - 12))
+    sun_elev_rad = np.arcsin(
+        math.sin(lat_rad) * math.sin(dec_rad)
+        + math.cos(lat_rad) * math.cos(dec_rad) * np.cos(hour_rad)
+    )
+    sun_azim_rad = np.arctan2(
+        np.sin(hour_rad),
+        np.cos(hour_rad) * math.sin(lat_rad) - math.tan(dec_rad) * math.cos(lat_rad),
+    )
+    elevation = np.degrees(sun_elev_rad)
+    azimuth = (np.degrees(sun_azim_rad) + 180) % 360
+
+    # Simple irradiance calculation
+    # Direct normal irradiance (clear sky model), only meaningful above the horizon
+    with np.errstate(divide="ignore"):
+        air_mass = 1 / np.sin(sun_elev_rad)
+    dni = 900 * np.exp(-0.14 * air_mass)
+
+    # Incidence angle on tilted panel
+    cos_incidence = np.maximum(
+        0,
+        np.sin(sun_elev_rad) * cos_tilt
+        + np.cos(sun_elev_rad)
+        * sin_tilt
+        * np.cos(np.radians(azimuth) - panel_azim_rad),
+    )
+    irradiance = dni * cos_incidence
+
+    # Power calculation
+    power_kw = irradiance * power_factor
+
+    for i, hour in enumerate(test_times):
         print(
-            f"{hour:2d}:00 - Elevation: {solar_pos['elevation']:6.2f}°, Azimuth: {solar_pos['azimuth']:6.2f}°"
+            f"{hour:2d}:00 - Elevation: {elevation[i]:6.2f}°, Azimuth: {azimuth[i]:6.2f}°"
         )
 
         # Test panel irradiance
-        if solar_pos["elevation"] > 0:
-            # Simple irradiance calculation
-            # Direct normal irradiance (clear sky model)
-            air_mass = 1 / math.sin(math.radians(solar_pos["elevation"]))
-            if air_mass <= 10:
-                dni = 900 * math.exp(-0.14 * air_mass)
-
-                # Panel calculations (30° tilt, south-facing)
-                panel_tilt = 30.0
-                panel_azimuth = 180.0
-
-                # Incidence angle on tilted panel
-                sun_elev_rad = math.radians(solar_pos["elevation"])
-                sun_azim_rad = math.radians(solar_pos["azimuth"])
-                panel_tilt_rad = math.radians(panel_tilt)
-                panel_azim_rad = math.radians(panel_azimuth)
-
-                cos_incidence = math.sin(sun_elev_rad) * math.cos(
-                    panel_tilt_rad
-                ) + math.cos(sun_elev_rad) * math.sin(panel_tilt_rad) * math.cos(
-                    sun_azim_rad - panel_azim_rad
-                )
-
-                cos_incidence = max(0, cos_incidence)
-                irradiance = dni * cos_incidence
-
-                # Power calculation
-                pv_max_power = 10.0  # kW
-                panel_efficiency = 0.20
-                system_efficiency = 0.90
-
-                power_kw = (
-                    (irradiance / 1000)
-                    * pv_max_power
-                    * panel_efficiency
-                    * system_efficiency
-                )
-
-                print(
-                    f"      DNI: {dni:6.2f} W/m², Panel Irradiance: {irradiance:6.2f} W/m², Power: {power_kw:6.3f} kW"
-                )
-            else:
-                print(f"      Air mass too high: {air_mass:.2f}")
+        if elevation[i] <= 0:
+            print("      Sun below horizon")
+        elif air_mass[i] > 10:
+            print(f"      Air mass too high: {air_mass[i]:.2f}")
         else:
-            print(f"      Sun below horizon")
+            print(
+                f"      DNI: {dni[i]:6.2f} W/m², Panel Irradiance: {irradiance[i]:6.2f} W/m², Power: {power_kw[i]:6.3f} kW"
+            )
 
     print("\n=== Using Astral Library ===")
     try:
@@ -4,6 +4,8 @@
 from datetime import datetime, timedelta
 import math
 
+import numpy as np
+
 
 def test_basic_solar_calculation():
     """Test basic solar calculations to understand the issue."""
@@ -31,6 +33,13 @@ def test_basic_solar_calculation():
         )
         return jdn + (dt.hour - 12) / 24.0
 
+    # Bind the math functions locally; the position is evaluated for many times
+    sin, cos, tan, asin, atan2 = math.sin, math.cos, math.tan, math.asin, math.atan2
+    radians, degrees = math.radians, math.degrees
+
+    # The obliquity of the ecliptic is a constant, so take its sine once
+    sin_obliquity = sin(radians(23.439))
+
     # Simple solar position calculation
     def calculate_sun_position(lat, lon, dt):
         jd = julian_day(dt)
@@ -40,40 +49,37 @@ def test_basic_solar_calculation():
         L = (280.460 + 0.9856474 * n) % 360
 
         # Mean solar anomaly
-        g = math.radians((357.528 + 0.9856003 * n) % 360)
+        g = radians((357.528 + 0.9856003 * n) % 360)
 
         # Ecliptic longitude
-        lamb = math.radians(L + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g))
+        lamb = radians(L + 1.915 * sin(g) + 0.020 * sin(2 * g))
 
         # Solar declination
-        delta = math.asin(math.sin(math.radians(23.439)) * math.sin(lamb))
+        delta = asin(sin_obliquity * sin(lamb))
 
         # Hour angle
-        lat_rad = math.radians(lat)
-        lon_rad = math.radians(lon)
+        lat_rad = radians(lat)
 
         # Greenwich Mean Sidereal Time
         gmst = (18.697374558 + 24.06570982441908 * n) % 24
 
         # Local hour angle
-        hour_angle = math.radians(15 * (gmst - dt.hour - lon / 15))
+        hour_angle = radians(15 * (gmst - dt.hour - lon / 15))
 
         # Solar elevation
-        elevation = math.asin(
-            math.sin(lat_rad) * math.sin(delta)
-            + math.cos(lat_rad) * math.cos(delta) * math.cos(hour_angle)
+        elevation = asin(
+            sin(lat_rad) * sin(delta) + cos(lat_rad) * cos(delta) * cos(hour_angle)
         )
 
         # Solar azimuth
-        azimuth = math.atan2(
-            math.sin(hour_angle),
-            math.cos(hour_angle) * math.sin(lat_rad)
-            - math.tan(delta) * math.cos(lat_rad),
+        azimuth = atan2(
+            sin(hour_angle),
+            cos(hour_angle) * sin(lat_rad) - tan(delta) * cos(lat_rad),
         )
 
         return {
-            "elevation": math.degrees(elevation),
-            "azimuth": (math.degrees(azimuth) + 180) % 360,
+            "elevation": degrees(elevation),
+            "azimuth": (degrees(azimuth) + 180) % 360,
         }
 
     # Test current solar position
@@ -90,12 +96,9 @@ def test_basic_solar_calculation():
 
     # Test tomorrow's forecast
     print("=== Testing Tomorrow's Forecast ===")
-    tomorrow_6am = (now + timedelta(days=1)).replace(
-        hour=6, minute=0, second=0, microsecond=0
-    )
-    tomorrow_noon = (now + timedelta(days=1)).replace(
-        hour=12, minute=0, second=0, microsecond=0
-    )
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    tomorrow_6am = midnight + timedelta(hours=6)
+    tomorrow_noon = midnight + timedelta(hours=12)
 
     pos_6am = calculate_sun_position(latitude, longitude, tomorrow_6am)
     pos_noon = calculate_sun_position(latitude, longitude, tomorrow_noon)
@@ -109,23 +112,20 @@ def test_basic_solar_calculation():
 
     # Calculate approximate sunrise/sunset for tomorrow
     print("\n=== Approximate Sunrise/Sunset ===")
-    for hour in range(0, 24):
-        test_time = (now + timedelta(days=1)).replace(
-            hour=hour, minute=0, second=0, microsecond=0
-        )
-        pos = calculate_sun_position(latitude, longitude, test_time)
-
-        if hour > 0:
-            prev_time = test_time - timedelta(hours=1)
-            prev_pos = calculate_sun_position(latitude, longitude, prev_time)
-
-            # Check for sunrise (elevation crosses 0 going up)
-            if prev_pos["elevation"] < 0 and pos["elevation"] > 0:
-                print(f"Approximate sunrise: {test_time.strftime('%H:%M')}")
-
-            # Check for sunset (elevation crosses 0 going down)
-            if prev_pos["elevation"] > 0 and pos["elevation"] < 0:
-                print(f"Approximate sunset: {test_time.strftime('%H:%M')}")
+    # Evaluate every hour once, then look for elevation sign changes
+    positions = [
+        calculate_sun_position(latitude, longitude, midnight + timedelta(hours=hour))
+        for hour in range(24)
+    ]
+    elevations = np.array([position["elevation"] for position in positions])
+    rising = (elevations[:-1] < 0) & (elevations[1:] > 0)
+    setting = (elevations[:-1] > 0) & (elevations[1:] < 0)
+    for hour in np.flatnonzero(rising | setting).tolist():
+        # Interpolate the zero crossing between the two hourly samples
+        fraction = elevations[hour] / (elevations[hour] - elevations[hour + 1])
+        crossing = midnight + timedelta(hours=hour + fraction)
+        label = "sunrise" if rising[hour] else "sunset"
+        print(f"Approximate {label}: {crossing.strftime('%H:%M')}")
 
     print("\n=== Conclusion ===")
     print("If you're seeing 0 values at night, this is CORRECT behavior.")
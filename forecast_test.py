@@ -4,22 +4,191 @@ Standalone test script for solar energy forecast.
 This script runs locally and prints the complete forecast for today.
 """
 
-import sys
-import os
 from datetime import datetime, timedelta, timezone
 import math
 import logging
-
-# Add the custom components path
-sys.path.insert(
-    0,
-    os.path.join(os.path.dirname(__file__), "custom_components", "battery_management"),
+import traceback
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from custom_components.battery_management.solar_core import (
+    USE_NUMBA,
+    ephemeris_position,
+    ephemeris_position_array,
+    julian_day_number,
+    njit,
+    prange,
 )
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 _LOGGER = logging.getLogger(__name__)
 
+# Astral is optional; without it sun times come from basic formulas
+try:
+    from astral import LocationInfo
+    from astral.sun import sun
+
+    HAS_ASTRAL = True
+except ImportError:
+    HAS_ASTRAL = False
+
+# Clear-sky direct normal irradiance (W/m²) by solar elevation in 0.1° steps.
+# Below about 5.74° the air mass exceeds 10 and the model gives no DNI, so
+# the table starts just under that.
+_DNI_ELEVATION_START = 5.0
+_DNI_ELEVATION_STEP = 0.1
+_DNI_ELEVATIONS = np.arange(_DNI_ELEVATION_START, 90.05, _DNI_ELEVATION_STEP)
+_DNI_LUT = 900 * np.exp(-0.14 / np.sin(np.radians(_DNI_ELEVATIONS)))
+
+# Time origin of Grena's algorithm 3
+_GRENA_EPOCH = datetime(2060, 1, 1, tzinfo=timezone.utc)
+
+
+class ForecastEntry(NamedTuple):
+    """One rounded 5-minute interval of the forecast output."""
+
+    time: str
+    solar_elevation: float
+    solar_azimuth: float
+    irradiance: float
+    power_kw: float
+    energy_5min_kwh: float
+
+
+class ForecastArrays(NamedTuple):
+    """Forecast intervals stored column-wise, one array per field."""
+
+    time: np.ndarray
+    elevation: np.ndarray
+    azimuth: np.ndarray
+    irradiance: np.ndarray
+    power_kw: np.ndarray
+    energy_5min_kwh: np.ndarray
+
+    def to_entries(self) -> list[ForecastEntry]:
+        """Return the intervals as the rounded entries of the forecast output."""
+        return [
+            ForecastEntry(
+                moment,
+                round(el, 2),
+                round(az, 2),
+                round(irr, 2),
+                round(power, 3),
+                round(kwh, 4),
+            )
+            for moment, el, az, irr, power, kwh in zip(*(c.tolist() for c in self))
+        ]
+
+
+@njit(cache=True)
+def _clear_sky_dni(elevation_deg):
+    """Return the clear-sky DNI at an elevation, interpolated from the table."""
+    position = (elevation_deg - _DNI_ELEVATION_START) / _DNI_ELEVATION_STEP
+    index = min(max(int(position), 0), len(_DNI_LUT) - 2)
+    fraction = position - index
+    return _DNI_LUT[index] + fraction * (_DNI_LUT[index + 1] - _DNI_LUT[index])
+
+
+@njit(cache=True, fastmath=True)
+def _forecast_kernel(
+    julian_day,
+    solar_time,
+    sin_lat,
+    cos_lat,
+    longitude,
+    sin_tilt,
+    cos_tilt,
+    panel_azim_rad,
+    pv_max_power,
+):
+    """Run position, irradiance, power and energy for every interval in one loop.
+
+    Takes the Julian day and mean solar time in hours of each interval and
+    returns arrays of elevation, azimuth, irradiance, power (kW) and energy (kWh).
+    """
+    # Work in double precision, but store the outputs as float32
+    count = len(solar_time)
+    elevation = np.empty(count, dtype=np.float32)
+    azimuth = np.empty(count, dtype=np.float32)
+    irradiance = np.empty(count, dtype=np.float32)
+    power_kw = np.empty(count, dtype=np.float32)
+    energy = np.empty(count, dtype=np.float32)
+    for i in range(count):
+        # Same ephemeris as the integration
+        elev_deg, azim_deg = ephemeris_position(
+            julian_day[i], solar_time[i], sin_lat, cos_lat, longitude
+        )
+        elev_rad = math.radians(elev_deg)
+        azim_rad = math.radians(azim_deg)
+        sin_elev = math.sin(elev_rad)
+        cos_elev = math.cos(elev_rad)
+
+        # Clear sky irradiance on the tilted panel, up to 10 air masses
+        irr = 0.0
+        if sin_elev >= 0.1:
+            # Only the cosine of the panel to sun azimuth angle is needed
+            cos_incidence = sin_elev * cos_tilt + cos_elev * sin_tilt * math.cos(
+                azim_rad - panel_azim_rad
+            )
+            irr = max(0.0, _clear_sky_dni(elev_deg) * cos_incidence)
+
+        # Standard Test Conditions: 1000 W/m², capped at the rated power
+        power = min(max(pv_max_power * (irr / 1000.0), 0.0), pv_max_power)
+        elevation[i] = elev_deg
+        azimuth[i] = azim_deg
+        irradiance[i] = irr
+        power_kw[i] = power
+        energy[i] = power * (5 / 60)
+    return elevation, azimuth, irradiance, power_kw, energy
+
+
+@njit(parallel=True, cache=True)
+def _forecast_many_days(
+    julian_day,
+    solar_time,
+    sin_lat,
+    cos_lat,
+    longitude,
+    sin_tilt,
+    cos_tilt,
+    panel_azim_rad,
+    pv_max_power,
+):
+    """Run the forecast kernel on each day of a (days, intervals) grid in parallel.
+
+    Returns the kernel's arrays stacked into one row per day.
+    """
+    shape = solar_time.shape
+    elevation = np.empty(shape, dtype=np.float32)
+    azimuth = np.empty(shape, dtype=np.float32)
+    irradiance = np.empty(shape, dtype=np.float32)
+    power_kw = np.empty(shape, dtype=np.float32)
+    energy = np.empty(shape, dtype=np.float32)
+    for d in prange(shape[0]):
+        day_elevation, day_azimuth, day_irradiance, day_power, day_energy = (
+            _forecast_kernel(
+                julian_day[d],
+                solar_time[d],
+                sin_lat,
+                cos_lat,
+                longitude,
+                sin_tilt,
+                cos_tilt,
+                panel_azim_rad,
+                pv_max_power,
+            )
+        )
+        elevation[d, :] = day_elevation
+        azimuth[d, :] = day_azimuth
+        irradiance[d, :] = day_irradiance
+        power_kw[d, :] = day_power
+        energy[d, :] = day_energy
+    return elevation, azimuth, irradiance, power_kw, energy
+
 
 def mock_astral_functions():
     """Mock the astral library functions for standalone testing."""
@@ -28,196 +197,261 @@ def mock_astral_functions():
         latitude: float, longitude: float, timezone_str: str, date
     ) -> dict:
         """Calculate sun times using basic astronomical formulas."""
-        try:
-            # Import astral if available
-            from astral import LocationInfo
-            from astral.sun import sun
+        # Copy so callers can't alter the cached result
+        return dict(cached_sun_times(latitude, longitude, timezone_str, date))
 
-            location = LocationInfo("Test", "Test", timezone_str, latitude, longitude)
-            return sun(location.observer, date=date)
-        except ImportError:
-            # Fallback calculation if astral is not available
-            _LOGGER.warning("Astral library not available, using basic calculations")
-            return calculate_sun_times_basic(latitude, longitude, date)
+    def get_sun_times_pair(
+        latitude: float, longitude: float, timezone_str: str, date
+    ) -> dict:
+        """Return the sun times of a day and of the day after it."""
+        return {
+            "today": get_sun_times(latitude, longitude, timezone_str, date),
+            "tomorrow": get_sun_times(
+                latitude, longitude, timezone_str, date + timedelta(days=1)
+            ),
+        }
 
-    def calculate_sun_times_basic(latitude: float, longitude: float, date) -> dict:
-        """Basic sun time calculations."""
-        # This is a simplified calculation - in real use, astral library is much more accurate
-
-        # Julian day number
-        a = (14 - date.month) // 12
-        y = date.year + 4800 - a
-        m = date.month + 12 * a - 3
-        jdn = (
-            date.day
-            + (153 * m + 2) // 5
-            + 365 * y
-            + y // 4
-            - y // 100
-            + y // 400
-            - 32045
-        )
+    @lru_cache(maxsize=8)
+    def observer_for(latitude: float, longitude: float, timezone_str: str):
+        """Return the astral observer of a location, built once per location."""
+        return LocationInfo("Test", "Test", timezone_str, latitude, longitude).observer
 
-        # Solar declination (simplified)
-        day_of_year = date.timetuple().tm_yday
-        declination = math.radians(
-            23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-        )
+    @lru_cache(maxsize=32)
+    def cached_sun_times(
+        latitude: float, longitude: float, timezone_str: str, date
+    ) -> dict:
+        """Calculate sun times for a location and day, computed once per key."""
+        if HAS_ASTRAL:
+            return sun(observer_for(latitude, longitude, timezone_str), date=date)
 
-        # Latitude in radians
-        lat_rad = math.radians(latitude)
+        # Fallback calculation if astral is not available
+        _LOGGER.warning("Astral library not available, using basic calculations")
+        return calculate_sun_times_basic(latitude, longitude, date)
 
-        # Hour angle for sunrise/sunset
-        cos_hour_angle = -math.tan(lat_rad) * math.tan(declination)
+    def calculate_sun_times_basic(latitude: float, longitude: float, date) -> dict:
+        """Basic sun time calculations using Grena's algorithm 3.
 
-        # Check for polar day/night
-        if cos_hour_angle > 1:
-            # Polar night
-            return {}
-        elif cos_hour_angle < -1:
-            # Polar day
+        Solves the hour angle at each event's solar altitude analytically
+        from Grena3's declination and right ascension, which is accurate to
+        about a minute without astral.
+        """
+        lat_rad = math.radians(latitude)
+        lon_rad = math.radians(longitude)
+
+        def hour_angle_at(t: float, altitude: float) -> tuple:
+            """Return the hour angle and its value at an altitude for day ``t``."""
+            # Grena3 with a fixed Delta T of 69 s (Terrestrial minus Universal time)
+            te = t + 1.1574e-5 * 69
+            wte = 0.0172019715 * te
+            ecliptic_lon = (
+                -1.388803
+                + 1.720279216e-2 * te
+                + 3.3366e-2 * math.sin(wte - 0.06172)
+                + 3.53e-4 * math.sin(2 * wte - 0.1163)
+            )
+            obliquity = 4.089567e-1 - 6.19e-9 * te
+            sin_lon = math.sin(ecliptic_lon)
+            right_ascension = math.atan2(
+                sin_lon * math.cos(obliquity), math.cos(ecliptic_lon)
+            )
+            declination = math.asin(sin_lon * math.sin(obliquity))
+
+            # Hour angle, wrapped to [-pi, pi)
+            hour_angle = (
+                1.7528311 + 6.300388099 * t + lon_rad - right_ascension + math.pi
+            ) % (2 * math.pi) - math.pi
+            cos_event = (
+                math.sin(math.radians(altitude))
+                - math.sin(lat_rad) * math.sin(declination)
+            ) / (math.cos(lat_rad) * math.cos(declination))
+            return hour_angle, cos_event
+
+        # Grena3 counts days from 2060-01-01 00:00 UT; start from local solar noon
+        noon = datetime.combine(date, datetime.min.time()).replace(
+            tzinfo=timezone.utc
+        ) + timedelta(hours=12 - longitude / 15)
+        t_noon = (noon - _GRENA_EPOCH).total_seconds() / 86400
+
+        def event_time(altitude: float, side: int):
+            """Return when the sun crosses an altitude, rising (-1) or setting (1)."""
+            t = t_noon
+            # Refine once at the first estimate to follow the declination
+            for _ in range(2):
+                hour_angle, cos_event = hour_angle_at(t, altitude)
+                if not -1 <= cos_event <= 1:
+                    # Polar day or night: the sun never crosses this altitude
+                    return None
+                target = side * math.acos(cos_event)
+                t += (target - hour_angle) / 6.300388099
+            return _GRENA_EPOCH + timedelta(days=t)
+
+        # Sunrise and sunset include refraction and the sun's radius
+        sunrise = event_time(-0.833, -1)
+        sunset = event_time(-0.833, 1)
+        if sunrise is None or sunset is None:
             return {}
 
-        hour_angle = math.acos(cos_hour_angle)
+        hour_angle, _ = hour_angle_at(t_noon, 0)
+        solar_noon = _GRENA_EPOCH + timedelta(days=t_noon - hour_angle / 6.300388099)
 
-        # Convert to hours
-        sunrise_hour = 12 - math.degrees(hour_angle) / 15
-        sunset_hour = 12 + math.degrees(hour_angle) / 15
-
-        # Create timezone-aware datetime objects
-        from datetime import timezone as dt_timezone
-
-        tz = dt_timezone.utc  # Using UTC for simplicity
-
-        sunrise = datetime.combine(date, datetime.min.time()).replace(
-            hour=int(sunrise_hour), minute=int((sunrise_hour % 1) * 60), tzinfo=tz
-        )
-        sunset = datetime.combine(date, datetime.min.time()).replace(
-            hour=int(sunset_hour), minute=int((sunset_hour % 1) * 60), tzinfo=tz
-        )
+        # Civil twilight, falling back to half an hour around polar summer
+        dawn = event_time(-6, -1) or sunrise - timedelta(minutes=30)
+        dusk = event_time(-6, 1) or sunset + timedelta(minutes=30)
 
         return {
+            "dawn": dawn,
             "sunrise": sunrise,
+            "noon": solar_noon,
             "sunset": sunset,
-            "dawn": sunrise - timedelta(minutes=30),
-            "dusk": sunset + timedelta(minutes=30),
+            "dusk": dusk,
         }
 
-    return get_sun_times
+    return get_sun_times, get_sun_times_pair
 
 
 def mock_solar_calculations():
     """Mock the solar calculation functions."""
 
-    def calculate_solar_position(
-        latitude: float, longitude: float, dt: datetime
-    ) -> dict:
-        """Calculate solar elevation and azimuth for a given time and location."""
-        try:
-            # Convert to UTC if timezone-aware
-            if dt.tzinfo:
-                dt_utc = dt.utctimetuple()
-                dt_local = datetime(
-                    dt_utc.tm_year,
-                    dt_utc.tm_mon,
-                    dt_utc.tm_mday,
-                    dt_utc.tm_hour,
-                    dt_utc.tm_min,
-                    dt_utc.tm_sec,
-                )
-            else:
-                dt_local = dt
+    @lru_cache(maxsize=8)
+    def panel_constants(panel_tilt: float, panel_orientation: float) -> tuple:
+        """Return the panel tilt trig values and the panel azimuth in radians."""
+        panel_tilt_rad = math.radians(panel_tilt)
+        return (
+            math.sin(panel_tilt_rad),
+            math.cos(panel_tilt_rad),
+            math.radians(panel_orientation),
+        )
 
-            # Day of year
-            day_of_year = dt_local.timetuple().tm_yday
+    def interval_grid(start: datetime, count: int) -> tuple:
+        """Return the Julian day and mean solar time of 5-minute steps."""
+        # Like the integration, the ephemeris works on local wall-clock time
+        seconds = (
+            start.hour * 3600
+            + start.minute * 60
+            + start.second
+            + 300 * np.arange(count)
+        )
+        julian_day = julian_day_number(start) + (seconds - 43200) / 86400.0
+        return julian_day, np.mod(seconds, 86400) / 3600.0
 
-            # Solar declination (degrees)
-            declination = 23.45 * math.sin(
-                math.radians(360 * (284 + day_of_year) / 365)
-            )
+    def calculate_forecast_intervals(
+        latitude: float,
+        longitude: float,
+        panel_tilt: float,
+        panel_orientation: float,
+        pv_max_power: float,
+        start: datetime,
+        count: int,
+    ) -> tuple:
+        """Calculate position, irradiance, power and energy for 5-minute steps.
 
-            # Hour angle from solar noon (degrees)
-            # Adjust for longitude and timezone
-            time_of_day = (
-                dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
-            )
-            solar_time = time_of_day + longitude / 15.0  # Longitude correction
-            hour_angle = 15 * (solar_time - 12)  # degrees from solar noon
-
-            # Convert to radians
-            lat_rad = math.radians(latitude)
-            dec_rad = math.radians(declination)
-            hour_rad = math.radians(hour_angle)
-
-            # Solar elevation
-            elevation = math.asin(
-                math.sin(lat_rad) * math.sin(dec_rad)
-                + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(hour_rad)
-            )
+        Runs ``count`` intervals from ``start`` through the fused kernel, or
+        as NumPy array operations without Numba.
+        """
+        julian_day, solar_time = interval_grid(start, count)
 
-            # Solar azimuth
-            azimuth = math.atan2(
-                math.sin(hour_rad),
-                math.cos(hour_rad) * math.sin(lat_rad)
-                - math.tan(dec_rad) * math.cos(lat_rad),
+        lat_rad = math.radians(latitude)
+        sin_tilt, cos_tilt, panel_azim_rad = panel_constants(
+            panel_tilt, panel_orientation
+        )
+        if USE_NUMBA:
+            # One fused native loop beats chaining NumPy array operations
+            return _forecast_kernel(
+                julian_day,
+                solar_time,
+                math.sin(lat_rad),
+                math.cos(lat_rad),
+                longitude,
+                sin_tilt,
+                cos_tilt,
+                panel_azim_rad,
+                pv_max_power,
             )
 
-            return {
-                "elevation": math.degrees(elevation),
-                "azimuth": (math.degrees(azimuth) + 180) % 360,
-            }
-
-        except Exception as e:
-            _LOGGER.error("Error calculating solar position: %s", e)
-            return {"elevation": 0, "azimuth": 0}
-
-    def calculate_panel_irradiance(
-        solar_elevation: float,
-        solar_azimuth: float,
-        panel_tilt: float,
-        panel_orientation: float,
-    ) -> float:
-        """Calculate irradiance on tilted panel."""
-        try:
-            if solar_elevation <= 0:
-                return 0
-
-            # Convert to radians
-            sun_elev_rad = math.radians(solar_elevation)
-            sun_azim_rad = math.radians(solar_azimuth)
-            panel_tilt_rad = math.radians(panel_tilt)
-            panel_azim_rad = math.radians(panel_orientation)
-
-            # Calculate incidence angle
-            cos_incidence = math.sin(sun_elev_rad) * math.cos(
-                panel_tilt_rad
-            ) + math.cos(sun_elev_rad) * math.sin(panel_tilt_rad) * math.cos(
-                sun_azim_rad - panel_azim_rad
+        # Solar elevation and azimuth, stored in single precision like the
+        # kernel's outputs
+        elevation, azimuth = (
+            angle.astype(np.float32)
+            for angle in ephemeris_position_array(
+                julian_day, solar_time, math.sin(lat_rad), math.cos(lat_rad), longitude
             )
+        )
+        elevation_rad = np.radians(elevation)
+
+        # Only intervals with the sun above the horizon and at most 10 air
+        # masses get irradiance, so skip the rest of the panel math at night
+        sin_elevation = np.sin(elevation_rad)
+        lit = np.flatnonzero(sin_elevation >= 0.1)
+
+        # Incidence angle on the tilted panel
+        cos_incidence = np.maximum(
+            0,
+            sin_elevation[lit] * cos_tilt
+            + np.cos(elevation_rad[lit])
+            * sin_tilt
+            * np.cos(np.radians(azimuth[lit]) - panel_azim_rad),
+        )
 
-            # Avoid negative values
-            cos_incidence = max(0, cos_incidence)
+        # Direct normal irradiance (simplified clear sky model)
+        dni = np.interp(elevation[lit], _DNI_ELEVATIONS, _DNI_LUT).astype(np.float32)
+        irradiance = np.zeros(count, dtype=np.float32)
+        irradiance[lit] = np.maximum(0, dni * cos_incidence)
 
-            # Direct normal irradiance (simplified model)
-            # Assume clear sky conditions
-            air_mass = (
-                1 / math.sin(sun_elev_rad) if solar_elevation > 0 else float("inf")
-            )
-            if air_mass > 10:
-                dni = 0
-            else:
-                dni = 900 * math.exp(-0.14 * air_mass)  # Simplified clear sky model
+        # Standard Test Conditions: 1000 W/m², capped at the rated power
+        power_kw = np.zeros(count, dtype=np.float32)
+        power_kw[lit] = np.clip(
+            pv_max_power * (irradiance[lit] / 1000.0), 0, pv_max_power
+        )
+        energy = power_kw * (5 / 60)  # 5 minutes = 1/12 hour
 
-            # Irradiance on tilted surface
-            irradiance = dni * cos_incidence
+        return elevation, azimuth, irradiance, power_kw, energy
 
-            return max(0, irradiance)
+    def calculate_forecast_days(
+        latitude: float,
+        longitude: float,
+        panel_tilt: float,
+        panel_orientation: float,
+        pv_max_power: float,
+        midnights: list,
+    ) -> tuple:
+        """Calculate the 288 five-minute intervals of several days.
+
+        Returns the arrays of calculate_forecast_intervals with one row per
+        midnight in ``midnights``; with Numba the days run in parallel.
+        """
+        if not USE_NUMBA:
+            days = [
+                calculate_forecast_intervals(
+                    latitude,
+                    longitude,
+                    panel_tilt,
+                    panel_orientation,
+                    pv_max_power,
+                    midnight,
+                    288,
+                )
+                for midnight in midnights
+            ]
+            return tuple(np.stack(column) for column in zip(*days))
 
-        except Exception as e:
-            _LOGGER.error("Error calculating panel irradiance: %s", e)
-            return 0
+        grids = [interval_grid(midnight, 288) for midnight in midnights]
+        lat_rad = math.radians(latitude)
+        sin_tilt, cos_tilt, panel_azim_rad = panel_constants(
+            panel_tilt, panel_orientation
+        )
+        return _forecast_many_days(
+            np.stack([julian_day for julian_day, _ in grids]),
+            np.stack([solar_time for _, solar_time in grids]),
+            math.sin(lat_rad),
+            math.cos(lat_rad),
+            longitude,
+            sin_tilt,
+            cos_tilt,
+            panel_azim_rad,
+            pv_max_power,
+        )
 
-    return calculate_solar_position, calculate_panel_irradiance
+    return calculate_forecast_intervals, calculate_forecast_days
 
 
 def test_solar_forecast():
@@ -243,8 +477,8 @@ def test_solar_forecast():
     print()
 
     # Get mock functions
-    get_sun_times = mock_astral_functions()
-    calculate_solar_position, calculate_panel_irradiance = mock_solar_calculations()
+    get_sun_times, get_sun_times_pair = mock_astral_functions()
+    calculate_forecast_intervals, calculate_forecast_days = mock_solar_calculations()
 
     # Implement the forecast calculation (similar to sensor.py)
     def calculate_energy_forecast_test(
@@ -262,21 +496,14 @@ def test_solar_forecast():
                 start_time = datetime.now()
 
             # Make timezone-aware
+            tz = ZoneInfo(timezone)
             if start_time.tzinfo is None:
-                try:
-                    import pytz
-
-                    tz = pytz.timezone(timezone)
-                    start_time = tz.localize(start_time)
-                except ImportError:
-                    # Fallback for Europe/Bucharest (UTC+2)
-                    from datetime import timezone as dt_timezone
-
-                    tz_offset = dt_timezone(timedelta(hours=2))
-                    start_time = start_time.replace(tzinfo=tz_offset)
+                start_time = start_time.replace(tzinfo=tz)
 
             today = start_time.date()
-            sun_times = get_sun_times(latitude, longitude, timezone, today)
+            # Tomorrow's times are needed past sunset, so get both days at once
+            sun_times_pair = get_sun_times_pair(latitude, longitude, timezone, today)
+            sun_times = sun_times_pair["today"]
 
             if not sun_times or "sunset" not in sun_times or "sunrise" not in sun_times:
                 return {
@@ -294,9 +521,7 @@ def test_solar_forecast():
             if start_time >= sunset_time:
                 print("🌙 Past sunset, calculating forecast for tomorrow")
                 tomorrow = today + timedelta(days=1)
-                tomorrow_sun_times = get_sun_times(
-                    latitude, longitude, timezone, tomorrow
-                )
+                tomorrow_sun_times = sun_times_pair["tomorrow"]
 
                 if (
                     tomorrow_sun_times
@@ -317,140 +542,91 @@ def test_solar_forecast():
                 forecast_day = today
 
             # Calculate full day forecast (24 hours in 5-minute intervals = 288 intervals)
-            full_day_forecast = []
-            total_daily_energy = 0
-            
+
             # Start from midnight of the forecast day
-            if hasattr(forecast_day, 'date'):
-                forecast_day_start = datetime.combine(forecast_day.date(), datetime.min.time())
+            if hasattr(forecast_day, "date"):
+                forecast_day_start = datetime.combine(
+                    forecast_day.date(), datetime.min.time()
+                )
             else:
                 forecast_day_start = datetime.combine(forecast_day, datetime.min.time())
-            
+
             # Make timezone-aware
-            try:
-                import pytz
-                tz = pytz.timezone(timezone)
-                current_time_full = tz.localize(forecast_day_start)
-            except ImportError:
-                current_time_full = forecast_day_start.replace(tzinfo=datetime.timezone.utc)
+            current_time_full = forecast_day_start.replace(tzinfo=tz)
 
             print(
                 f"Calculating forecast from {current_time_full} for {forecast_day} (24h = 288 intervals)"
             )
 
-            # Generate 288 intervals (24 hours * 12 intervals per hour)
-            for interval in range(288):
-                # Get solar position
-                solar_pos = calculate_solar_position(
-                    latitude, longitude, current_time_full
-                )
-
-                # Calculate panel irradiance
-                irradiance = calculate_panel_irradiance(
-                    solar_pos["elevation"],
-                    solar_pos["azimuth"],
+            # Evaluate all 288 intervals (24 hours * 12 intervals per hour)
+            # in one vectorized pass
+            elevation, azimuth, irradiance, power_kw, energy_5min = (
+                calculate_forecast_intervals(
+                    latitude,
+                    longitude,
                     panel_tilt,
                     panel_orientation,
+                    pv_max_power,
+                    current_time_full,
+                    288,
                 )
+            )
 
-                # Calculate power output - pv_max_power is already the rated power
-                if solar_pos["elevation"] > 0 and irradiance > 0:
-                    # Standard Test Conditions: 1000 W/m²
-                    # Power scales linearly with irradiance
-                    power_kw = pv_max_power * (irradiance / 1000.0)
-                    power_kw = max(0, min(power_kw, pv_max_power))  # Cap at max power
-                else:
-                    power_kw = 0.0
-
-                # Energy in 5 minutes (kWh)
-                energy_5min = power_kw * (5 / 60)  # 5 minutes = 1/12 hour
-
-                full_day_forecast.append(
-                    {
-                        "time": current_time_full.isoformat(),
-                        "solar_elevation": round(solar_pos["elevation"], 2),
-                        "solar_azimuth": round(solar_pos["azimuth"], 2),
-                        "irradiance": round(irradiance, 2),
-                        "power_kw": round(power_kw, 3),
-                        "energy_5min_kwh": round(energy_5min, 4),
-                    }
-                )
-
-                if power_kw > 0:  # Only add energy during daylight
-                    total_daily_energy += energy_5min
-                
-                current_time_full += timedelta(minutes=5)
-
-                    full_day_forecast.append(
-                        {
-                            "time": current_time_full.isoformat(),
-                            "solar_elevation": round(solar_pos["elevation"], 2),
-                            "solar_azimuth": round(solar_pos["azimuth"], 2),
-                            "irradiance": round(irradiance, 2),
-                            "power_kw": round(power_kw, 3),
-                            "energy_5min_kwh": round(energy_5min, 4),
-                        }
-                    )
+            # Every interval keeps midnight's UTC offset, like adding
+            # timedelta steps to the localized midnight
+            grid = np.datetime64(forecast_day_start, "s") + np.arange(
+                288
+            ) * np.timedelta64(5, "m")
+            utc_offset = current_time_full.isoformat()[19:]
+            full_day = ForecastArrays(
+                np.char.add(np.datetime_as_string(grid, unit="s"), utc_offset),
+                elevation,
+                azimuth,
+                irradiance,
+                power_kw,
+                energy_5min,
+            )
 
-                    total_daily_energy += energy_5min
+            # Every interval of the day appears exactly once
+            assert len(full_day.time) == 288, len(full_day.time)
 
-                current_time_full += timedelta(minutes=5)
+            # Only daylight intervals produce energy
+            total_daily_energy = float(energy_5min.sum())
 
-            # Calculate remaining forecast (from now until sunset)
-            forecast = []
+            # Calculate remaining forecast (from now until sunset), as indices
+            # into the full day
+            remaining = []
             total_energy = 0
 
-            # Get today's original sunset for comparison
-            today_sun_times = get_sun_times(
-                latitude, longitude, timezone, start_time.date()
-            )
-            original_sunset = (
-                today_sun_times.get("sunset") if today_sun_times else sunset_time
-            )
+            # Today's sunset, before the past-sunset branch moved to tomorrow
+            original_sunset = sun_times["sunset"]
 
             if start_time < original_sunset:
-                current_time = start_time
-                while current_time < sunset_time:
-                    solar_pos = calculate_solar_position(
-                        latitude, longitude, current_time
-                    )
-
-                    if solar_pos["elevation"] > 0:
-                        irradiance = calculate_panel_irradiance(
-                            solar_pos["elevation"],
-                            solar_pos["azimuth"],
-                            panel_tilt,
-                            panel_orientation,
-                        )
-
-                        # Calculate power output - pv_max_power is already the rated power
-                        if irradiance > 0:
-                            power_kw = pv_max_power * (irradiance / 1000.0)
-                            power_kw = max(0, min(power_kw, pv_max_power))
-                        else:
-                            power_kw = 0.0
-
-                        energy_5min = power_kw * (5 / 60)
-
-                        forecast.append(
-                            {
-                                "time": current_time.isoformat(),
-                                "solar_elevation": round(solar_pos["elevation"], 2),
-                                "solar_azimuth": round(solar_pos["azimuth"], 2),
-                                "irradiance": round(irradiance, 2),
-                                "power_kw": round(power_kw, 3),
-                                "energy_5min_kwh": round(energy_5min, 4),
-                            }
-                        )
-
-                        total_energy += energy_5min
-
-                    current_time += timedelta(minutes=5)
+                # The remaining forecast is the part of today's 5-minute grid from
+                # the interval holding now until sunset, so slice the full day
+                # instead of computing those intervals again. Use timestamps, as
+                # datetimes in the same zone subtract by wall-clock time.
+                midnight = current_time_full.timestamp()
+                first = int((start_time.timestamp() - midnight) // 300)
+                last = math.ceil((sunset_time.timestamp() - midnight) / 300)
+                window = slice(max(first, 0), min(max(last, first, 0), 288))
+
+                # Only intervals with the sun above the horizon are listed
+                remaining = (
+                    np.flatnonzero(full_day.elevation[window] > 0) + window.start
+                ).tolist()
+                total_energy = float(full_day.energy_5min_kwh[remaining].sum())
+
+            # Round and format each interval only once, for the output; the
+            # remaining forecast shares the full day's entries
+            full_day_forecast = full_day.to_entries()
+            forecast = [full_day_forecast[i] for i in remaining]
 
             return {
                 "total_energy": round(total_energy, 3),
                 "forecast": forecast,
                 "full_day_forecast": full_day_forecast,
+                "full_day_arrays": full_day,
                 "total_daily_energy": round(total_daily_energy, 3),
                 "sunrise_time": sunrise_time.isoformat(),
                 "sunset_time": sunset_time.isoformat(),
@@ -460,8 +636,6 @@ def test_solar_forecast():
 
         except Exception as e:
             print(f"❌ Error calculating energy forecast: {e}")
-            import traceback
-
             traceback.print_exc()
             return {
                 "total_energy": 0,
@@ -502,9 +676,9 @@ def test_solar_forecast():
         print(f"{'Time':<20} {'Elevation':<10} {'Power':<8} {'Energy':<10}")
         print("-" * 50)
         for i, entry in enumerate(full_day_forecast[:10]):
-            time_str = entry["time"].split("T")[1][:5]  # Extract HH:MM
+            time_str = entry.time.split("T")[1][:5]  # Extract HH:MM
             print(
-                f"{time_str:<20} {entry['solar_elevation']:<10.1f} {entry['power_kw']:<8.3f} {entry['energy_5min_kwh']:<10.4f}"
+                f"{time_str:<20} {entry.solar_elevation:<10.1f} {entry.power_kw:<8.3f} {entry.energy_5min_kwh:<10.4f}"
             )
 
         if len(full_day_forecast) > 10:
@@ -517,9 +691,9 @@ def test_solar_forecast():
         print(f"{'Time':<20} {'Elevation':<10} {'Power':<8} {'Energy':<10}")
         print("-" * 50)
         for i, entry in enumerate(remaining_forecast[:5]):
-            time_str = entry["time"].split("T")[1][:5]  # Extract HH:MM
+            time_str = entry.time.split("T")[1][:5]  # Extract HH:MM
             print(
-                f"{time_str:<20} {entry['solar_elevation']:<10.1f} {entry['power_kw']:<8.3f} {entry['energy_5min_kwh']:<10.4f}"
+                f"{time_str:<20} {entry.solar_elevation:<10.1f} {entry.power_kw:<8.3f} {entry.energy_5min_kwh:<10.4f}"
             )
 
         if len(remaining_forecast) > 5:
@@ -528,10 +702,13 @@ def test_solar_forecast():
         print(f"\n⏳ No remaining forecast (past sunset or no sun)")
 
     # Summary statistics
-    if full_day_forecast:
-        max_power = max(entry["power_kw"] for entry in full_day_forecast)
-        max_power_entry = max(full_day_forecast, key=lambda x: x["power_kw"])
-        max_time = max_power_entry["time"].split("T")[1][:5]
+    full_day = forecast_data.get("full_day_arrays")
+    if full_day is not None:
+        # Peak of the rounded power values, as printed in the intervals
+        power_kw = np.round(full_day.power_kw, 3)
+        max_index = int(power_kw.argmax())
+        max_power = float(power_kw[max_index])
+        max_time = str(full_day.time[max_index]).split("T")[1][:5]
 
         print(f"\n📈 STATISTICS:")
         print(f"Peak Power: {max_power:.3f} kW at {max_time}")
@@ -542,6 +719,21 @@ def test_solar_forecast():
             f"Forecast Efficiency: {(forecast_data.get('total_daily_energy', 0) / (pv_max_power * 10)) * 100:.1f}% of theoretical max"
         )
 
+    # Daily totals for the coming week, computed as one batch
+    tz = ZoneInfo(timezone_str)
+    today = datetime.now(tz).date()
+    midnights = [
+        datetime.combine(today + timedelta(days=day), datetime.min.time(), tzinfo=tz)
+        for day in range(7)
+    ]
+    week_energy = calculate_forecast_days(
+        latitude, longitude, panel_tilt, panel_orientation, pv_max_power, midnights
+    )[4].sum(axis=1)
+
+    print("\n📅 NEXT 7 DAYS:")
+    for midnight, energy in zip(midnights, week_energy.tolist()):
+        print(f"{midnight.date()}: {energy:.3f} kWh")
+
     print("\n" + "=" * 60)
     print("✅ FORECAST CALCULATION COMPLETE")
     print("=" * 60)
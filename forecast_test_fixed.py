@@ -5,71 +5,93 @@ This script tests the solar energy forecast calculation with realistic values
 """
 
 import math
-from datetime import datetime, timedelta, timezone as dt_timezone
+import os
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
 import logging
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from custom_components.battery_management.solar_core import USE_NUMBA, njit, prange
+from solar_day import day_constants, solar_position
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+# Numba is optional; without it the scalar kernels run as plain Python and
+# the array forms as NumPy operations
+if USE_NUMBA:
+    from numba import guvectorize, vectorize
+
+
+# Set FAST_MATH=1 to use polynomial arcsin/arctan2 in the NumPy solar position
+# instead of the exact library functions; check_fast_math bounds their error
+FAST_MATH = os.environ.get("FAST_MATH") == "1"
+
+# Largest error of the polynomial functions accepted by check_fast_math
+FAST_MATH_TOLERANCE_DEG = 0.01
+
+# Odd minimax polynomial for atan on [0, 1], highest power first
+_ATAN_COEFFS = (
+    -0.0117212,
+    0.05265332,
+    -0.11643287,
+    0.19354346,
+    -0.33262347,
+    0.99997726,
+)
+
+
+class ForecastInterval(NamedTuple):
+    """One rounded forecast interval, built for output from the forecast arrays."""
+
+    time: str
+    solar_elevation: float
+    power_kw: float
+    energy_5min_kwh: float
+    solar_azimuth: float | None = None
+    irradiance: float | None = None
+
+
+def time_label(iso_time: str) -> str:
+    """Return the HH:MM of an isoformat() timestamp without parsing it back."""
+    # isoformat() always starts with YYYY-MM-DDTHH:MM, so the clock is at 11:16
+    return iso_time[11:16]
+
 
 def calculate_solar_position(latitude: float, longitude: float, dt: datetime) -> dict:
     """Calculate solar elevation and azimuth for a given time and location."""
-    try:
-        # Convert to UTC if timezone-aware
-        if dt.tzinfo:
-            dt_utc = dt.utctimetuple()
-            dt_local = datetime(
-                dt_utc.tm_year,
-                dt_utc.tm_mon,
-                dt_utc.tm_mday,
-                dt_utc.tm_hour,
-                dt_utc.tm_min,
-                dt_utc.tm_sec,
-            )
-        else:
-            dt_local = dt
-
-        # Day of year
-        day_of_year = dt_local.timetuple().tm_yday
-
-        # Solar declination (degrees)
-        declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-
-        # Hour angle from solar noon (degrees)
-        # Adjust for longitude and timezone
-        time_of_day = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
-        solar_time = time_of_day + longitude / 15.0  # Longitude correction
-        hour_angle = 15 * (solar_time - 12)  # degrees from solar noon
-
-        # Convert to radians
-        lat_rad = math.radians(latitude)
-        dec_rad = math.radians(declination)
-        hour_rad = math.radians(hour_angle)
-
-        # Solar elevation
-        elevation = math.asin(
-            math.sin(lat_rad) * math.sin(dec_rad)
-            + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(hour_rad)
+    # Convert to UTC if timezone-aware
+    if dt.tzinfo:
+        dt_utc = dt.utctimetuple()
+        dt_local = datetime(
+            dt_utc.tm_year,
+            dt_utc.tm_mon,
+            dt_utc.tm_mday,
+            dt_utc.tm_hour,
+            dt_utc.tm_min,
+            dt_utc.tm_sec,
         )
+    else:
+        dt_local = dt
 
-        # Solar azimuth
-        azimuth = math.atan2(
-            math.sin(hour_rad),
-            math.cos(hour_rad) * math.sin(lat_rad)
-            - math.tan(dec_rad) * math.cos(lat_rad),
-        )
+    # Declination and latitude terms are computed once per day
+    pre = day_constants(latitude, dt_local.timetuple().tm_yday)
 
-        return {
-            "elevation": math.degrees(elevation),
-            "azimuth": (math.degrees(azimuth) + 180) % 360,
-        }
+    # Hour angle from solar noon (degrees)
+    # Adjust for longitude and timezone
+    time_of_day = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
+    solar_time = time_of_day + longitude / 15.0  # Longitude correction
+    hour_angle = 15 * (solar_time - 12)  # degrees from solar noon
 
-    except Exception as e:
-        _LOGGER.error("Error calculating solar position: %s", e)
-        return {"elevation": 0, "azimuth": 0}
+    elevation, azimuth = solar_position(pre, hour_angle)
+    return {"elevation": elevation, "azimuth": azimuth}
 
 
+@njit(cache=True, fastmath=True)
 def calculate_panel_irradiance(
     elevation: float, azimuth: float, panel_tilt: float, panel_orientation: float
 ) -> float:
@@ -83,14 +105,16 @@ def calculate_panel_irradiance(
     tilt_rad = math.radians(panel_tilt)
     orient_rad = math.radians(panel_orientation)
 
+    sin_elev = math.sin(elev_rad)
+    cos_elev = math.cos(elev_rad)
+
     # Angle between sun and panel normal
-    cos_incidence = math.sin(elev_rad) * math.cos(tilt_rad) + math.cos(
-        elev_rad
-    ) * math.sin(tilt_rad) * math.cos(azim_rad - orient_rad)
+    cos_incidence = sin_elev * math.cos(tilt_rad) + cos_elev * math.sin(
+        tilt_rad
+    ) * math.cos(azim_rad - orient_rad)
 
-    # Air mass calculation
-    air_mass = 1 / math.sin(elev_rad) if elevation > 0 else float("inf")
-    air_mass = min(air_mass, 10)  # Cap at 10
+    # Air mass, capped at 10 by flooring the sine at 0.1 instead of branching
+    air_mass = 1 / max(sin_elev, 0.1)
 
     # Clear sky irradiance (simplified model)
     dni = 900.0 * math.exp(-0.14 * air_mass)  # Direct normal irradiance
@@ -101,8 +125,316 @@ def calculate_panel_irradiance(
     return panel_irradiance
 
 
-def get_sun_times(latitude: float, longitude: float, timezone: str, date_obj):
-    """Mock function to get sunrise and sunset times."""
+if USE_NUMBA:
+    # For 288 intervals a compiled loop per call beats a parallel target,
+    # whose thread dispatch costs more than the work it would split
+
+    @guvectorize(
+        [
+            "void(float32[:], float32[:], float32[:], float32[:], float32, float32, "
+            "float32[:], float32[:])",
+            "void(float64[:], float64[:], float64[:], float64[:], float64, float64, "
+            "float64[:], float64[:])",
+        ],
+        "(n),(n),(n),(n),(),()->(n),(n)",
+        cache=True,
+        fastmath=True,
+    )
+    def _solar_position_gufunc(
+        hour_rad,
+        sin_lat_sin_dec,
+        cos_lat_cos_dec,
+        tan_dec,
+        sin_lat,
+        cos_lat,
+        elevation,
+        azimuth,
+    ):
+        """Fill solar elevation and azimuth (radians) for arrays of hour angles."""
+        for i in range(hour_rad.shape[0]):
+            sin_hour = math.sin(hour_rad[i])
+            cos_hour = math.cos(hour_rad[i])
+            elevation[i] = math.asin(sin_lat_sin_dec[i] + cos_lat_cos_dec[i] * cos_hour)
+            azimuth[i] = math.atan2(sin_hour, cos_hour * sin_lat - tan_dec[i] * cos_lat)
+
+    @vectorize(
+        [
+            "float32(float32, float32, float32, float32)",
+            "float64(float64, float64, float64, float64)",
+        ],
+        cache=True,
+        fastmath=True,
+    )
+    def _panel_irradiance_ufunc(elevation, azimuth, panel_tilt, panel_orientation):
+        """Element-wise calculate_panel_irradiance."""
+        return calculate_panel_irradiance(
+            elevation, azimuth, panel_tilt, panel_orientation
+        )
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _forecast_kernel(
+        terms_by_day,
+        day_index,
+        time_of_day,
+        longitude,
+        panel_tilt,
+        panel_orientation,
+        pv_max_power,
+        elevation,
+        azimuth,
+        irradiance,
+        power_kw,
+        energy_5min,
+    ):
+        """Fill the forecast arrays in one fused pass over the intervals."""
+        for i in prange(time_of_day.shape[0]):
+            # Per-day terms, see day_constants
+            terms = terms_by_day[day_index[i]]
+            sin_lat = terms[3]
+            cos_lat = terms[4]
+            hour_rad = math.radians(15 * (time_of_day[i] + longitude / 15.0 - 12))
+            sin_hour = math.sin(hour_rad)
+            cos_hour = math.cos(hour_rad)
+            elev = math.degrees(math.asin(terms[0] + terms[1] * cos_hour))
+            azim = (
+                math.degrees(
+                    math.atan2(sin_hour, cos_hour * sin_lat - terms[2] * cos_lat)
+                )
+                + 180
+            ) % 360
+            panel = calculate_panel_irradiance(
+                elev, azim, panel_tilt, panel_orientation
+            )
+            power = min(max(pv_max_power * (panel / 1000.0), 0.0), pv_max_power)
+            elevation[i] = elev
+            azimuth[i] = azim
+            irradiance[i] = panel
+            power_kw[i] = power
+            energy_5min[i] = power * (5 / 60)
+
+
+def day_terms(latitude: float, day_of_year: np.ndarray) -> tuple:
+    """Return the day_constants rows of each distinct day and every row index."""
+    days, day_index = np.unique(day_of_year, return_inverse=True)
+    terms = np.array([day_constants(latitude, int(day)) for day in days])
+    return terms.reshape(-1, 5), day_index
+
+
+def fast_atan2(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Approximate np.arctan2 with a polynomial and branchless quadrant fix-ups."""
+    abs_y = np.abs(y)
+    abs_x = np.abs(x)
+    ratio_dtype = np.result_type(abs_y, abs_x)
+
+    # Fold the ratio into [0, 1], where the polynomial is accurate
+    swap = abs_y > abs_x
+    ratio = np.where(swap, abs_x, abs_y) / np.maximum(
+        np.where(swap, abs_y, abs_x), np.finfo(ratio_dtype).tiny
+    )
+    squared = ratio * ratio
+    angle = np.full_like(ratio, _ATAN_COEFFS[0])
+    for coeff in _ATAN_COEFFS[1:]:
+        angle = angle * squared + coeff
+    angle *= ratio
+
+    # Unfold to the full circle
+    angle = np.where(swap, math.pi / 2 - angle, angle)
+    angle = np.where(x < 0, math.pi - angle, angle)
+    return np.copysign(angle, y)
+
+
+def fast_asin(x: np.ndarray) -> np.ndarray:
+    """Approximate np.arcsin through fast_atan2."""
+    return fast_atan2(x, np.sqrt(np.maximum(0.0, 1.0 - x * x)))
+
+
+def check_fast_math(samples: int = 100_001) -> float:
+    """Return the largest error of fast_asin and fast_atan2 in degrees.
+
+    Both are compared with the NumPy functions in single and double precision,
+    and a ValueError is raised above FAST_MATH_TOLERANCE_DEG.
+    """
+    sine = np.linspace(-1.0, 1.0, samples)
+    # Points around the unit circle cover every atan2 quadrant
+    angle = np.linspace(-math.pi, math.pi, samples)
+    y, x = np.sin(angle), np.cos(angle)
+
+    error = 0.0
+    for dtype in (np.float32, np.float64):
+        asin_error = np.abs(fast_asin(sine.astype(dtype)) - np.arcsin(sine))
+        atan2_error = np.abs(
+            fast_atan2(y.astype(dtype), x.astype(dtype)) - np.arctan2(y, x)
+        )
+        error = max(error, float(asin_error.max()), float(atan2_error.max()))
+    error = math.degrees(error)
+    if error > FAST_MATH_TOLERANCE_DEG:
+        raise ValueError(
+            f"fast math error {error:.4f}° exceeds {FAST_MATH_TOLERANCE_DEG}°"
+        )
+    return error
+
+
+def calculate_solar_positions(
+    latitude: float,
+    longitude: float,
+    day_of_year: np.ndarray,
+    time_of_day: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate solar elevations and azimuths for arrays of UTC times.
+
+    Vectorized calculate_solar_position over the UTC day of year and hour of
+    day of each interval.
+    """
+    # Single precision is plenty for the rounded output and halves the
+    # memory traffic; Python float constants keep the arrays float32
+    time_of_day = np.asarray(time_of_day, dtype=np.float32)
+
+    # Declination terms are computed once per distinct day (and cached across
+    # calls), then spread over that day's intervals
+    terms, day_index = day_terms(latitude, day_of_year)
+    sin_lat_sin_dec, cos_lat_cos_dec, tan_dec = (
+        terms[:, :3].astype(np.float32)[day_index].T
+    )
+
+    # Hour angle from solar noon (degrees), with longitude correction
+    hour_angle = 15 * (time_of_day + longitude / 15.0 - 12)
+
+    # Convert to radians
+    lat_rad = math.radians(latitude)
+    hour_rad = np.radians(hour_angle)
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+
+    if USE_NUMBA:
+        # One compiled pass instead of a chain of NumPy temporaries
+        elevation, azimuth = _solar_position_gufunc(
+            hour_rad, sin_lat_sin_dec, cos_lat_cos_dec, tan_dec, sin_lat, cos_lat
+        )
+        return np.degrees(elevation), (np.degrees(azimuth) + 180) % 360
+
+    # Each sine and cosine is taken once and shared by elevation and azimuth
+    sin_hour = np.sin(hour_rad)
+    cos_hour = np.cos(hour_rad)
+
+    arcsin, arctan2 = (fast_asin, fast_atan2) if FAST_MATH else (np.arcsin, np.arctan2)
+
+    # Solar elevation
+    elevation = arcsin(sin_lat_sin_dec + cos_lat_cos_dec * cos_hour)
+
+    # Solar azimuth
+    azimuth = arctan2(sin_hour, cos_hour * sin_lat - tan_dec * cos_lat)
+
+    return np.degrees(elevation), (np.degrees(azimuth) + 180) % 360
+
+
+def calculate_panel_irradiances(
+    elevation: np.ndarray,
+    azimuth: np.ndarray,
+    panel_tilt: float,
+    panel_orientation: float,
+) -> np.ndarray:
+    """Calculate solar irradiance on a tilted panel for arrays of positions."""
+    if USE_NUMBA:
+        return _panel_irradiance_ufunc(
+            elevation, azimuth, panel_tilt, panel_orientation
+        )
+
+    # Convert to radians
+    elev_rad = np.radians(elevation)
+    azim_rad = np.radians(azimuth)
+    tilt_rad = math.radians(panel_tilt)
+    orient_rad = math.radians(panel_orientation)
+
+    sin_elev = np.sin(elev_rad)
+    cos_elev = np.cos(elev_rad)
+
+    # Angle between sun and panel normal
+    cos_incidence = sin_elev * math.cos(tilt_rad) + cos_elev * math.sin(
+        tilt_rad
+    ) * np.cos(azim_rad - orient_rad)
+
+    # Air mass, capped at 10 by flooring the sine at 0.1; this also keeps the
+    # values below the horizon finite, so no branch or masking is needed here
+    air_mass = 1 / np.maximum(sin_elev, 0.1)
+
+    # Clear sky irradiance (simplified model)
+    dni = 900.0 * np.exp(-0.14 * air_mass)  # Direct normal irradiance
+
+    # Panel irradiance, none with the sun at or below the horizon
+    return np.maximum(0, dni * cos_incidence) * (elevation > 0)
+
+
+def calculate_forecast(
+    latitude: float,
+    longitude: float,
+    day_of_year: np.ndarray,
+    time_of_day: np.ndarray,
+    panel_tilt: float,
+    panel_orientation: float,
+    pv_max_power: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate elevation, azimuth, irradiance, power and energy per interval."""
+    if USE_NUMBA:
+        # Intermediate terms stay in registers instead of temporary arrays;
+        # the math runs in double precision and only the outputs are float32
+        elevation, azimuth, irradiance, power_kw, energy_5min = (
+            np.empty(time_of_day.shape, dtype=np.float32) for _ in range(5)
+        )
+        _forecast_kernel(
+            *day_terms(latitude, day_of_year),
+            time_of_day,
+            longitude,
+            panel_tilt,
+            panel_orientation,
+            pv_max_power,
+            elevation,
+            azimuth,
+            irradiance,
+            power_kw,
+            energy_5min,
+        )
+        return elevation, azimuth, irradiance, power_kw, energy_5min
+
+    elevation, azimuth = calculate_solar_positions(
+        latitude, longitude, day_of_year, time_of_day
+    )
+
+    # Night intervals get no irradiance, so its trig only runs from the first
+    # to the last interval with the sun above the horizon
+    irradiance = np.zeros_like(elevation)
+    lit = np.flatnonzero(elevation > 0)
+    if lit.size:
+        daylight = slice(lit[0], lit[-1] + 1)
+        irradiance[daylight] = calculate_panel_irradiances(
+            elevation[daylight], azimuth[daylight], panel_tilt, panel_orientation
+        )
+
+    # Standard Test Conditions: 1000 W/m², power scales linearly with
+    # irradiance and is capped at the rated power
+    power_kw = np.clip(pv_max_power * (irradiance / 1000.0), 0, pv_max_power)
+
+    # Energy in 5 minutes (kWh)
+    energy_5min = power_kw * (5 / 60)  # 5 minutes = 1/12 hour
+
+    return elevation, azimuth, irradiance, power_kw, energy_5min
+
+
+@lru_cache(maxsize=8)
+def get_zone(timezone: str) -> tzinfo:
+    """Return the tzinfo of a timezone name, falling back to UTC if unknown."""
+    try:
+        return ZoneInfo(timezone)
+    except ZoneInfoNotFoundError:
+        _LOGGER.warning("Unknown timezone %s, using UTC", timezone)
+        return dt_timezone.utc
+
+
+@lru_cache(maxsize=128)
+def _cached_sun_times(
+    latitude: float, longitude: float, timezone: str, date_ordinal: int
+) -> tuple[datetime, datetime]:
+    """Get sunrise and sunset for a location and day, computed once per key."""
+    date_obj = datetime.fromordinal(date_ordinal).date()
     try:
         from astral import LocationInfo
         from astral.sun import sun
@@ -110,16 +442,25 @@ def get_sun_times(latitude: float, longitude: float, timezone: str, date_obj):
         location = LocationInfo("Test", "Test", timezone, latitude, longitude)
         s = sun(location.observer, date=date_obj)
 
-        return {"sunrise": s["sunrise"], "sunset": s["sunset"]}
+        return s["sunrise"], s["sunset"]
     except ImportError:
         # Fallback calculation
         base_date = datetime.combine(date_obj, datetime.min.time())
         base_date = base_date.replace(tzinfo=dt_timezone.utc)
 
-        return {
-            "sunrise": base_date + timedelta(hours=7),  # 7 AM UTC
-            "sunset": base_date + timedelta(hours=16),  # 4 PM UTC
-        }
+        return (
+            base_date + timedelta(hours=7),  # 7 AM UTC
+            base_date + timedelta(hours=16),  # 4 PM UTC
+        )
+
+
+def get_sun_times(latitude: float, longitude: float, timezone: str, date_obj):
+    """Mock function to get sunrise and sunset times."""
+    # Sun times only change with the day, so repeated calls reuse them
+    sunrise, sunset = _cached_sun_times(
+        round(latitude, 3), round(longitude, 3), timezone, date_obj.toordinal()
+    )
+    return {"sunrise": sunrise, "sunset": sunset}
 
 
 def test_forecast():
@@ -141,6 +482,8 @@ def test_forecast():
     print(f"📐 Panel Tilt: {PANEL_TILT}°")
     print(f"🧭 Panel Orientation: {PANEL_ORIENTATION}° (South)")
     print(f"⚡ PV Max Power: {PV_MAX_POWER} kW")
+    if FAST_MATH:
+        print(f"🧮 Fast math: max error {check_fast_math():.4f}°")
     print()
     print("🔄 Calculating solar energy forecast...")
 
@@ -165,8 +508,6 @@ def test_forecast():
         print(f"Using tomorrow's times: sunrise={sunrise_time}, sunset={sunset_time}")
 
     # Calculate full day forecast (24 hours in 5-minute intervals = 288 intervals)
-    full_day_forecast = []
-    total_daily_energy = 0
 
     # Start from midnight of the forecast day
     if hasattr(forecast_day, "date"):
@@ -175,96 +516,69 @@ def test_forecast():
         forecast_day_start = datetime.combine(forecast_day, datetime.min.time())
 
     # Make timezone-aware
-    try:
-        import pytz
-
-        tz = pytz.timezone(TIMEZONE)
-        current_time_full = tz.localize(forecast_day_start)
-    except ImportError:
-        current_time_full = forecast_day_start.replace(tzinfo=dt_timezone.utc)
+    zone = get_zone(TIMEZONE)
+    current_time_full = forecast_day_start.replace(tzinfo=zone)
 
     print(
         f"Calculating forecast from {current_time_full} for {forecast_day} (24h = 288 intervals)"
     )
 
-    # Generate 288 intervals (24 hours * 12 intervals per hour)
-    for interval in range(288):
-        # Get solar position
-        solar_pos = calculate_solar_position(LATITUDE, LONGITUDE, current_time_full)
-
-        # Calculate panel irradiance
-        irradiance = calculate_panel_irradiance(
-            solar_pos["elevation"],
-            solar_pos["azimuth"],
-            PANEL_TILT,
-            PANEL_ORIENTATION,
-        )
+    # Generate 288 intervals (24 hours * 12 intervals per hour) as fixed
+    # 5-minute offsets from midnight
+    day_start = current_time_full
+
+    # Solar position works on UTC time, so get each interval's UTC day of
+    # year and hour of day from a UTC grid
+    utc_day_start = day_start.astimezone(dt_timezone.utc)
+    utc_start = utc_day_start.replace(tzinfo=None)
+    grid = np.datetime64(utc_start, "s") + np.arange(288) * np.timedelta64(5, "m")
+    grid_days = grid.astype("datetime64[D]")
+    day_of_year = (grid_days - grid.astype("datetime64[Y]")).astype(int) + 1
+    time_of_day = (grid - grid_days) / np.timedelta64(1, "h")
+
+    # Evaluate all intervals at once
+    elevation, azimuth, irradiance, power_kw, energy_5min = calculate_forecast(
+        LATITUDE,
+        LONGITUDE,
+        day_of_year,
+        time_of_day,
+        PANEL_TILT,
+        PANEL_ORIENTATION,
+        PV_MAX_POWER,
+    )
 
-        # Calculate power output - pv_max_power is already the rated power
-        if solar_pos["elevation"] > 0 and irradiance > 0:
-            # Standard Test Conditions: 1000 W/m²
-            # Power scales linearly with irradiance
-            power_kw = PV_MAX_POWER * (irradiance / 1000.0)
-            power_kw = max(0, min(power_kw, PV_MAX_POWER))  # Cap at max power
-        else:
-            power_kw = 0.0
-
-        # Energy in 5 minutes (kWh)
-        energy_5min = power_kw * (5 / 60)  # 5 minutes = 1/12 hour
-
-        full_day_forecast.append(
-            {
-                "time": current_time_full.isoformat(),
-                "solar_elevation": round(solar_pos["elevation"], 2),
-                "solar_azimuth": round(solar_pos["azimuth"], 2),
-                "irradiance": round(irradiance, 2),
-                "power_kw": round(power_kw, 3),
-                "energy_5min_kwh": round(energy_5min, 4),
-            }
+    # Only daylight intervals produce energy
+    total_daily_energy = float(energy_5min.sum())
+
+    def interval_record(interval: int) -> ForecastInterval:
+        """Return the rounded output record of one interval of the full day."""
+        # Step in UTC so the offsets stay exact across a DST change
+        interval_start = utc_day_start + timedelta(seconds=300 * interval)
+        return ForecastInterval(
+            time=interval_start.astimezone(zone).isoformat(),
+            solar_elevation=round(float(elevation[interval]), 2),
+            power_kw=round(float(power_kw[interval]), 3),
+            energy_5min_kwh=round(float(energy_5min[interval]), 4),
+            solar_azimuth=round(float(azimuth[interval]), 2),
+            irradiance=round(float(irradiance[interval]), 2),
         )
 
-        if power_kw > 0:  # Only add energy during daylight
-            total_daily_energy += energy_5min
-
-        current_time_full += timedelta(minutes=5)
-
-    # Calculate remaining forecast (if before sunset)
-    remaining_forecast = []
+    # Calculate remaining forecast (if before sunset) as indices into the
+    # full day arrays
+    remaining = []
     remaining_energy = 0
 
     if start_time < sunset_time:
-        current_time = start_time
-        while current_time < sunset_time:
-            solar_pos = calculate_solar_position(LATITUDE, LONGITUDE, current_time)
-
-            if solar_pos["elevation"] > 0:
-                irradiance = calculate_panel_irradiance(
-                    solar_pos["elevation"],
-                    solar_pos["azimuth"],
-                    PANEL_TILT,
-                    PANEL_ORIENTATION,
-                )
-
-                if irradiance > 0:
-                    power_kw = PV_MAX_POWER * (irradiance / 1000.0)
-                    power_kw = max(0, min(power_kw, PV_MAX_POWER))
-                else:
-                    power_kw = 0.0
-
-                energy_5min = power_kw * (5 / 60)
-
-                remaining_forecast.append(
-                    {
-                        "time": current_time.isoformat(),
-                        "solar_elevation": round(solar_pos["elevation"], 2),
-                        "power_kw": round(power_kw, 3),
-                        "energy_5min_kwh": round(energy_5min, 4),
-                    }
-                )
-
-                remaining_energy += energy_5min
+        # The remaining forecast is the part of the full day's 5-minute grid
+        # from the interval holding now until sunset, so slice it instead of
+        # computing those intervals again
+        first = int((start_time - utc_day_start).total_seconds() // 300)
+        last = math.ceil((sunset_time - utc_day_start).total_seconds() / 300)
+        window = slice(max(first, 0), min(max(last, first, 0), 288))
 
-            current_time += timedelta(minutes=5)
+        # Only intervals with the sun above the horizon are listed
+        remaining = (np.flatnonzero(elevation[window] > 0) + window.start).tolist()
+        remaining_energy = float(energy_5min[remaining].sum())
 
     # Print results
     print("=" * 60)
@@ -276,43 +590,46 @@ def test_forecast():
     print(f"🌅 Sunrise: {sunrise_time}")
     print(f"🌇 Sunset: {sunset_time}")
     print(f"📅 Forecast Day: {forecast_day}")
-    print(f"📈 Remaining Intervals: {len(remaining_forecast)}")
-    print(f"📊 Full Day Intervals: {len(full_day_forecast)}")
+    print(f"📈 Remaining Intervals: {len(remaining)}")
+    print(f"📊 Full Day Intervals: {len(power_kw)}")
     print()
 
     # Show sample forecast
     print("📋 SAMPLE FULL DAY FORECAST (first 10 intervals):")
     print("Time                 Elevation  Power    Energy")
     print("-" * 50)
-    for i, item in enumerate(full_day_forecast[:10]):
-        time_str = datetime.fromisoformat(item["time"]).strftime("%H:%M")
+    # Output records are only built for the intervals shown
+    for item in map(interval_record, range(min(10, len(power_kw)))):
+        time_str = time_label(item.time)
         print(
-            f"{time_str:<20} {item['solar_elevation']:<10.1f} {item['power_kw']:<8.3f} {item['energy_5min_kwh']:<8.4f}"
+            f"{time_str:<20} {item.solar_elevation:<10.1f} {item.power_kw:<8.3f} {item.energy_5min_kwh:<8.4f}"
         )
 
-    if len(full_day_forecast) > 10:
-        print(f"... and {len(full_day_forecast) - 10} more intervals")
+    if len(power_kw) > 10:
+        print(f"... and {len(power_kw) - 10} more intervals")
     print()
 
-    if remaining_forecast:
+    if remaining:
         print("⏳ REMAINING FORECAST (next 5 intervals):")
         print("Time                 Elevation  Power    Energy")
         print("-" * 50)
-        for item in remaining_forecast[:5]:
-            time_str = datetime.fromisoformat(item["time"]).strftime("%H:%M")
+        for item in map(interval_record, remaining[:5]):
+            time_str = time_label(item.time)
             print(
-                f"{time_str:<20} {item['solar_elevation']:<10.1f} {item['power_kw']:<8.3f} {item['energy_5min_kwh']:<8.4f}"
+                f"{time_str:<20} {item.solar_elevation:<10.1f} {item.power_kw:<8.3f} {item.energy_5min_kwh:<8.4f}"
             )
     else:
         print("⏳ No remaining forecast (past sunset or no sun)")
 
     # Calculate statistics
-    powers = [item["power_kw"] for item in full_day_forecast if item["power_kw"] > 0]
-    if powers:
-        peak_power = max(powers)
-        avg_power = sum(powers) / len(powers)
-        peak_item = max(full_day_forecast, key=lambda x: x["power_kw"])
-        peak_time = datetime.fromisoformat(peak_item["time"]).strftime("%H:%M")
+    rounded_power = np.round(power_kw, 3)
+    producing = rounded_power > 0
+    if producing.any():
+        peak_index = int(rounded_power.argmax())
+        peak_power = float(rounded_power[peak_index])
+        avg_power = float(rounded_power[producing].mean())
+        peak_item = interval_record(peak_index)
+        peak_time = time_label(peak_item.time)
 
         print()
         print("📈 STATISTICS:")
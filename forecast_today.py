@@ -8,6 +8,9 @@ import math
 from datetime import datetime, timedelta
 import logging
 
+from custom_components.battery_management.solar_core import panel_irradiance
+from solar_day import day_constants, solar_position
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
@@ -23,101 +26,47 @@ class MockLocation:
 
 def calculate_solar_position(latitude: float, longitude: float, dt: datetime) -> dict:
     """Calculate solar elevation and azimuth for a given time and location."""
-    try:
-        # Convert to UTC if timezone-aware
-        if dt.tzinfo:
-            dt_utc = dt.utctimetuple()
-            dt_local = datetime(
-                dt_utc.tm_year,
-                dt_utc.tm_mon,
-                dt_utc.tm_mday,
-                dt_utc.tm_hour,
-                dt_utc.tm_min,
-                dt_utc.tm_sec,
-            )
-        else:
-            dt_local = dt
-
-        # Day of year
-        day_of_year = dt_local.timetuple().tm_yday
-
-        # Solar declination (degrees)
-        declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-
-        # Hour angle from solar noon (degrees)
-        # Adjust for longitude and timezone
-        time_of_day = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
-        solar_time = time_of_day + longitude / 15.0  # Longitude correction
-        hour_angle = 15 * (solar_time - 12)  # degrees from solar noon
-
-        # Convert to radians
-        lat_rad = math.radians(latitude)
-        dec_rad = math.radians(declination)
-        hour_rad = math.radians(hour_angle)
-
-        # Solar elevation
-        elevation = math.asin(
-            math.sin(lat_rad) * math.sin(dec_rad)
-            + math.cos(lat_rad) * math.cos(dec_rad) * math.cos(hour_rad)
+    # Convert to UTC if timezone-aware
+    if dt.tzinfo:
+        dt_utc = dt.utctimetuple()
+        dt_local = datetime(
+            dt_utc.tm_year,
+            dt_utc.tm_mon,
+            dt_utc.tm_mday,
+            dt_utc.tm_hour,
+            dt_utc.tm_min,
+            dt_utc.tm_sec,
         )
+    else:
+        dt_local = dt
 
-        # Solar azimuth
-        azimuth = math.atan2(
-            math.sin(hour_rad),
-            math.cos(hour_rad) * math.sin(lat_rad)
-            - math.tan(dec_rad) * math.cos(lat_rad),
-        )
+    # Declination and latitude terms are computed once per day
+    pre = day_constants(latitude, dt_local.timetuple().tm_yday)
 
-        return {
-            "elevation": math.degrees(elevation),
-            "azimuth": (math.degrees(azimuth) + 180) % 360,
-        }
+    # Hour angle from solar noon (degrees)
+    # Adjust for longitude and timezone
+    time_of_day = dt_local.hour + dt_local.minute / 60.0 + dt_local.second / 3600.0
+    solar_time = time_of_day + longitude / 15.0  # Longitude correction
+    hour_angle = 15 * (solar_time - 12)  # degrees from solar noon
 
-    except Exception as e:
-        _LOGGER.error("Error calculating solar position: %s", e)
-        return {"elevation": 0, "azimuth": 0}
+    elevation, azimuth = solar_position(pre, hour_angle)
+    return {"elevation": elevation, "azimuth": azimuth}
 
 
 def calculate_panel_irradiance(
     elevation: float, azimuth: float, panel_tilt: float, panel_orientation: float
 ) -> float:
     """Calculate solar irradiance on tilted panel."""
-    if elevation <= 0:
-        return 0
-
-    # Convert to radians
-    elev_rad = math.radians(elevation)
-    azim_rad = math.radians(azimuth)
+    # Enhanced clear sky model (direct, diffuse and reflected), shared with
+    # the integration
     tilt_rad = math.radians(panel_tilt)
-    orient_rad = math.radians(panel_orientation)
-
-    # Angle between sun and panel normal
-    cos_incidence = math.sin(elev_rad) * math.cos(tilt_rad) + math.cos(
-        elev_rad
-    ) * math.sin(tilt_rad) * math.cos(azim_rad - orient_rad)
-
-    # Air mass calculation
-    air_mass = 1 / math.sin(elev_rad) if elevation > 0 else float("inf")
-    air_mass = min(air_mass, 10)  # Cap at 10
-
-    # Enhanced clear sky irradiance (balanced for realistic daily totals)
-    # Maintain peak performance while reducing daily overestimation
-    transmission = 0.78 ** (air_mass**0.62)  # Slightly more conservative
-    dni = 1150.0 * transmission  # Reduced from 1200 to 1150
-
-    # Enhanced empirical clear-sky global horizontal irradiance
-    ghi = dni * math.sin(elev_rad) + 160.0  # Reduced base diffuse from 180 to 160
-    diffuse = 0.25 * ghi  # Reduced diffuse component from 30% to 25%
-    reflected = (
-        0.25 * (1 - math.cos(tilt_rad)) * ghi / 2
-    )  # Reduced albedo from 0.3 to 0.25
-
-    panel_irradiance = max(0, dni * cos_incidence + diffuse + reflected)
-
-    # Panel irradiance
-    # Panel_irradiance = max(0, dni * cos_incidence)
-
-    return panel_irradiance
+    return panel_irradiance(
+        elevation,
+        azimuth,
+        math.sin(tilt_rad),
+        math.cos(tilt_rad),
+        math.radians(panel_orientation),
+    )
 
 
 def simulate_daytime_forecast():
@@ -0,0 +1,29 @@
+"""Helpers shared by the standalone test scripts."""
+
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+# The walkthrough is printed when a script is run directly (or with
+# VERBOSE=1); under a test runner the calculations run without console output
+VERBOSE = os.environ.get("VERBOSE") == "1" or "pytest" not in sys.modules
+
+
+def verbose_print(*args, **kwargs):
+    """Print only in verbose mode."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def get_sun_times(latitude, longitude, timezone_name, day) -> MappingProxyType:
+    """Return astral's sun times for a location and date, computed once per key.
+
+    The cached mapping is shared between callers, so it is read-only.
+    """
+    from astral import LocationInfo
+    from astral.sun import sun
+
+    location = LocationInfo("Test", "Romania", timezone_name, latitude, longitude)
+    return MappingProxyType(sun(location.observer, date=day))
@@ -34,6 +34,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.0.0",
             "pytest-homeassistant-custom-component>=0.13.0",
             "black>=23.0.0",
             "pylint>=2.17.0",
@@ -0,0 +1,50 @@
+"""Per-day solar position kernels used by the standalone forecast scripts."""
+
+import math
+from functools import lru_cache
+
+from custom_components.battery_management.solar_core import njit
+
+
+@lru_cache(maxsize=8)
+def day_constants(latitude: float, day_of_year: int) -> tuple:
+    """Return the solar position terms that stay fixed for a whole day."""
+    # Solar declination (degrees)
+    declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
+
+    # Convert to radians
+    lat_rad = math.radians(latitude)
+    dec_rad = math.radians(declination)
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    return (
+        sin_lat * math.sin(dec_rad),
+        cos_lat * math.cos(dec_rad),
+        math.tan(dec_rad),
+        sin_lat,
+        cos_lat,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def solar_position(day_terms: tuple, hour_angle: float) -> tuple[float, float]:
+    """Return solar elevation and azimuth (degrees) from day_constants terms.
+
+    ``hour_angle`` is in degrees from solar noon.
+    """
+    sin_lat_sin_dec, cos_lat_cos_dec, tan_dec, sin_lat, cos_lat = day_terms
+    hour_rad = math.radians(hour_angle)
+
+    # Sine and cosine of the same angle side by side, so the compiler can pair
+    # them into a single sincos call
+    sin_hour = math.sin(hour_rad)
+    cos_hour = math.cos(hour_rad)
+
+    # Solar elevation
+    elevation = math.asin(sin_lat_sin_dec + cos_lat_cos_dec * cos_hour)
+
+    # Solar azimuth
+    azimuth = math.atan2(sin_hour, cos_hour * sin_lat - tan_dec * cos_lat)
+
+    # Convert azimuth to compass bearing (0° = North, 180° = South)
+    return math.degrees(elevation), (math.degrees(azimuth) + 180) % 360
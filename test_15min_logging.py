@@ -4,27 +4,27 @@ Test script for 15-minute interval solar energy forecast with detailed logging
 """
 
 import logging
-import sys
+import os
 from datetime import datetime
-from pathlib import Path
 
-# Add the custom_components path to sys.path
-sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
+from custom_components.battery_management.sensor import calculate_energy_forecast
 
-from battery_management.sensor import calculate_energy_forecast
+# Detailed interval logs are opt-in (FORECAST_DEBUG=1), since formatting a
+# DEBUG record for every interval slows down each forecast
+LOG_LEVEL = logging.DEBUG if os.environ.get("FORECAST_DEBUG") else logging.INFO
 
 # Configure logging to see the output
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG to see detailed interval logs
+    level=LOG_LEVEL,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(),
     ],
 )
 
-# Explicitly set the battery_management logger to DEBUG level to see irradiance debug logs
-logger = logging.getLogger("battery_management.sensor")
-logger.setLevel(logging.DEBUG)
+# Explicitly set the battery_management logger level to see irradiance debug logs
+logger = logging.getLogger("custom_components.battery_management.sensor")
+logger.setLevel(LOG_LEVEL)
 
 
 def test_15min_forecast():
@@ -41,7 +41,7 @@ def test_15min_forecast():
     print()
     print("Log levels:")
     print("  📊 INFO: Main calculation steps and results")
-    print("  🔍 DEBUG: Individual interval calculations")
+    print("  🔍 DEBUG: Individual interval calculations (set FORECAST_DEBUG=1)")
     print("  ❌ ERROR: Error conditions")
     print()
     print("=" * 80)
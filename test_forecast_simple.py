@@ -4,14 +4,9 @@ Simple test for the 15-minute forecast with corrected solar calculations
 """
 
 import logging
-import sys
 from datetime import datetime
-from pathlib import Path
 
-# Add the custom_components path to sys.path
-sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
-
-from battery_management.sensor import calculate_energy_forecast
+from custom_components.battery_management.sensor import calculate_energy_forecast
 
 # Configure logging
 logging.basicConfig(
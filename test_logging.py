@@ -4,14 +4,10 @@ Test script to demonstrate the logging output from the solar energy forecast sen
 """
 
 import logging
-import sys
 from datetime import datetime
-from pathlib import Path
 
-# Add the custom_components path to sys.path
-sys.path.insert(0, str(Path(__file__).parent / "custom_components"))
-
-from battery_management.sensor import calculate_energy_forecast
+from custom_components.battery_management.sensor import calculate_energy_forecast
+from script_helpers import verbose_print
 
 # Configure logging to see the output
 logging.basicConfig(
@@ -26,20 +22,22 @@ logging.basicConfig(
 def test_logging():
     """Test the logging output from the forecast calculation."""
 
-    print("=" * 80)
-    print("🔍 TESTING SOLAR ENERGY FORECAST LOGGING")
-    print("=" * 80)
-    print()
-    print("This test demonstrates the logging that will appear in Home Assistant logs")
-    print("when the Solar Energy Forecast sensor calculates its values.")
-    print()
-    print("Log levels:")
-    print("  📊 INFO: Main calculation steps and results")
-    print("  🔍 DEBUG: Detailed calculation progress")
-    print("  ❌ ERROR: Error conditions")
-    print()
-    print("=" * 80)
-    print()
+    verbose_print("=" * 80)
+    verbose_print("🔍 TESTING SOLAR ENERGY FORECAST LOGGING")
+    verbose_print("=" * 80)
+    verbose_print()
+    verbose_print(
+        "This test demonstrates the logging that will appear in Home Assistant logs"
+    )
+    verbose_print("when the Solar Energy Forecast sensor calculates its values.")
+    verbose_print()
+    verbose_print("Log levels:")
+    verbose_print("  📊 INFO: Main calculation steps and results")
+    verbose_print("  🔍 DEBUG: Detailed calculation progress")
+    verbose_print("  ❌ ERROR: Error conditions")
+    verbose_print()
+    verbose_print("=" * 80)
+    verbose_print()
 
     # Test configuration
     latitude = 45.76
@@ -49,13 +47,13 @@ def test_logging():
     panel_orientation = 180.0
     pv_max_power = 10.0
 
-    print(f"Testing with: {latitude}°N, {longitude}°E, {timezone}")
-    print(
+    verbose_print(f"Testing with: {latitude}°N, {longitude}°E, {timezone}")
+    verbose_print(
         f"Panel: {panel_tilt}° tilt, {panel_orientation}° orientation, {pv_max_power}kW max power"
     )
-    print()
-    print("🔴 Starting forecast calculation (watch for logs)...")
-    print("=" * 80)
+    verbose_print()
+    verbose_print("🔴 Starting forecast calculation (watch for logs)...")
+    verbose_print("=" * 80)
 
     # Call the forecast function - this will generate the logs
     result = calculate_energy_forecast(
@@ -67,28 +65,33 @@ def test_logging():
         pv_max_power=pv_max_power,
     )
 
-    print("=" * 80)
-    print("🔴 Forecast calculation complete!")
-    print()
-    print("📋 RESULTS SUMMARY:")
-    print(f"  🔋 Remaining Energy: {result.get('total_energy', 0):.3f} kWh")
-    print(f"  ☀️ Daily Energy: {result.get('total_daily_energy', 0):.3f} kWh")
-    print(f"  📈 Remaining Intervals: {len(result.get('forecast', []))}")
-    print(f"  📊 Full Day Intervals: {len(result.get('full_day_forecast', []))}")
-    print()
-    print("=" * 80)
-    print("✅ LOGGING TEST COMPLETE")
-    print()
-    print("In Home Assistant, these logs will appear in:")
-    print("  • Developer Tools > Logs")
-    print("  • Configuration > Logs")
-    print("  • home-assistant.log file")
-    print()
-    print("To see these logs in Home Assistant:")
-    print("  1. Go to Developer Tools > Logs")
-    print("  2. Filter by 'custom_components.battery_management'")
-    print("  3. The sensor updates every 30 seconds by default")
-    print("=" * 80)
+    verbose_print("=" * 80)
+    verbose_print("🔴 Forecast calculation complete!")
+    verbose_print()
+    verbose_print("📋 RESULTS SUMMARY:")
+    verbose_print(f"  🔋 Remaining Energy: {result.get('total_energy', 0):.3f} kWh")
+    verbose_print(f"  ☀️ Daily Energy: {result.get('total_daily_energy', 0):.3f} kWh")
+    verbose_print(f"  📈 Remaining Intervals: {len(result.get('forecast', []))}")
+    verbose_print(
+        f"  📊 Full Day Intervals: {len(result.get('full_day_forecast', []))}"
+    )
+    verbose_print()
+    verbose_print("=" * 80)
+    verbose_print("✅ LOGGING TEST COMPLETE")
+    verbose_print()
+    verbose_print("In Home Assistant, these logs will appear in:")
+    verbose_print("  • Developer Tools > Logs")
+    verbose_print("  • Configuration > Logs")
+    verbose_print("  • home-assistant.log file")
+    verbose_print()
+    verbose_print("To see these logs in Home Assistant:")
+    verbose_print("  1. Go to Developer Tools > Logs")
+    verbose_print("  2. Filter by 'custom_components.battery_management'")
+    verbose_print("  3. The sensor updates every 30 seconds by default")
+    verbose_print("=" * 80)
+
+    assert 0 <= result["total_energy"] <= result["total_daily_energy"]
+    assert len(result["full_day_forecast"]) == 96
 
 
 if __name__ == "__main__":
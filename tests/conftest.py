@@ -1,65 +1,165 @@
 """Test configuration for pytest."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from datetime import date, datetime, timezone
+from enum import Enum
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
 import sys
 import os
+import types
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-# Create proper mock modules for homeassistant
+# Create lightweight stub modules for homeassistant
 def create_mock_module(name):
-    """Create a mock module with common attributes."""
-    mock = MagicMock()
-    mock.__name__ = name
-    return mock
+    """Create an empty stub module; set the attributes the code reads on it."""
+    return types.ModuleType(name)
 
 
-# Mock homeassistant modules with Platform enum
+# Stub homeassistant modules with Platform enum
 ha_const_mock = create_mock_module("homeassistant.const")
-ha_const_mock.Platform = MagicMock()
-ha_const_mock.Platform.SENSOR = "sensor"
-ha_const_mock.Platform.SWITCH = "switch"
+ha_const_mock.Platform = types.SimpleNamespace(SENSOR="sensor", SWITCH="switch")
 ha_const_mock.PERCENTAGE = "%"
+ha_const_mock.CONF_NAME = "name"
+ha_const_mock.EVENT_CORE_CONFIG_UPDATE = "core_config_updated"
 
 ha_core_mock = create_mock_module("homeassistant.core")
-ha_core_mock.HomeAssistant = MagicMock()
+ha_core_mock.HomeAssistant = type("HomeAssistant", (), {})
+ha_core_mock.Event = type("Event", (), {})
 ha_core_mock.callback = lambda func: func
 
 ha_setup_mock = create_mock_module("homeassistant.setup")
 ha_setup_mock.async_setup_component = MagicMock(return_value=True)
 
 ha_config_entries_mock = create_mock_module("homeassistant.config_entries")
-ha_config_entries_mock.ConfigEntry = MagicMock()
-
-sys.modules["homeassistant"] = create_mock_module("homeassistant")
-sys.modules["homeassistant.core"] = ha_core_mock
-sys.modules["homeassistant.const"] = ha_const_mock
-sys.modules["homeassistant.setup"] = ha_setup_mock
-sys.modules["homeassistant.config_entries"] = ha_config_entries_mock
-sys.modules["homeassistant.helpers"] = create_mock_module("homeassistant.helpers")
-sys.modules["homeassistant.components"] = create_mock_module("homeassistant.components")
-sys.modules["homeassistant.components.sensor"] = create_mock_module(
-    "homeassistant.components.sensor"
-)
-sys.modules["homeassistant.components.switch"] = create_mock_module(
-    "homeassistant.components.switch"
-)
-sys.modules["homeassistant.helpers.entity_platform"] = create_mock_module(
-    "homeassistant.helpers.entity_platform"
-)
-sys.modules["homeassistant.helpers.update_coordinator"] = create_mock_module(
+ha_config_entries_mock.ConfigEntry = type("ConfigEntry", (), {})
+
+
+class Entity:
+    """Plain entity base, so platform classes can be built and inspected."""
+
+    hass = None
+
+    def async_write_ha_state(self):
+        """Do nothing; there is no state machine in the tests."""
+
+
+class SensorDeviceClass(str, Enum):
+    """Sensor device classes used by the integration."""
+
+    BATTERY = "battery"
+    DURATION = "duration"
+    ENERGY = "energy"
+    ENUM = "enum"
+    TIMESTAMP = "timestamp"
+
+
+class SensorStateClass(str, Enum):
+    """Sensor state classes used by the integration."""
+
+    MEASUREMENT = "measurement"
+    TOTAL = "total"
+
+
+class DataUpdateCoordinator:
+    """Coordinator base that only stores its settings."""
+
+    def __init__(self, hass, logger, *, name, update_interval):
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data = None
+
+
+class CoordinatorEntity(Entity):
+    """Entity base bound to a coordinator."""
+
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+
+
+ha_sensor_mock = create_mock_module("homeassistant.components.sensor")
+ha_sensor_mock.SensorDeviceClass = SensorDeviceClass
+ha_sensor_mock.SensorStateClass = SensorStateClass
+ha_sensor_mock.SensorEntity = type("SensorEntity", (Entity,), {})
+
+ha_switch_mock = create_mock_module("homeassistant.components.switch")
+ha_switch_mock.SwitchEntity = type("SwitchEntity", (Entity,), {})
+
+ha_entity_platform_mock = create_mock_module("homeassistant.helpers.entity_platform")
+ha_entity_platform_mock.AddEntitiesCallback = object
+
+ha_update_coordinator_mock = create_mock_module(
     "homeassistant.helpers.update_coordinator"
 )
-sys.modules["homeassistant.data_entry_flow"] = create_mock_module(
-    "homeassistant.data_entry_flow"
-)
-sys.modules["homeassistant.helpers.config_validation"] = create_mock_module(
-    "homeassistant.helpers.config_validation"
-)
-sys.modules["voluptuous"] = create_mock_module("voluptuous")
+ha_update_coordinator_mock.DataUpdateCoordinator = DataUpdateCoordinator
+ha_update_coordinator_mock.CoordinatorEntity = CoordinatorEntity
+ha_update_coordinator_mock.UpdateFailed = type("UpdateFailed", (Exception,), {})
+
+
+def get_time_zone(time_zone_str):
+    """Return the ZoneInfo of a time zone name, or None if it is unknown."""
+    try:
+        return ZoneInfo(time_zone_str)
+    except (KeyError, ValueError):
+        return None
+
+
+# Tests control the clock by patching now()
+ha_dt_mock = create_mock_module("homeassistant.util.dt")
+ha_dt_mock.get_time_zone = get_time_zone
+ha_dt_mock.utcnow = lambda: datetime.now(timezone.utc)
+ha_dt_mock.now = lambda time_zone=None: datetime.now(time_zone)
+
+
+class ReadOnlyDict(dict):
+    """Dict that refuses changes, like Home Assistant's ReadOnlyDict."""
+
+    def _readonly(self, *args, **kwargs):
+        raise RuntimeError(f"Cannot modify {self.__class__.__name__}")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+ha_read_only_dict_mock = create_mock_module("homeassistant.util.read_only_dict")
+ha_read_only_dict_mock.ReadOnlyDict = ReadOnlyDict
+
+ha_util_mock = create_mock_module("homeassistant.util")
+ha_util_mock.dt = ha_dt_mock
+ha_util_mock.read_only_dict = ha_read_only_dict_mock
+
+for module in (
+    create_mock_module("homeassistant"),
+    ha_core_mock,
+    ha_const_mock,
+    ha_setup_mock,
+    ha_config_entries_mock,
+    create_mock_module("homeassistant.helpers"),
+    create_mock_module("homeassistant.components"),
+    ha_sensor_mock,
+    ha_switch_mock,
+    ha_entity_platform_mock,
+    ha_update_coordinator_mock,
+    ha_util_mock,
+    ha_dt_mock,
+    ha_read_only_dict_mock,
+    create_mock_module("homeassistant.data_entry_flow"),
+    create_mock_module("homeassistant.helpers.config_validation"),
+    create_mock_module("voluptuous"),
+):
+    sys.modules[module.__name__] = module
+
+# (name, timezone, latitude, longitude, date) the tests need sun times for
+SUN_TIMES_CASES = [
+    ("NYC", "America/New_York", 40.7128, -74.0060, date(2024, 6, 15)),
+    ("Bucharest", "Europe/Bucharest", 45.76, 21.42, date(2024, 6, 15)),
+    ("Bucharest", "Europe/Bucharest", 45.76, 21.42, date(2024, 12, 15)),
+]
 
 
 @pytest.fixture
@@ -74,3 +174,27 @@ def hass():
             return True
 
     return MockHass()
+
+
+@pytest.fixture(scope="session")
+def precomputed_sun_times():
+    """Return astral sun times for every SUN_TIMES_CASES entry, computed once."""
+    from astral import LocationInfo
+    from astral.sun import sun
+
+    return {
+        (latitude, longitude, day): sun(
+            LocationInfo(name, name, timezone, latitude, longitude).observer,
+            date=day,
+        )
+        for name, timezone, latitude, longitude, day in SUN_TIMES_CASES
+    }
+
+
+@pytest.fixture(
+    params=SUN_TIMES_CASES, ids=lambda case: f"{case[0]}-{case[4].isoformat()}"
+)
+def sun_times(request, precomputed_sun_times):
+    """Return the precomputed sun times for each of SUN_TIMES_CASES in turn."""
+    _, _, latitude, longitude, day = request.param
+    return precomputed_sun_times[(latitude, longitude, day)]
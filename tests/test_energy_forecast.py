@@ -0,0 +1,230 @@
+"""Tests for the energy forecast slicing and the coordinator forecast cache."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.battery_management import sensor
+from custom_components.battery_management.const import (
+    CONF_PV_MAX_POWER,
+    CONF_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+)
+
+LATITUDE = 45.76
+LONGITUDE = 21.42
+TIMEZONE = "Europe/Bucharest"
+ZONE = ZoneInfo(TIMEZONE)
+
+
+def _forecast(start_time, include_intervals=True):
+    """Return the forecast for a 10 kW south facing array at 30° tilt."""
+    return sensor.calculate_energy_forecast(
+        LATITUDE,
+        LONGITUDE,
+        TIMEZONE,
+        30.0,
+        180.0,
+        10.0,
+        start_time=start_time,
+        include_intervals=include_intervals,
+    )
+
+
+def _wall_clock(entry):
+    """Return the HH:MM of a forecast entry."""
+    return entry["time"][11:16]
+
+
+def _local_sunset(result):
+    """Return the local HH:MM of the forecast's sunset."""
+    sunset = datetime.fromisoformat(result["sunset_time"]).astimezone(ZONE)
+    return sunset.strftime("%H:%M")
+
+
+def _assert_slice_of_full_day(result):
+    """Check the remaining forecast is the full day between start and sunset."""
+    forecast = result["forecast"]
+    full_day = result["full_day_forecast"]
+    assert len(full_day) == 96
+
+    first = full_day.index(forecast[0])
+    assert full_day[first : first + len(forecast)] == forecast
+    # No interval before the start or from sunset on is included
+    start = datetime.fromisoformat(result["forecast_start"]).strftime("%H:%M")
+    assert first == 0 or _wall_clock(full_day[first - 1]) < start
+    assert _wall_clock(forecast[-1]) < _local_sunset(result)
+    assert _wall_clock(full_day[first + len(forecast)]) >= _local_sunset(result)
+
+    assert result["total_energy"] == pytest.approx(
+        sum(entry["energy_15min_kwh"] for entry in forecast), abs=0.01
+    )
+
+
+def test_forecast_before_sunrise():
+    """Test that before sunrise all of today's energy is still ahead."""
+    result = _forecast(datetime(2025, 6, 1, 3, 0, tzinfo=ZONE))
+
+    assert result["forecast_day"] == "2025-06-01"
+    assert _wall_clock(result["forecast"][0]) == "03:00"
+    assert result["total_energy"] == pytest.approx(
+        result["total_daily_energy"], abs=0.01
+    )
+    _assert_slice_of_full_day(result)
+
+
+def test_forecast_midday():
+    """Test that the remaining forecast starts at the next interval."""
+    result = _forecast(datetime(2025, 6, 1, 12, 7, tzinfo=ZONE))
+
+    assert _wall_clock(result["forecast"][0]) == "12:15"
+    assert 0 < result["total_energy"] < result["total_daily_energy"]
+    assert "peak_power_kw_remaining" in result
+    _assert_slice_of_full_day(result)
+
+
+def test_forecast_after_sunset():
+    """Test that past sunset nothing remains and tomorrow is forecast."""
+    result = _forecast(datetime(2025, 6, 1, 22, 0, tzinfo=ZONE))
+
+    assert result["forecast_day"] == "2025-06-02"
+    assert result["total_energy"] == 0
+    assert result["forecast"] == ()
+    assert len(result["full_day_forecast"]) == 96
+    assert result["total_daily_energy"] > 0
+    assert "peak_power_kw_remaining" not in result
+
+    later = _forecast(datetime(2025, 6, 1, 23, 0, tzinfo=ZONE))
+    assert later["full_day_forecast"] is result["full_day_forecast"]
+
+
+def test_forecast_on_dst_change_day():
+    """Test that the slice follows local wall-clock time on a DST change day."""
+    # Clocks in Bucharest go from 03:00 to 04:00 on 30 March 2025
+    result = _forecast(datetime(2025, 3, 30, 13, 0, tzinfo=ZONE))
+
+    assert result["forecast_day"] == "2025-03-30"
+    assert _wall_clock(result["forecast"][0]) == "13:00"
+    _assert_slice_of_full_day(result)
+
+
+def test_forecast_results_share_read_only_entries():
+    """Test that results share the cached day, which cannot be changed."""
+    start_time = datetime(2025, 6, 1, 12, 0, tzinfo=ZONE)
+    first = _forecast(start_time)
+    second = _forecast(start_time + timedelta(minutes=15))
+
+    assert second["full_day_forecast"] is first["full_day_forecast"]
+    assert second["forecast"][0] is first["forecast"][1]
+    with pytest.raises(RuntimeError):
+        first["full_day_forecast"][50]["power_kw"] = -1.0
+
+
+def test_totals_only_forecast():
+    """Test that the interval lists are left out when not asked for."""
+    start_time = datetime(2025, 6, 1, 12, 0, tzinfo=ZONE)
+    result = _forecast(start_time, False)
+    full = _forecast(start_time)
+
+    assert "forecast" not in result
+    assert "full_day_forecast" not in result
+    assert result["total_energy"] == full["total_energy"]
+    assert result["total_daily_energy"] == full["total_daily_energy"]
+
+
+def test_vectorized_forecast_matches_scalar():
+    """Test the batched full day intervals against per-interval scalar calls."""
+    panel_tilt, panel_orientation, pv_max_power = 30.0, 180.0, 10.0
+    result = _forecast(datetime(2024, 6, 21, 6, 0, tzinfo=ZONE))
+
+    full_day = result["full_day_forecast"]
+    assert len(full_day) == 96
+    for entry in full_day:
+        # The solar model works on local wall-clock time
+        moment = datetime.fromisoformat(entry["time"][:19])
+        position = sensor.calculate_solar_position(LATITUDE, LONGITUDE, moment)
+        irradiance = sensor.calculate_panel_irradiance(
+            position["elevation"], position["azimuth"], panel_tilt, panel_orientation
+        )
+        power_kw = min(max(pv_max_power * irradiance / 1000.0, 0.0), pv_max_power)
+
+        assert entry["solar_elevation"] == pytest.approx(
+            position["elevation"], abs=0.01
+        )
+        assert entry["solar_azimuth"] == pytest.approx(position["azimuth"], abs=0.01)
+        assert entry["irradiance"] == pytest.approx(irradiance, abs=0.01)
+        assert entry["power_kw"] == pytest.approx(power_kw, abs=0.001)
+        assert entry["energy_15min_kwh"] == pytest.approx(power_kw / 4, abs=0.0001)
+
+
+@pytest.fixture
+def coordinator():
+    """Return a coordinator whose options override part of the entry data."""
+    hass = MagicMock()
+    hass.config.latitude = LATITUDE
+    hass.config.longitude = LONGITUDE
+    hass.config.time_zone = TIMEZONE
+
+    config_entry = MagicMock()
+    config_entry.entry_id = "test_entry"
+    config_entry.data = {CONF_PV_MAX_POWER: 10.0, CONF_UPDATE_INTERVAL: 60}
+    config_entry.options = {CONF_PV_MAX_POWER: 5.0, CONF_UPDATE_INTERVAL: 1}
+    return sensor.BatteryDataUpdateCoordinator(hass, config_entry)
+
+
+def test_coordinator_merges_options(coordinator):
+    """Test that options override the entry data and the interval is clamped."""
+    assert coordinator.pv_max_power == 5.0
+    assert coordinator.update_interval == timedelta(seconds=MIN_UPDATE_INTERVAL)
+
+
+def test_coordinator_forecast_cache(coordinator, monkeypatch):
+    """Test that forecasts are reused within a quarter hour and then dropped."""
+    calls = []
+    calculate_energy_forecast = sensor.calculate_energy_forecast
+
+    def counting_forecast(**kwargs):
+        calls.append(kwargs)
+        return calculate_energy_forecast(**kwargs)
+
+    clock = [datetime(2025, 6, 1, 12, 0, tzinfo=ZONE)]
+    monkeypatch.setattr(sensor, "calculate_energy_forecast", counting_forecast)
+    monkeypatch.setattr(sensor.dt_util, "now", lambda time_zone=None: clock[0])
+
+    def energy_forecast(include_intervals=True):
+        return coordinator.energy_forecast(
+            LATITUDE,
+            LONGITUDE,
+            TIMEZONE,
+            30.0,
+            180.0,
+            coordinator.pv_max_power,
+            include_intervals,
+        )
+
+    # A totals-only forecast is upgraded once the intervals are asked for
+    totals = energy_forecast(include_intervals=False)
+    full = energy_forecast()
+    assert len(calls) == 2
+    assert "forecast" not in totals and "forecast" in full
+
+    # Later calls in the same quarter hour reuse the cached forecast
+    clock[0] = datetime(2025, 6, 1, 12, 14, 59, tzinfo=ZONE)
+    assert energy_forecast() is full
+    assert energy_forecast(include_intervals=False) is full
+    assert len(calls) == 2
+
+    # The next quarter hour is recalculated and the old bucket is dropped
+    clock[0] = datetime(2025, 6, 1, 12, 15, tzinfo=ZONE)
+    later = energy_forecast()
+    assert len(calls) == 3
+    assert later is not full
+    assert later["total_energy"] < full["total_energy"]
+    assert len(coordinator._forecast_cache) == 1
+
+    # A different panel setup gets its own entry
+    coordinator.energy_forecast(LATITUDE, LONGITUDE, TIMEZONE, 30.0, 90.0, 5.0)
+    assert len(calls) == 4
+    assert len(coordinator._forecast_cache) == 2
@@ -35,7 +35,6 @@ async def test_setup_integration(mock_hass, mock_config_entry):
     """Test the integration setup."""
     # Import after mocks are in place
     from custom_components.battery_management import async_setup_entry
-    from custom_components.battery_management.const import DOMAIN
 
     # Create a mock config entry
     config_entry = MagicMock()
@@ -46,7 +45,8 @@ async def test_setup_integration(mock_hass, mock_config_entry):
     result = await async_setup_entry(mock_hass, config_entry)
 
     assert result is True
-    assert DOMAIN in mock_hass.data
+    # Options changes reload the entry
+    config_entry.add_update_listener.assert_called_once()
     # Verify the async_forward_entry_setups was called
     mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
 
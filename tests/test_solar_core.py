@@ -0,0 +1,74 @@
+"""Tests for the shared solar position kernels."""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from custom_components.battery_management.solar_core import (
+    ephemeris_position,
+    ephemeris_position_array,
+    julian_day_number,
+)
+
+# (latitude, longitude, time, elevation, azimuth) from the ephemeris, pinned so
+# a change to the solar model shows up as a test failure
+REFERENCE_POSITIONS = [
+    (45.76, 21.42, datetime(2024, 6, 21, 12, 0), 61.745, 134.944),
+    (45.76, 21.42, datetime(2024, 12, 21, 9, 30), 2.606, 128.132),
+    (40.7128, -74.0060, datetime(2024, 3, 20, 16, 15), -33.962, 305.849),
+    (-33.87, 151.21, datetime(2024, 9, 1, 2, 0), 20.301, 295.481),
+]
+
+# Positions are only used for 15-minute PV forecasts
+TOLERANCE_DEG = 0.1
+
+
+def _jd_and_mst(moment):
+    """Return the Julian day and mean solar time in hours for a time."""
+    second_of_day = moment.hour * 3600 + moment.minute * 60 + moment.second
+    jd = julian_day_number(moment) + (second_of_day - 43200) / 86400.0
+    return jd, second_of_day / 3600.0
+
+
+def test_julian_day_number():
+    """Test the Julian day number at the J2000.0 epoch."""
+    assert julian_day_number(datetime(2000, 1, 1)) == 2451545
+
+
+@pytest.mark.parametrize(
+    "latitude,longitude,moment,elevation,azimuth", REFERENCE_POSITIONS
+)
+def test_ephemeris_position(latitude, longitude, moment, elevation, azimuth):
+    """Test the scalar ephemeris against the pinned positions."""
+    lat_rad = math.radians(latitude)
+    jd, mst = _jd_and_mst(moment)
+    result = ephemeris_position(
+        jd, mst, math.sin(lat_rad), math.cos(lat_rad), longitude
+    )
+
+    assert result[0] == pytest.approx(elevation, abs=TOLERANCE_DEG)
+    assert result[1] == pytest.approx(azimuth, abs=TOLERANCE_DEG)
+
+
+def test_ephemeris_position_array_matches_scalar():
+    """Test the vectorized ephemeris against the scalar one over a day."""
+    latitude, longitude = 45.76, 21.42
+    lat_rad = math.radians(latitude)
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+
+    seconds = 900 * np.arange(96)
+    jd = julian_day_number(datetime(2024, 6, 21)) + (seconds - 43200) / 86400.0
+    elevation, azimuth = ephemeris_position_array(
+        jd, seconds / 3600.0, sin_lat, cos_lat, longitude
+    )
+
+    expected = np.array(
+        [
+            ephemeris_position(d, s / 3600.0, sin_lat, cos_lat, longitude)
+            for d, s in zip(jd.tolist(), seconds.tolist())
+        ]
+    )
+    np.testing.assert_allclose(elevation, expected[:, 0], atol=1e-6)
+    np.testing.assert_allclose(azimuth, expected[:, 1], atol=1e-6)
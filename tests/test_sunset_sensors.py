@@ -2,23 +2,16 @@
 
 import pytest
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock
 
 from homeassistant.const import CONF_NAME
 
 
-def test_sunset_functionality():
+def test_sunset_functionality(sun_times):
     """Test basic sunset calculation functionality."""
-    # Test astral library functionality directly
-    from astral import LocationInfo
-    from astral.sun import sun
-
-    # Test with New York coordinates
-    location = LocationInfo("NYC", "New York", "America/New_York", 40.7128, -74.0060)
-
-    # Calculate sun times for a specific date
-    test_date = datetime(2024, 6, 15).date()
-    s = sun(location.observer, date=test_date)
+    # Sun times from astral directly, for each location and date in conftest
+    s = sun_times
 
     # Verify we get reasonable sunset times
     assert "sunset" in s
@@ -52,32 +45,16 @@ def test_manual_sensor_creation():
     mock_hass.config.longitude = -74.0060
     mock_hass.config.time_zone = "America/New_York"
 
-    # Test that we can create sensor objects
-    try:
-        # Import classes individually to avoid metaclass conflicts
-        import sys
-        import importlib
-
-        # Reload the sensor module to avoid cached imports
-        if "custom_components.battery_management.sensor" in sys.modules:
-            importlib.reload(sys.modules["custom_components.battery_management.sensor"])
-
-        from custom_components.battery_management.sensor import SunsetTimeSensor
+    from custom_components.battery_management.sensor import SunsetTimeSensor
 
-        # Create sensor
-        sensor = SunsetTimeSensor(mock_coordinator, mock_config_entry, mock_hass)
+    # Create sensor
+    sensor = SunsetTimeSensor(mock_coordinator, mock_config_entry, mock_hass)
 
-        # Test basic attributes
-        assert hasattr(sensor, "_attr_name")
-        assert hasattr(sensor, "_attr_unique_id")
-        assert hasattr(sensor, "_attr_icon")
-        assert sensor._attr_icon == "mdi:weather-sunset"
-
-    except Exception as e:
-        # If we can't import due to metaclass issues, that's a known limitation
-        # The functionality should still work in the actual Home Assistant environment
-        print(f"Import limitation in test environment: {e}")
-        assert True  # Pass the test as this is a test environment limitation
+    # Test basic attributes
+    assert hasattr(sensor, "_attr_name")
+    assert hasattr(sensor, "_attr_unique_id")
+    assert hasattr(sensor, "_attr_icon")
+    assert sensor._attr_icon == "mdi:weather-sunset"
 
 
 def test_time_calculations():
@@ -95,8 +72,8 @@ def test_time_calculations():
     assert seconds_until_sunset == 3 * 60 * 60
 
     # Test human readable format
-    hours = int(seconds_until_sunset // 3600)
-    minutes = int((seconds_until_sunset % 3600) // 60)
+    hours, rest = divmod(int(seconds_until_sunset), 3600)
+    minutes = rest // 60
 
     assert hours == 3
     assert minutes == 0
@@ -179,3 +156,16 @@ def test_nighttime_countdown_logic():
 
     assert daytime_result == 3 * 3600  # 3 hours until sunset
     assert nighttime_result == 0.0  # 0 during nighttime
+
+
+def test_sunset_tests_collected_once(request):
+    """Test that the sunset tests come from this module alone, each once."""
+    items = [
+        item
+        for item in request.session.items
+        if item.path.name == "test_sunset_sensors.py"
+    ]
+    node_ids = [item.nodeid for item in items]
+
+    assert len(node_ids) == len(set(node_ids))
+    assert {item.path for item in items} == {Path(__file__)}